@@ -1,46 +1,94 @@
 import streamlit as st
-import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
-from scipy.integrate import trapezoid
-
-
-#📘 Define DC Functions (Fundamental)
-def exponential_decline (qi, D, t):
-    return qi * np.exp(-D * t)
-
-def harmonic_decline (qi, D, t):
-    return qi / (1 + D * t)
-
-def hyperbolic_decline (qi, D, b, t):
-    return qi / np.power (1 + b * D * t, 1 /b)
-
-def calculate_EUR (model, qi, D, b = None, t_end = 120):
-    t = np.arange (0, t_end + 1)
-    if model == "Exponential":
-        q = exponential_decline (qi, D, t)
-    elif model == "Harmonic":
-        q = harmonic_decline (qi, D, t)
-    elif model == "Hyperbolic":
-        q = hyperbolic_decline (qi, D ,b, t)
-    EUR = trapezoid (q, t)
-    return t, q, EUR
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.dca.models import calculate_EUR
+from petroportfolio.dca.fit import VOLVE_PATH, load_volve_production, fit_wells
+from petroportfolio.dca.probabilistic import DISTRIBUTIONS, run_monte_carlo, eur_summary
+
+
+#📥 Fitted Parameters from Volve History
+@st.cache_data(show_spinner="Fitting Arps models to Volve wells...")
+def load_fit_table(path, t_end):
+    prod_df = load_volve_production(path)
+    return fit_wells(prod_df, t_end=t_end)
+
+
+#🎲 Monte Carlo Inputs & Cached Run
+def distribution_input(label, base, spread=0.2):
+    dist = st.sidebar.selectbox(f"{label} Distribution", DISTRIBUTIONS, index=2)
+    if dist == "Fixed":
+        return dist, (base,)
+    if dist == "Uniform":
+        low = st.sidebar.number_input(f"{label} Min", value=base * (1 - spread), format="%.4f")
+        high = st.sidebar.number_input(f"{label} Max", value=base * (1 + spread), format="%.4f")
+        return dist, (low, high)
+    if dist == "Triangular":
+        low = st.sidebar.number_input(f"{label} Min", value=base * (1 - spread), format="%.4f")
+        mode = st.sidebar.number_input(f"{label} Most Likely", value=base, format="%.4f")
+        high = st.sidebar.number_input(f"{label} Max", value=base * (1 + spread), format="%.4f")
+        return dist, (low, mode, high)
+    mean = st.sidebar.number_input(f"{label} Mean", value=base, format="%.4f")
+    std = st.sidebar.number_input(f"{label} Std Dev", min_value=0.0, value=base * spread / 2, format="%.4f")
+    return dist, (mean, std)
+
+
+@st.cache_data(show_spinner="Running Monte Carlo...")
+def cached_monte_carlo(qi_spec, D_spec, b_spec, n, t_end, q_limit, D_min, seed):
+    return run_monte_carlo(qi_spec, D_spec, b_spec, n, t_end, q_limit, D_min, seed)
 
 
 #🧪 Implement the App
 st.set_page_config(page_title="📉 Decline Curve Analysis", layout="centered")
+rec = instrument.start("Decline Curve Analysis")      # ?profile=1 (or =memory) shows the timing panel
 st.title(" Decline Curve Analysis (Arps)")
 
 st.sidebar.header("Input Parameters")
-qi = st.sidebar.number_input("Initial Rate, qi (stb/day)", min_value=0.0, value=1000.0)
-D = st.sidebar.number_input("Nominal Decline Rate, D (fraction)", min_value=0.0, max_value=1.0, value=0.15)
-b = st.sidebar.number_input("Hyperbolic Exponent, b", min_value=0.0, max_value=2.0, value=0.7)
+mode = st.sidebar.radio("Forecast Mode", ["Deterministic", "Probabilistic (Monte Carlo)"])
+source = st.sidebar.radio("Parameter Source", ["Manual Input", "Fit to Volve History"])
 t_end = st.sidebar.slider("Forecast Period (months)", min_value=12, max_value=360, value=120)
 model = st.sidebar.selectbox("Select Decline Model", ["Exponential", "Harmonic", "Hyperbolic"])
 
+qi_default, D_default, b_default = 1000.0, 0.15, 0.7
+if source == "Fit to Volve History":
+    with instrument.span("Volve load + fit (cached)"):
+        fit_table = load_fit_table(str(VOLVE_PATH), t_end)
+    well = st.sidebar.selectbox("Well", fit_table["Well"].unique())
+    fitted = fit_table[(fit_table["Well"] == well) & (fit_table["Model"] == model)].iloc[0]
+    if pd.notna(fitted["qi"]):
+        qi_default = float(fitted["qi"])
+        D_default = float(min(fitted["D"], 1.0))
+        b_default = float(fitted["b"]) if model == "Hyperbolic" else b_default
+    else:
+        st.sidebar.warning(f"{model} model could not be fitted for {well}: {fitted['Status']}.")
+
+qi = st.sidebar.number_input("Initial Rate, qi (stb/day)", min_value=0.0, value=qi_default)
+D = st.sidebar.number_input("Nominal Decline Rate, D (fraction)", min_value=0.0, max_value=1.0, value=D_default)
+b = st.sidebar.number_input("Hyperbolic Exponent, b", min_value=0.0, max_value=2.0, value=b_default)
+
+with st.sidebar.expander("Economic Limit & Terminal Decline"):
+    q_limit = st.number_input("Economic Limit Rate (stb/day, 0 = none)", min_value=0.0, value=0.0)
+    D_min = st.number_input("Terminal Decline, Dmin (fraction, 0 = none)", min_value=0.0, max_value=1.0, value=0.0)
+q_limit = q_limit if q_limit > 0 else None
+D_min = D_min if D_min > 0 else None
+
+if mode == "Probabilistic (Monte Carlo)":
+    st.sidebar.header("Uncertainty Distributions")
+    qi_spec = distribution_input("qi", qi)
+    D_spec = distribution_input("D", D)
+    b_model = {"Exponential": 0.0, "Harmonic": 1.0}.get(model)
+    b_spec = distribution_input("b", b) if b_model is None else ("Fixed", (b_model,))
+    n_samples = st.sidebar.select_slider("Number of Samples", options=[10_000, 100_000, 1_000_000], value=100_000)
+    seed = st.sidebar.number_input("Random Seed", value=42, step=1)
+
 
 #🔧 Calculation
-t, q, EUR = calculate_EUR(model, qi, D, b, t_end)
+with instrument.span("Arps rate + EUR"):
+    t, q, EUR = calculate_EUR(model, qi, D, b, t_end, q_limit=q_limit, D_min=D_min)
 
 
 #📊 Plot the Results
@@ -50,19 +98,62 @@ ax.set_xlabel ("Time (months)"), ax.set_ylabel ("Production Rate (stb/day)")
 ax.set_title ("Production Decline Curve")
 ax.grid(True)
 ax.legend()
-st.pyplot(fig)
+with instrument.span("Matplotlib render"):
+    st.pyplot(fig)
 
 
 #🔧 Display EUR
 st.markdown(f"### Estimated Ultimate Recovery (EUR): `{EUR:.2f} stb`")
 
 
+#🎲 Probabilistic EUR
+if mode == "Probabilistic (Monte Carlo)":
+    with instrument.span("Monte Carlo EUR (cached)"):
+        eur, t_mc, fan = cached_monte_carlo(qi_spec, D_spec, b_spec, n_samples, t_end, q_limit, D_min, int(seed))
+        summary = eur_summary(eur)
+
+    st.subheader(f"🎲 Probabilistic EUR ({n_samples:,} samples)")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("P90 EUR (stb)", f"{summary['P90']:,.0f}")
+    col2.metric("P50 EUR (stb)", f"{summary['P50']:,.0f}")
+    col3.metric("P10 EUR (stb)", f"{summary['P10']:,.0f}")
+    st.caption("P90 is the low case (90% probability of exceedance).")
+
+    fig_mc, (ax_fan, ax_hist) = plt.subplots(1, 2, figsize=(12, 4))
+    ax_fan.fill_between(t_mc, fan[0], fan[2], color="tab:blue", alpha=0.25, label="P90–P10")
+    ax_fan.plot(t_mc, fan[1], color="tab:blue", label="P50")
+    ax_fan.plot(t, q, color="black", linestyle="--", label="Deterministic")
+    ax_fan.set_xlabel("Time (months)")
+    ax_fan.set_ylabel("Production Rate (stb/day)")
+    ax_fan.set_title("Rate Fan Chart")
+    ax_fan.grid(True)
+    ax_fan.legend()
+    ax_hist.hist(eur, bins=100, color="tab:gray")
+    for name, color in [("P90", "red"), ("P50", "green"), ("P10", "blue")]:
+        ax_hist.axvline(summary[name], color=color, label=name)
+    ax_hist.set_xlabel("EUR (stb)")
+    ax_hist.set_ylabel("Count")
+    ax_hist.set_title("EUR Distribution")
+    ax_hist.legend()
+    with instrument.span("Matplotlib render (Monte Carlo)"):
+        st.pyplot(fig_mc)
+
+if source == "Fit to Volve History":
+    st.subheader("📋 Fitted Parameters (all wells)")
+    st.dataframe(fit_table)
+
+
 # Export Data in CSV
 df = pd.DataFrame({
     "Time (months)": t,
     "Rate (stb/day)": q
 })
-csv = df.to_csv(index=False).encode('utf-8')
+if mode == "Probabilistic (Monte Carlo)":
+    df["P90 Rate (stb/day)"], df["P50 Rate (stb/day)"], df["P10 Rate (stb/day)"] = fan
+with instrument.span("CSV export"):
+    csv = df.to_csv(index=False).encode('utf-8')
 st.download_button("📥 Download Forecast CSV", data = csv, file_name="DCS_Prediction.csv", mime='text/csv')
 
 st.caption("Happy Coding!❤️")
+
+instrument.streamlit_panel(rec)
@@ -1,17 +1,40 @@
 " Dual String Gas Lift Sensitivity Analysis"
 
 import streamlit as st 
+import numpy as np
 import pandas as pd
 import altair as alt
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.gaslift.performance import DEFAULT_P_RES, SWEEP_PARAMS, pvt_table, sweep, well_model
+
+
+# Default sweep range per sensitivity (min, max)
+SWEEP_RANGES = {
+    "Gas Injection Rate": (250.0, 5000.0),
+    "Productivity Index": (0.25, 2.5),
+    "Dome Pressure": (1000.0, 2600.0),
+    "Pressure Drop between Valves": (25.0, 300.0),
+}
+
+
+# Live sensitivity, cached on the hashed input data and settings
+@st.cache_data(show_spinner="Running sensitivity...")
+def run_sensitivity(pvt_df, well_df, model_inputs, param, lo, hi, n_points, base):
+    model = well_model(well_df, **model_inputs)
+    return sweep(param, np.linspace(lo, hi, n_points), model, pvt_table(pvt_df), base)
+
 # Set page config
 st.set_page_config(page_title="Dual String Gas Lift Sensitivity Analysis", page_icon = '💡', layout = "wide")
+rec = instrument.start("Dual String Gas Lift")      # ?profile=1 (or =memory) shows the timing panel
 
 # Title & Description
 st.title("Dual String Gas Lift Sensitivity Analysis")
 st.markdown("""
-This app compares **Python model results** with **OLGA** and **PROSPER** for various sensitivity analysis:
+This app runs a **live gas lift performance model** on the uploaded PVT and well test data and compares it with precomputed **Python**, **OLGA** and **PROSPER** results for various sensitivity analysis:
 - Gas Injection Rate
 - Productivity Index (PI)
 - Dome Pressure
@@ -29,15 +52,16 @@ st.sidebar.markdown("Or use example datasets below ⬇️")
 base_path = Path(__file__).parent
 
 # Example data
-if pvt_data is not None:
-    pvt_df = pd.read_csv(pvt_data)
-else:
-    pvt_df = pd.read_csv(base_path / "sample_pvt_data.csv")
-    
-if well_data is not None:
-    well_df = pd.read_csv(well_data)
-else:
-    well_df = pd.read_csv(base_path / "sample_well_data.csv")
+with instrument.span("Read input CSVs"):
+    if pvt_data is not None:
+        pvt_df = pd.read_csv(pvt_data)
+    else:
+        pvt_df = pd.read_csv(base_path / "sample_pvt_data.csv")
+
+    if well_data is not None:
+        well_df = pd.read_csv(well_data)
+    else:
+        well_df = pd.read_csv(base_path / "sample_well_data.csv")
     
 # Show example data  
 st.subheader("Example PVT Data")
@@ -46,9 +70,44 @@ st.dataframe(pvt_df.head())
 st.subheader("Example Well Test Data")
 st.dataframe(well_df.head())
 
+# Well model inputs
+st.sidebar.header("Well Model")
+p_res = st.sidebar.number_input("Reservoir Pressure (psia)", value=DEFAULT_P_RES, step=50.0)
+well_depth = st.sidebar.number_input("Well Depth (ft)", value=8000.0, step=100.0)
+tubing_id = st.sidebar.number_input("Tubing ID (in)", value=2.441, step=0.1, format="%.3f")
+model_inputs = {"p_res": p_res, "depth": well_depth, "tubing_id": tubing_id}
+
+try:
+    with instrument.span("Well model + PVT table"):
+        model = well_model(well_df, **model_inputs)
+        pvt_table(pvt_df)
+except (KeyError, ValueError) as e:
+    st.error(f"Cannot build the well model: {e.args[0]}")
+    st.stop()
+
+st.sidebar.header("Base Case")
+base = {
+    "gir": st.sidebar.number_input("Gas Injection Rate (Mscf/d)", value=2000.0, step=100.0),
+    "pi": st.sidebar.number_input("Productivity Index (STB/d/psi)", value=round(model.pi, 3), step=0.05, format="%.3f"),
+    "dome_p": st.sidebar.number_input("Dome Pressure (psia)", value=2000.0, step=50.0),
+    "delta_p": st.sidebar.number_input("Pressure Drop between Valves (psi)", value=100.0, step=10.0),
+}
+
 # Sensitivity Analysis Results
 st.header("Sensitivity Analysis Results")
-selected_param = st.selectbox("Select Parameter for Sensitivity", ["Gas Injection Rate", "Productivity Index", "Dome Pressure", "Pressure Drop between Valves" ])
+selected_param = st.selectbox("Select Parameter for Sensitivity", list(SWEEP_PARAMS))
+units = SWEEP_PARAMS[selected_param][1]
+
+col1, col2, col3 = st.columns(3)
+sweep_min = col1.number_input(f"Sweep Min ({units})", value=SWEEP_RANGES[selected_param][0])
+sweep_max = col2.number_input(f"Sweep Max ({units})", value=SWEEP_RANGES[selected_param][1])
+n_points = col3.slider("Sweep Points", 20, 500, 200, step=10)
+
+# Live Sensitivity
+with instrument.span("Live sensitivity sweep (cached)"):
+    live_df = run_sensitivity(pvt_df, well_df, model_inputs, selected_param, sweep_min, sweep_max, n_points, base)
+best = live_df.loc[live_df["Oil Rate"].idxmax()]
+st.metric("Max Oil Rate (live model)", f"{best['Oil Rate']:.0f} STB/d", f"at {best[selected_param]:.4g} {units}", delta_color="off")
 
 # Load Sensitivity Results
 csv_name = f"sensitivity_{selected_param.replace(' ', '_').lower()}.csv"
@@ -56,20 +115,36 @@ sensitivity_df = pd.read_csv(base_path / csv_name)
 
 # Plot   
 st.subheader(f"{selected_param} Sensitivity Plot")
-chart = alt.Chart(sensitivity_df).mark_line(point=True).encode(
-    x = alt.X(selected_param, title = selected_param),
+show_overlay = st.checkbox("Overlay precomputed Python / OLGA / PROSPER results", value=True)
+plot_df = live_df[[selected_param, "Oil Rate"]].assign(Method="Live Model")
+if show_overlay:
+    plot_df = pd.concat([plot_df, sensitivity_df], ignore_index=True)
+live_line = alt.Chart(plot_df).transform_filter(alt.datum.Method == "Live Model").mark_line(strokeWidth=3)
+overlay = alt.Chart(plot_df).transform_filter(alt.datum.Method != "Live Model").mark_line(point=True)
+chart = alt.layer(live_line, overlay).encode(
+    x = alt.X(selected_param, title = f"{selected_param} ({units})"),
     y = alt.Y("Oil Rate", title = "Oil Production Rate (STB/d)"),
     color = "Method:N"
 ).properties(width = 700, height = 400)
-st.altair_chart(chart, use_container_width=True)
+with instrument.span("Altair chart"):
+    st.altair_chart(chart, use_container_width=True)
+
+with st.expander("Live Model Results"):
+    st.dataframe(live_df)
 
 # Comparison Table
 st.header("Comparison Table: Python vs OLGA vs PROSPER")
 st.dataframe(sensitivity_df)
 
 # Download option
-st.download_button("Download Sensitivity Data as CSV", data = sensitivity_df.to_csv(index=False).encode('utf-8'), file_name = "sensitivity_analysis.csv")
+with instrument.span("CSV export"):
+    sensitivity_csv = sensitivity_df.to_csv(index=False).encode('utf-8')
+    live_csv = live_df.to_csv(index=False).encode('utf-8')
+st.download_button("Download Sensitivity Data as CSV", data = sensitivity_csv, file_name = "sensitivity_analysis.csv")
+st.download_button("Download Live Model Results as CSV", data = live_csv, file_name = "live_sensitivity.csv")
 
 # Footer
 st.markdown("---")
-st.markdown("**Project by Noraeen Eleanor 💖**")           
+st.markdown("**Project by Noraeen Eleanor 💖**")
+
+instrument.streamlit_panel(rec)           
@@ -2,15 +2,29 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from scipy.interpolate import interp1d
 import io
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.nodal.ipr_cache import fetkovich_fit, ipr_curve
+from petroportfolio.nodal.solver import solve_operating_point, vlp_model as gradient_vlp
+from petroportfolio.nodal.pvt_tables import build_tables
+from petroportfolio.nodal.vlp_traverse import Tubing, traverse_vlp
+
+# PVT tables are built once per PVT data set
+@st.cache_data
+def cached_tables(pvt_df):
+    return build_tables(pvt_df)
 
 # Streamlit config
 st.set_page_config(page_title="Nodal Analysis App", layout="wide")
+rec = instrument.start("Nodal Analysis App")      # ?profile=1 (or =memory) shows the timing panel
 st.title("🛢️ Nodal Analysis - IPR vs VLP Curves")
 
 st.markdown("""
-This app performs **IPR vs VLP analysis** using **Fetkovich IPR model** and a simple **VLP model**.
+This app performs **IPR vs VLP analysis** using **Fetkovich IPR model** and either a simple gradient **VLP model** or a **multiphase tubing traverse** driven by PVT tables.
 - You can adjust **Wellhead Pressure (WHP)** values.
 - Results are plotted in both Oilfield View (inverted y-axis) and Academic View.
 """)
@@ -19,7 +33,30 @@ This app performs **IPR vs VLP analysis** using **Fetkovich IPR model** and a si
 # User Inputs
 p_res = st.number_input("Reservoir Pressure (psia)", value=1400)
 depth = st.number_input("Depth (ft)", value=8000)
-gradient = st.number_input("Gradient (psi/ft)", value=0.12)
+
+vlp_choice = st.radio("VLP Model", ["Simple gradient", "Multiphase traverse (PVT tables)"], horizontal=True)
+if vlp_choice == "Simple gradient":
+    gradient = st.number_input("Gradient (psi/ft)", value=0.12)
+
+    # VLP Function
+    def vlp_model(q, whp, gradient=gradient, depth=depth):
+        return gradient_vlp(q, whp, gradient, depth)
+else:
+    gradient = np.nan       # the traverse computes its own pressure gradient
+    col1, col2, col3 = st.columns(3)
+    # 2000 scf/STB keeps the traverse below this well's IPR across the whole WHP slider
+    glr = col1.number_input("GLR (scf/STB)", value=2000.0, step=50.0)
+    wct = col2.number_input("Water Cut (fraction)", value=0.2, min_value=0.0, max_value=1.0, step=0.05)
+    tubing_id = col3.number_input("Tubing ID (in)", value=2.441, step=0.1, format="%.3f")
+    pvt_file = st.file_uploader("PVT Data (CSV, sample_pvt_data.csv format)", type="csv")
+    pvt_path = Path(__file__).resolve().parent.parent / "Gas_Lift_Optimization" / "sample_pvt_data.csv"
+    with instrument.span("PVT tables"):
+        pvt_df = pd.read_csv(pvt_file if pvt_file is not None else pvt_path)
+        traverse_model = traverse_vlp(cached_tables(pvt_df), glr, wct, Tubing(tubing_id=tubing_id))
+
+    # VLP Function
+    def vlp_model(q, whp, gradient=gradient, depth=depth):
+        return traverse_model(q, whp, gradient, depth)
 
 whp = st.slider("Select Wellhead Pressure (WHP, psig)", min_value=100, max_value=700, value=500, step=50)
 st.caption("ℹ️ WHP as low as 100 psig can represent low surface backpressure wells such as gas-lifted or strong PI systems.")
@@ -31,24 +68,14 @@ q_list = [100, 250, 400, 550, 700, 850]
 pwf_list = [1300, 1200, 1100, 1000, 850, 700]
 
 # --- IPR CALCULATION ---
-df = pd.DataFrame({
-    'q_stb': q_list,
-    'pwf_psig': pwf_list
-})
-df['delta^2'] = p_res**2 - df['pwf_psig']**2
-df['log_q'] = np.log10(df['q_stb'])
-df['log_delta2'] = np.log10(df['delta^2'])
+# (n, C) and the IPR curve are memoized on (test data, p_res): WHP / gradient / depth changes skip this
+with instrument.span("Fetkovich fit + IPR"):
+    n, c = fetkovich_fit(q_list, pwf_list, p_res)
+    pwf_range, q_ipr = ipr_curve(q_list, pwf_list, p_res)
 
-fit = np.polyfit(df['log_q'], df['log_delta2'], 1)
-n = 1 / fit[0]
-c = q_list[0] / (p_res**2 - pwf_list[0]**2)**n
-
-pwf_range = np.arange(100, p_res, 10)
-q_ipr = [c * (p_res**2 - pwf**2)**n for pwf in pwf_range]
-
-# VLP Function
-def vlp_model(q, whp):
-    return whp + gradient * depth + 0.002 * q**1.5
+# --- OPERATING POINT (exact IPR/VLP intersection for every WHP) ---
+with instrument.span("Operating point solve"):
+    op = solve_operating_point(c, n, p_res, np.array(whp_list), gradient, depth, vlp=vlp_model)
 
 # --- PLOTTING SECTION ---
 fig, axes = plt.subplots(1, 2, figsize=(14, 6), sharex=True)
@@ -58,20 +85,13 @@ for idx, ax in enumerate(axes):
     ax.plot(q_ipr, pwf_range, label='Fetkovich IPR', color='red', linewidth=2)
 
     for i, whp in enumerate(whp_list):
-        q_vlp = np.linspace(0, max(q_ipr) * 1.1, 100)
+        q_vlp = np.linspace(0, q_ipr.max() * 1.1, 100)
         p_vlp = vlp_model(q_vlp, whp)
 
-        # Check for intersection when WHP = 500
-        if whp == 500:
-            ipr_func = interp1d(q_ipr, pwf_range, fill_value='extrapolate')
-            vlp_func = interp1d(q_vlp, p_vlp, fill_value='extrapolate')
-            q_common = np.linspace(0, min(max(q_ipr), max(q_vlp)), 200)
-            delta_P = np.abs(ipr_func(q_common) - vlp_func(q_common))
-            idx_min = np.argmin(delta_P)
-            q_intersect = q_common[idx_min]
-            p_intersect = ipr_func(q_common)[idx_min]
-            ax.scatter(q_intersect, p_intersect, color='black', marker='X', s=100,
-                       label=f'Operating Point\nQ={q_intersect:.1f}, Pwf={p_intersect:.1f}')
+        q_op, p_op = op.q[i], op.pwf[i]
+        if not np.isnan(q_op):
+            ax.scatter(q_op, p_op, color='black', marker='X', s=100,
+                       label=f'Operating Point\nQ={q_op:.1f}, Pwf={p_op:.1f}')
 
         ax.plot(q_vlp, p_vlp, linestyle='--', label=f'VLP WHP={whp} psig', color=colors[i % len(colors)])
 
@@ -89,18 +109,25 @@ plt.suptitle('Nodal Analysis: IPR vs. Multi-VLP', fontsize=14)
 plt.tight_layout(rect=[0, 0, 1, 0.95])
 
 # Show Plot
-st.pyplot(fig)
+with instrument.span("Matplotlib render"):
+    st.pyplot(fig)
 
-# --- Optional Output ---
-if 500 in whp_list:
-    st.subheader("📌 Estimated Operating Point (for WHP = 500 psig)")
-    st.write(f"**Flowrate** = `{q_intersect:.1f}` STB/day")
-    st.write(f"**Bottomhole Pressure** = `{p_intersect:.1f}` psig")
+# --- Operating Point Output ---
+for whp_i, q_op, p_op, n_roots in zip(whp_list, op.q, op.pwf, op.n_roots):
+    st.subheader(f"📌 Estimated Operating Point (for WHP = {whp_i} psig)")
+    if n_roots == 0:
+        st.warning("No IPR/VLP intersection: the well cannot flow against this WHP (VLP is above the IPR at all rates).")
+        continue
+    if n_roots > 1:
+        st.info(f"{n_roots} intersections found; showing the stable (highest-rate) operating point.")
+    st.write(f"**Flowrate** = `{q_op:.1f}` STB/day")
+    st.write(f"**Bottomhole Pressure** = `{p_op:.1f}` psig")
 
 
 # Save as PDF
 pdf_buffer = io.BytesIO()
-fig.savefig(pdf_buffer, format='pdf')
+with instrument.span("PDF export"):
+    fig.savefig(pdf_buffer, format='pdf')
 st.download_button(
     label="📥 Download Plot as PDF",
     data=pdf_buffer,
@@ -113,8 +140,9 @@ ipr_df = pd.DataFrame({'Pwf (psig)': pwf_range, 'IPR Q (STB/d)': q_ipr})
 vlp_df = pd.DataFrame({'Q (STB/d)': q_vlp, 'VLP Pwf (psig)': vlp_model(q_vlp, whp)})
 
 csv_export = io.StringIO()
-combined_df = pd.concat([ipr_df, vlp_df], axis=1)
-combined_df.to_csv(csv_export, index=False)
+with instrument.span("CSV export"):
+    combined_df = pd.concat([ipr_df, vlp_df], axis=1)
+    combined_df.to_csv(csv_export, index=False)
 
 st.download_button(
     label="📥 Download IPR + VLP Data as CSV",
@@ -123,3 +151,5 @@ st.download_button(
     mime='text/csv'
 )
 
+instrument.streamlit_panel(rec)
+
@@ -1,11 +1,19 @@
 import streamlit as st 
 import pandas as pd
-import lasio
 import matplotlib.pyplot as plt
-import io
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.petro.depth_index import DepthLog
+from petroportfolio.petro.las_reader import read_las
+from petroportfolio.petro.log_decimation import decimate_frame, pixel_height
+from petroportfolio.petro.log_export import EXPORT_FORMATS, available_formats, export_name, lazy_export
 
 # Title
 st.set_page_config(page_title="LAS File Explorer", layout='wide')
+rec = instrument.start("LAS File Explorer")      # ?profile=1 (or =memory) shows the timing panel
 
 # Sidebar (for Uploading LAS File)
 st.sidebar.header("📂 Upload LAS File")
@@ -14,9 +22,13 @@ uploaded_file = st.sidebar.file_uploader("Choose a LAS file", type=["las"])
 # App Deployment
 st.title("🛢️ LAS File Data Explorer")
 if uploaded_file:
-    las = lasio.read(io.StringIO(uploaded_file.read().decode("utf-8", errors="ignore")))
-    df = las.df()
-    df.reset_index(inplace=True)
+    with instrument.span("LAS decode"):
+        las = read_las(uploaded_file.getvalue())
+    with instrument.span("las.df()"):
+        df = las.df()
+        df.reset_index(inplace=True)
+    with instrument.span("Depth index"):
+        logs = DepthLog(df, 'DEPT')
     
     # Well Info
     st.subheader("📋 Well Header Info")
@@ -35,37 +47,46 @@ if uploaded_file:
     
     # Depth Selection
     st.subheader("📏 Select Depth Interval")
-    min_depth = float(df['DEPT'].min())
-    max_depth = float(df['DEPT'].max())
+    min_depth = logs.min_depth
+    max_depth = logs.max_depth
     top = st.number_input("Top Depth", value=min_depth, min_value=min_depth, max_value=max_depth)
     base = st.number_input("Base Depth", value=max_depth, min_value=min_depth, max_value=max_depth)
     
-    interval_df = df[(df['DEPT'] >= top) & (df['DEPT'] <= base)]
+    with instrument.span("Interval select"):
+        interval_df = logs.interval(top, base)
     
     # Logs Plot
     st.subheader("🧪 Log Visualization")
     selected_curves = st.multiselect("Select curves to plot", options=curve_list, default=['GR'])
     
     if selected_curves:
-        for curve in selected_curves:
-            fig, ax = plt.subplots(figsize=(4, 8))
-            ax.plot(interval_df[curve], interval_df['DEPT'], label=curve)
-            ax.invert_yaxis()
-            ax.set_xlabel(curve), ax.set_ylabel("Depth (ft)")
+        # One figure, one track per curve, decimated to the track's pixel height (export stays full resolution)
+        fig, axes = plt.subplots(1, len(selected_curves), figsize=(4 * len(selected_curves), 8), sharey=True, squeeze=False)
+        with instrument.span("Decimate"):
+            plot_df = decimate_frame(interval_df, selected_curves, pixels=pixel_height(fig))
+        for ax, curve in zip(axes[0], selected_curves):
+            ax.plot(plot_df[curve], plot_df['DEPT'], label=curve)
+            ax.set_xlabel(curve)
             ax.grid(True)
+        axes[0][0].set_ylabel("Depth (ft)")
+        axes[0][0].invert_yaxis()
+        with instrument.span("Matplotlib render"):
             st.pyplot(fig)
     else:
         st.info("Please select one cuver to plot")
         
-    # Export Files
-    st.subheader("📤 Export Interval to CSV")
-    csv_data = interval_df.to_csv(index=False).encode('utf-8')
+    # Export Files (written in chunks, only when the button is clicked)
+    st.subheader("📤 Export Interval")
+    export_format = st.radio("Export format", available_formats(), horizontal=True)
     st.download_button(
-        label="Download Your CSV Files",
-        data=csv_data,
-        file_name="internal_logs.csv",
-        mime="text/csv"
+        label=f"Download Your {export_format} File",
+        data=lazy_export(interval_df, export_format),
+        file_name=export_name("internal_logs", export_format),
+        mime=EXPORT_FORMATS[export_format][0],
+        on_click="ignore"
     )
 else:
     st.warning("Please upload a LAS file from the sidebar")
+
+instrument.streamlit_panel(rec)
     
\ No newline at end of file
@@ -1,12 +1,20 @@
 import streamlit as st 
 import pandas as pd
-import lasio
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-import io
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.petro.depth_index import DepthLog
+from petroportfolio.petro.las_reader import read_las
+from petroportfolio.petro.log_decimation import decimate_frame, pixel_height
+from petroportfolio.petro.log_export import EXPORT_FORMATS, available_formats, export_name, lazy_export
 
 # Configuration
 st.set_page_config(page_title="LAS Viewer", layout='wide')
+rec = instrument.start("LAS Viewer")      # ?profile=1 (or =memory) shows the timing panel
 
 # Sidebar (for Uploading LAS File)
 st.sidebar.header("📂 Upload LAS File")
@@ -15,12 +23,16 @@ uploaded_file = st.sidebar.file_uploader("Choose a LAS file", type=["las"])
 # App Deployment
 st.title("🛢️ LAS File Multi-Track Log Viewer")
 if uploaded_file:
-    las = lasio.read(io.StringIO(uploaded_file.read().decode("utf-8", errors="ignore")))
-    df = las.df().reset_index()
+    with instrument.span("LAS decode"):
+        las = read_las(uploaded_file.getvalue())
+    with instrument.span("las.df()"):
+        df = las.df().reset_index()
     
     # Handle 'DEPTH' or 'DEPT'
     depth_col = 'DEPTH' if 'DEPTH' in df.columns else 'DEPT'
     df.rename(columns={depth_col: 'DEPTH'}, inplace=True)
+    with instrument.span("Depth index"):
+        logs = DepthLog(df, 'DEPTH')
     
     # Well Info
     st.subheader("📋 Well Header Info")
@@ -34,8 +46,8 @@ if uploaded_file:
     
     # Depth Selection
     st.subheader("📏 Select Depth Interval")
-    min_depth = float(df['DEPTH'].min())
-    max_depth = float(df['DEPTH'].max())
+    min_depth = logs.min_depth
+    max_depth = logs.max_depth
     top = st.number_input("Top Depth", value=min_depth, min_value=min_depth, max_value=max_depth)
     base = st.number_input("Base Depth", value=max_depth, min_value=min_depth, max_value=max_depth)
     
@@ -61,16 +73,18 @@ if uploaded_file:
         resistivity_curve = st.selectbox("Resistivity", options=available_curves, index=available_curves.index("RT") if "RT" in available_curves else 0) 
     
     # 🔃 Refresh interval_df after curve selection
-    interval_df = df[(df["DEPTH"] >= top) & (df["DEPTH"] <= base)].copy()
+    with instrument.span("Interval select"):
+        interval_df = logs.interval(top, base)
 
     # 🧠 Normalize NPHI if needed
     if interval_df[nphi_curve].max() > 1.0:
         st.warning(f"NPHI max value > 1.0 detected (max = {interval_df[nphi_curve].max():.2f}). Converting from % to fraction.")
-        interval_df[nphi_curve] = interval_df[nphi_curve] / 100
+        interval_df = interval_df.assign(**{nphi_curve: interval_df[nphi_curve] / 100})     # new frame, the cached log is untouched
 
     # 🔍 Clean missing values for selected curves
-    interval_df.replace([-999.25, -9999, -999.0], pd.NA, inplace=True)
-    interval_df = interval_df.dropna(subset=[rhob_curve, nphi_curve])
+    with instrument.span("Null cleanup"):
+        interval_df = interval_df.replace([-999.25, -9999, -999.0], pd.NA)
+        interval_df = interval_df.dropna(subset=[rhob_curve, nphi_curve])
     
     # Track Width Adjustment
     st.subheader("📐 Customize Track Widths")
@@ -86,10 +100,16 @@ if uploaded_file:
     st.subheader("🧪 Log Visualization")
     fig = plt.figure(figsize=(width1 + width2 + width3 + 2, 10 ))
     gs = gridspec.GridSpec(1, 4, width_ratios=[width1, width2, width3, width2])
+
+    # Decimate to the track's pixel height, keeping the RHOB > NPHI shading edges (export stays full resolution)
+    plot_curves = [gr_curve, resistivity_curve, rhob_curve, nphi_curve] + (["CALI"] if "CALI" in interval_df.columns else [])
+    with instrument.span("Decimate"):
+        crossover = (interval_df[rhob_curve] >= interval_df[nphi_curve]).to_numpy(dtype=bool)
+        plot_df = decimate_frame(interval_df, plot_curves, [crossover], pixel_height(fig))
     
     # Track 1: GR
     ax0 = plt.subplot(gs[0])
-    ax0.plot(interval_df[gr_curve], interval_df["DEPTH"], color="green")
+    ax0.plot(plot_df[gr_curve], plot_df["DEPTH"], color="green")
     ax0.set_xlabel(gr_curve)
     ax0.set_xlim(0, 150)
     ax0.invert_yaxis()
@@ -99,7 +119,7 @@ if uploaded_file:
 
     # Track 2: Resistivity
     ax1 = plt.subplot(gs[1])
-    ax1.semilogx(interval_df[resistivity_curve], interval_df["DEPTH"], color="black")
+    ax1.semilogx(plot_df[resistivity_curve], plot_df["DEPTH"], color="black")
     ax1.set_xlabel(resistivity_curve)
     ax1.set_xlim(0.2, 2000)
     ax1.invert_yaxis()
@@ -108,10 +128,10 @@ if uploaded_file:
 
     # Track 3: RHOB / NPHI
     ax2 = plt.subplot(gs[2])
-    ax2.plot(interval_df[rhob_curve], interval_df["DEPTH"], color="red", label="RHOB")
-    ax2.plot(interval_df[nphi_curve], interval_df["DEPTH"], color="blue", label="NPHI")
-    ax2.fill_betweenx(interval_df["DEPTH"], interval_df[rhob_curve], interval_df[nphi_curve],
-                  where=(interval_df[rhob_curve] >= interval_df[nphi_curve]),
+    ax2.plot(plot_df[rhob_curve], plot_df["DEPTH"], color="red", label="RHOB")
+    ax2.plot(plot_df[nphi_curve], plot_df["DEPTH"], color="blue", label="NPHI")
+    ax2.fill_betweenx(plot_df["DEPTH"], plot_df[rhob_curve], plot_df[nphi_curve],
+                  where=(plot_df[rhob_curve] >= plot_df[nphi_curve]),
                   facecolor="violet", alpha=0.3, label="RHOB > NPHI")
     ax2.set_xlabel("RHOB / NPHI")
     ax2.set_xlim(1.95, 2.95)
@@ -123,7 +143,7 @@ if uploaded_file:
     # Track 4: CALI (if exists)
     if "CALI" in interval_df.columns:
         ax3 = plt.subplot(gs[3])
-        ax3.plot(interval_df["CALI"], interval_df["DEPTH"], color="brown")
+        ax3.plot(plot_df["CALI"], plot_df["DEPTH"], color="brown")
         ax3.set_xlabel("CALI")
         ax3.set_xlim(6, 18)
         ax3.invert_yaxis()
@@ -131,17 +151,21 @@ if uploaded_file:
         ax3.set_title("CALI")
 
     # Show Plot
-    st.pyplot(fig)
+    with instrument.span("Matplotlib render"):
+        st.pyplot(fig)
         
-    # Export Files
-    st.subheader("📤 Export Interval to CSV")
-    csv_data = interval_df.to_csv(index=False).encode('utf-8')
+    # Export Files (written in chunks, only when the button is clicked)
+    st.subheader("📤 Export Interval")
+    export_format = st.radio("Export format", available_formats(), horizontal=True)
     st.download_button(
-        label="Download Your CSV Files",
-        data=csv_data,
-        file_name="las.interval.csv",
-        mime="text/csv"
+        label=f"Download Your {export_format} File",
+        data=lazy_export(interval_df, export_format),
+        file_name=export_name("las.interval", export_format),
+        mime=EXPORT_FORMATS[export_format][0],
+        on_click="ignore"
     )
 else:
     st.warning("Please upload a LAS file from the sidebar")
+
+instrument.streamlit_panel(rec)
     
\ No newline at end of file
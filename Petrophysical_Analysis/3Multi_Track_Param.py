@@ -1,13 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import lasio
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-import io
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.petro.depth_index import DepthLog
+from petroportfolio.petro.las_reader import read_las
+from petroportfolio.petro.log_decimation import decimate_frame, pixel_height
+from petroportfolio.petro.log_export import EXPORT_FORMATS, available_formats, export_name, lazy_export
+from petroportfolio.petro.engine import PetroParams, evaluate, pay_summary
 
 # Streamlit Page Config
 st.set_page_config(page_title="Petrophysical Log Analyzer", layout="wide")
+rec = instrument.start("Petrophysical Log Analyzer")      # ?profile=1 (or =memory) shows the timing panel
 st.title("🛢️ Petrophysical Log Analyzer")
 
 # --- Sidebar: File Upload & Curve Selection ---
@@ -15,14 +24,15 @@ st.sidebar.header("📂 Upload LAS File")
 uploaded_file = st.sidebar.file_uploader("Choose LAS file", type=[".las"])
 
 if uploaded_file:
-    # ✅ Proper read and decode
-    file_str = uploaded_file.read().decode('utf-8', errors='ignore')
-    las = lasio.read(io.StringIO(file_str))
+    # ✅ Fast LAS parse (binary sidecar reused on reruns)
+    with instrument.span("LAS decode"):
+        las = read_las(uploaded_file.getvalue())
 
     # --- DataFrame preparation ---
-    df = las.df().reset_index()
-    df.columns = df.columns.str.upper()
-    df.replace([-999.25, -9999, -999.0], np.nan, inplace=True)
+    with instrument.span("las.df()"):
+        df = las.df().reset_index()
+        df.columns = df.columns.str.upper()
+        df.replace([-999.25, -9999, -999.0], np.nan, inplace=True)
     curves = df.columns.tolist()
 
     # --- Sidebar: Select curves ---
@@ -36,33 +46,45 @@ if uploaded_file:
     # --- Sidebar: Select interval ---
     st.sidebar.header("📏 Depth Interval")
     depth_col = df.columns[0]  # usually 'DEPT'
-    depth_min, depth_max = df[depth_col].min(), df[depth_col].max()
+    with instrument.span("Depth index"):
+        logs = DepthLog(df, depth_col)
+    depth_min, depth_max = logs.min_depth, logs.max_depth
     top = st.sidebar.number_input("Top Depth", float(depth_min), float(depth_max), float(depth_min))
     base = st.sidebar.number_input("Base Depth", float(depth_min), float(depth_max), float(depth_max))
 
-    # --- Filter Interval ---
-    interval_df = df[(df[depth_col] >= top) & (df[depth_col] <= base)].copy()
+    # --- Filter Interval (binary search on sorted depth, no full-log mask) ---
+    with instrument.span("Interval select"):
+        interval_df = logs.interval(top, base)
 
     # Normalize NPHI if needed
     if interval_df[nphi_curve].max() > 1.0:
         st.warning(f"NPHI max value > 1.0 detected (max = {interval_df[nphi_curve].max():.2f}). Converting from % to fraction.")
-        interval_df[nphi_curve] /= 100
-
-    # --- Calculate Vshale, φ, Sw ---
-    gr_clean = interval_df[gr_curve].clip(20, 150)
-    gr_min, gr_max = gr_clean.min(), gr_clean.max()
-    interval_df['VSH'] = (interval_df[gr_curve] - gr_min) / (gr_max - gr_min)
-    interval_df['PHID'] = (2.65 - interval_df[rhob_curve]) / (2.65 - 1.0)
-    interval_df['PHIN'] = interval_df[nphi_curve]
-    interval_df['PHIE'] = (interval_df['PHID'] + interval_df['PHIN']) / 2
-    interval_df['RT'] = interval_df[res_curve]
-    a, m, n = 1, 2, 2
-    rw = 0.05
-    interval_df['SW'] = ((a * rw) / (interval_df['RT'] * interval_df['PHIE'] ** m)) ** (1/n)
-    interval_df['SW'] = interval_df['SW'].clip(0, 1)
-
-    # --- Cutoffs ---
-    interval_df['PAY'] = (interval_df['PHIE'] >= 0.1) & (interval_df['SW'] <= 0.6) & (interval_df['VSH'] <= 0.35)
+        interval_df = interval_df.assign(**{nphi_curve: interval_df[nphi_curve] / 100})     # new frame, the cached log is untouched
+
+    # --- Sidebar: Archie constants & cutoffs (defaults from the LAS ~Parameter section if present) ---
+    def las_param(mnemonic, default):
+        item = las.params.get(mnemonic)
+        return item.value if item is not None and isinstance(item.value, float) else default
+
+    st.sidebar.header("⚙️ Parameters")
+    with st.sidebar.expander("Archie & Cutoffs"):
+        a = st.number_input("a (tortuosity)", value=las_param("A", 1.0))
+        m = st.number_input("m (cementation)", value=las_param("M", 2.0))
+        n = st.number_input("n (saturation)", value=las_param("N", 2.0))
+        rw = st.number_input("Rw (ohm.m)", value=las_param("RW", 0.05), format="%.3f")
+        rho_ma = st.number_input("Matrix density (g/cc)", value=2.65)
+        phie_cut = st.number_input("PHIE cutoff ≥", value=0.10)
+        sw_cut = st.number_input("SW cutoff ≤", value=0.60)
+        vsh_cut = st.number_input("VSH cutoff ≤", value=0.35)
+    params = PetroParams(a=a, m=m, n=n, rw=rw, rho_ma=rho_ma, phie_cut=phie_cut, sw_cut=sw_cut, vsh_cut=vsh_cut)
+
+    # --- Calculate Vshale, φ, Sw & pay cutoffs (petro_engine, preallocated float32) ---
+    with instrument.span("Vsh / φ / Sw / pay"):
+        result = evaluate(interval_df[gr_curve], interval_df[rhob_curve], interval_df[nphi_curve],
+                          interval_df[res_curve], params)
+        interval_df = interval_df.assign(VSH=result['VSH'], PHID=result['PHID'], PHIN=result['PHIN'],
+                                         PHIE=result['PHIE'], RT=interval_df[res_curve], SW=result['SW'],
+                                         PAY=result['PAY'])
 
     # --- TAB LAYOUT ---
     tab1, tab2, tab3 = st.tabs(["📊 Log Plot", "📋 Summary", "⬇️ Export"])
@@ -73,6 +95,16 @@ if uploaded_file:
         gs = gridspec.GridSpec(1, 6, width_ratios=[1, 1, 1, 1, 1, 1])
 
         depth = interval_df[depth_col]
+        # Decimate to the track's pixel height; shading masks keep their edges (export stays full resolution)
+        shading_masks = [
+            interval_df[gr_curve] < 75,
+            (interval_df[res_curve] > 20) & (interval_df[gr_curve] < 75),
+            interval_df['PAY'],
+        ]
+        with instrument.span("Decimate"):
+            plot_df = decimate_frame(interval_df, [gr_curve, res_curve, rhob_curve, nphi_curve, 'VSH', 'SW', 'PHID', 'PHIN'],
+                                     shading_masks, pixel_height(fig))
+        plot_depth = plot_df[depth_col]
         tracks = [
             (gr_curve, 'GR', 'lime'),
             (res_curve, 'Resistivity', 'blue'),
@@ -84,7 +116,7 @@ if uploaded_file:
 
         for i, (curve, title, color) in enumerate(tracks):
             ax = fig.add_subplot(gs[0, i])
-            ax.plot(interval_df[curve], depth, color=color, label=curve)
+            ax.plot(plot_df[curve], plot_depth, color=color, label=curve)
             ax.set_ylim(depth.max(), depth.min())
             ax.set_title(title)
             ax.grid(True)
@@ -92,47 +124,40 @@ if uploaded_file:
 
             # Lithology shading (sand vs shale)
             if title == 'GR':
-                ax.fill_betweenx(depth, interval_df[curve], 150, where=interval_df[curve]<75, color='khaki', alpha=0.4, label='Sand')
-                ax.fill_betweenx(depth, interval_df[curve], 150, where=interval_df[curve]>=75, color='saddlebrown', alpha=0.3, label='Shale')
+                ax.fill_betweenx(plot_depth, plot_df[curve], 150, where=plot_df[curve]<75, color='khaki', alpha=0.4, label='Sand')
+                ax.fill_betweenx(plot_depth, plot_df[curve], 150, where=plot_df[curve]>=75, color='saddlebrown', alpha=0.3, label='Shale')
             # Hydrocarbon Indication
             if title == 'Resistivity':
-                ax.fill_betweenx(depth, 0, interval_df[curve], where=(interval_df[curve]>20) & (interval_df[gr_curve]<75), color='green', alpha=0.3, label='HC Indication')
+                ax.fill_betweenx(plot_depth, 0, plot_df[curve], where=(plot_df[curve]>20) & (plot_df[gr_curve]<75), color='green', alpha=0.3, label='HC Indication')
             # PHID overlay
             if title == 'RHOB':
-                ax.plot(interval_df['PHID'], depth, linestyle='--', color='orange', label='PHID')
+                ax.plot(plot_df['PHID'], plot_depth, linestyle='--', color='orange', label='PHID')
             # PHIN overlay
             if title == 'NPHI':
-                ax.plot(interval_df['PHIN'], depth, linestyle='--', color='deeppink', label='PHIN')
+                ax.plot(plot_df['PHIN'], plot_depth, linestyle='--', color='deeppink', label='PHIN')
             # Net Pay highlight
-            ax.fill_betweenx(depth, 0, 1, where=interval_df['PAY'], transform=ax.get_xaxis_transform(), color='gold', alpha=0.3, label='Net Pay')
+            ax.fill_betweenx(plot_depth, 0, 1, where=plot_df['PAY'], transform=ax.get_xaxis_transform(), color='gold', alpha=0.3, label='Net Pay')
 
             ax.legend(fontsize=7)
 
-        st.pyplot(fig)
+        with instrument.span("Matplotlib render"):
+            st.pyplot(fig)
 
     with tab2:
         st.subheader("🧾 Pay Zone Summary Table")
-        interval_thickness = depth.diff().mean()
-        net_thick = interval_df[interval_df['PAY']][depth_col].count() * interval_thickness
-        gross_thick = interval_df[depth_col].count() * interval_thickness
-        net_gross = net_thick / gross_thick if gross_thick > 0 else 0
-
-        summary_data = {
-            "Top (m)": [top],
-            "Base (m)": [base],
-            "Gross Thickness (m)": [gross_thick],
-            "Net Thickness (m)": [net_thick],
-            "Net/Gross": [net_gross],
-            "Avg φ": [interval_df["PHIE"].mean()],
-            "Avg Sw": [interval_df["SW"].mean()],
-            "Avg Vsh": [interval_df["VSH"].mean()]
-        }
-        st.table(pd.DataFrame(summary_data))
+        with instrument.span("Pay summary"):
+            summary_data = pay_summary(interval_df[depth_col], result, top, base)
+        st.table(pd.DataFrame([summary_data]))
 
     with tab3:
-        st.subheader("📤 Export CSV Results")
-        csv = interval_df.to_csv(index=False)
-        st.download_button("📥 Download Interval CSV", csv, "interval_output.csv", "text/csv")
+        st.subheader("📤 Export Results")
+        # written in chunks, only when the button is clicked
+        export_format = st.radio("Export format", available_formats(), horizontal=True)
+        st.download_button(f"📥 Download Interval {export_format}", lazy_export(interval_df, export_format),
+                           export_name("interval_output", export_format), EXPORT_FORMATS[export_format][0],
+                           on_click="ignore")
 
 else:
     st.info("👈 Upload a LAS file to begin.")
+
+instrument.streamlit_panel(rec)
@@ -1,16 +1,24 @@
 import streamlit as st 
 import pandas as pd
 import datetime
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.ofm.welltest_join import JOIN_MODES, filter_tests, join_tests, test_choices
 
 # Title
 st.set_page_config(page_title="OFM Data Export for Power BI", layout="centered")
+rec = instrument.start("OFM Data Export")      # ?profile=1 (or =memory) shows the timing panel
 st.title("📊 OFM Data Export App for Power BI")
 st.caption("Simulate data pipeline from Streamlit to Powr BI using DUMMY production and well test data")
 
 # Input Data
 try:
-    prod_df = pd.read_csv("dummy_production.csv")
-    test_df = pd.read_csv("dummy_welltest.csv")
+    with instrument.span("Read CSVs"):
+        prod_df = pd.read_csv("dummy_production.csv")
+        test_df = pd.read_csv("dummy_welltest.csv")
 except FileNotFoundError:
     st.error("❌ Dummy CSV files not found. Please upload or ensure they are in the same directory ")
     st.stop()
@@ -22,16 +30,22 @@ with st.expander("🔍 Preview Production Data"):
 with st.expander("🔍 Preview Well Test Data"):
     st.dataframe(test_df)
     
-# Data Merging
-merged_df = pd.merge(prod_df, test_df, how="left", on="WELL")
+# Data Merging: each production day gets the latest test on or before it
+join_mode = st.radio("🔗 Join well tests:", JOIN_MODES, horizontal=True)
+max_age = st.number_input("⏱ Max test age (days, 0 = no limit):", min_value=0, value=0, step=30,
+                          disabled=join_mode != JOIN_MODES[0])
+with instrument.span("Well-test merge"):
+    merged_df = join_tests(prod_df, test_df, join_mode, max_age_days=max_age or None)
 
 # Data Filtering
 st.subheader("🎛 Screening Data Before Exporting")
 
 selected_well = st.multiselect("🛢 Select WELL(s):", options=merged_df['WELL'].unique(), default=merged_df['WELL'].unique())
-selected_test = st.multiselect("🧪 Select TEST TYPE(s):", options=merged_df['TEST_TYPE'].dropna().unique(), default=merged_df['TEST_TYPE'].dropna().unique())
+test_types = test_choices(merged_df, 'TEST_TYPE')
+selected_test = st.multiselect("🧪 Select TEST TYPE(s):", options=test_types, default=test_types)
 
-filtered_df = merged_df[(merged_df['WELL'].isin(selected_well)) & (merged_df['TEST_TYPE'].isin(selected_test))]
+with instrument.span("Filter"):
+    filtered_df = filter_tests(merged_df[merged_df['WELL'].isin(selected_well)], 'TEST_TYPE', selected_test)
 
 st.markdown(f"✅ Showing **{len(filtered_df)}** rows after filtering")
 st.dataframe(filtered_df)
@@ -40,7 +54,8 @@ st.dataframe(filtered_df)
 st.subheader("📤 Export CSV for Power BI")
 
 filename = f"powerbi_export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-csv_data = filtered_df.to_csv(index=False).encode("utf-8")
+with instrument.span("CSV export"):
+    csv_data = filtered_df.to_csv(index=False).encode("utf-8")
 
 st.download_button(
     label="⬇️ Download Your CSV File",
@@ -50,4 +65,6 @@ st.download_button(
 )
 
 # Footer
-st.caption("💼 Dummy OFM Dashboard Export Prototype | Prepared by Wan Norain")
\ No newline at end of file
+st.caption("💼 Dummy OFM Dashboard Export Prototype | Prepared by Wan Norain")
+
+instrument.streamlit_panel(rec)
\ No newline at end of file
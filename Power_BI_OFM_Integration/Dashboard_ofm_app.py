@@ -1,58 +1,76 @@
 import streamlit as st 
-import pandas as pd
 import datetime
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))     # petroportfolio/
+from petroportfolio import instrument
+from petroportfolio.ofm.store import PRODUCTION, STORE_DIR_NAME, WELLTEST, date_range, ingest, read_store, store_wells
+from petroportfolio.ofm.rollup import EXPORT_LEVELS, read_rollup, update_rollups
+from petroportfolio.ofm.welltest_join import JOIN_MODES, filter_tests, join_tests, test_choices
+
 # Title
 st.set_page_config(page_title="OFM Data Export for Power BI", layout="centered")
+rec = instrument.start("OFM Data Export")      # ?profile=1 (or =memory) shows the timing panel
 st.title("📊 OFM Data Export App for Power BI")
 st.caption("Integrate Cleaned OFM Data for Power BI Dashboarding")
 
 # Get current folder path where script is located
 base_path = Path(__file__).parent
 
-# Input Data
+# Input Data: append new dates to the partitioned store (unchanged exports are skipped)
+store_root = base_path / STORE_DIR_NAME
 try:
-    prod_df = pd.read_csv(base_path / "dummy_ofm_production.csv")
-    test_df = pd.read_csv(base_path / "dummy_ofm_welltest.csv")
+    with instrument.span("Store ingest"):
+        ingest(base_path / "dummy_ofm_production.csv", store_root, PRODUCTION)
+        ingest(base_path / "dummy_ofm_welltest.csv", store_root, WELLTEST)
+    with instrument.span("Rollup update"):
+        update_rollups(store_root)      # only rows newer than the last rollup are aggregated
 except FileNotFoundError:
     st.error("❌ Dummy CSV files not found. Please upload or ensure they are in the same directory ")
     st.stop()
-    
-# Data Cleaning
-prod_clean = prod_df.rename(columns={
-    "Well Name": "WELL",
-    "Date": "DATE",
-    "Oil Rate (bbl/d)": "OIL_BOPD",
-    "Gas Rate (Mscf/d)": "GAS_MSCFD",
-    "Water Rate (bbl/d)": "WATER_BWPD",
-    "WHP (psi)": "WHP_PSIG",
-    "Status": "STATUS"
-})[["WELL", "DATE", "OIL_BOPD", "GAS_MSCFD", "WATER_BWPD", "WHP_PSIG", "STATUS"]]
-
-test_clean = test_df.rename(columns={
-    "Well Name": "WELL",
-    "Test Date": "TEST_DATE",
-    "Q_liq (bbl/d)": "Q_LIQ",
-    "Water Cut (%)": "WCUT",
-    "GOR (scf/bbl)": "GOR",
-    "THP (psi)": "THP_PSIG",
-    "Lift Method": "LIFT_METHOD"
-})[["WELL", "TEST_DATE", "Q_LIQ", "WCUT", "GOR", "THP_PSIG", "LIFT_METHOD"]]
-    
-# Data Merging
-merged_df = pd.merge(prod_clean, test_clean, how="left", on="WELL")
 
 # Data Filtering
 st.subheader("🎛 Screening Data Before Exporting")
 
-wells = merged_df['WELL'].unique().tolist()
-methods = merged_df["LIFT_METHOD"].dropna().unique().tolist()
-
+wells = store_wells(store_root, PRODUCTION)
 selected_wells = st.multiselect("🛢 Select WELL(s):", options=wells, default=wells)
-selected_lift = st.multiselect("⚙️ Select LIFT METHOD(s):", options=methods, default=methods)
 
-filtered_df = merged_df[(merged_df["WELL"].isin(selected_wells)) & (merged_df["LIFT_METHOD"].isin(selected_lift))]
+first_date, last_date = date_range(store_root, PRODUCTION)
+if first_date is None:
+    st.warning("No production data in the store yet.")
+    st.stop()
+dates = st.date_input("📅 Select DATE range:", value=(first_date.date(), last_date.date()),
+                      min_value=first_date.date(), max_value=last_date.date())
+start_date, end_date = dates if len(dates) == 2 else (dates[0], last_date.date())
+
+# Aggregated levels are served from the precomputed rollups, row level from the store
+ROW_LEVEL = "Row level (production + well test)"
+level = st.selectbox("📐 Select aggregation level:", list(EXPORT_LEVELS) + [ROW_LEVEL])
+
+if level == ROW_LEVEL:
+    # Only the partitions of the selected wells and months are read
+    with instrument.span("Store read"):
+        prod_clean = read_store(store_root, PRODUCTION, selected_wells, start_date, end_date)
+        test_clean = read_store(store_root, WELLTEST, selected_wells)
+
+    # Data Merging: each production day gets the latest test on or before it
+    join_mode = st.radio("🔗 Join well tests:", JOIN_MODES, horizontal=True)
+    max_age = st.number_input("⏱ Max test age (days, 0 = no limit):", min_value=0, value=0, step=30,
+                              disabled=join_mode != JOIN_MODES[0])
+    with instrument.span("Well-test merge"):
+        merged_df = join_tests(prod_clean, test_clean, join_mode, max_age_days=max_age or None)
+
+    methods = test_choices(merged_df, "LIFT_METHOD")
+    selected_lift = st.multiselect("⚙️ Select LIFT METHOD(s):", options=methods, default=methods)
+
+    filtered_df = filter_tests(merged_df, "LIFT_METHOD", selected_lift)
+else:
+    grain = EXPORT_LEVELS[level]
+    with instrument.span("Rollup read"):
+        filtered_df = read_rollup(store_root, grain, selected_wells, start_date, end_date)
+    if grain.startswith("field"):
+        st.caption("ℹ️ Field rollups total all wells, so the WELL selection does not apply.")
 
 st.markdown(f"✅ Showing **{len(filtered_df)}** rows after filtering")
 st.dataframe(filtered_df)
@@ -61,7 +79,8 @@ st.dataframe(filtered_df)
 st.subheader("📤 Export CSV for Power BI")
 
 filename = f"powerbi_export_{datetime.datetime.now().strftime('%d-%b-%Y_%H-%M')}.csv"
-csv_data = filtered_df.to_csv(index=False).encode("utf-8")
+with instrument.span("CSV export"):
+    csv_data = filtered_df.to_csv(index=False).encode("utf-8")
 
 st.download_button(
     label="⬇️ Download Your CSV File",
@@ -72,3 +91,5 @@ st.download_button(
 
 # Footer
 st.caption("💼 Dummy OFM Dashboard Export Prototype | Prepared by Wan Norain")
+
+instrument.streamlit_panel(rec)
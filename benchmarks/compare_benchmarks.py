@@ -0,0 +1,54 @@
+"""
+Compare two run_benchmarks.py JSON files (e.g. the parent commit vs this one).
+
+Cases are matched on (case, size). A result is a regression when the new
+minimum time, or the new peak memory, exceeds the old one by more than the
+threshold; the exit status is 1 if any case regressed, so this can gate a
+script.
+
+    python compare_benchmarks.py results/old.json results/new.json --threshold 0.10
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        report = json.load(f)
+    return report, {(r["case"], r["size"]): r for r in report["results"] if "error" not in r}
+
+
+def compare(old, new, threshold=0.10):
+    """Rows of (case, size, old_s, new_s, time_ratio, old_bytes, new_bytes, mem_ratio, regressed)."""
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        o, n = old[key], new[key]
+        time_ratio = n["min_s"] / o["min_s"] if o["min_s"] > 0 else float("inf")
+        mem_ratio = n["peak_bytes"] / o["peak_bytes"] if o["peak_bytes"] > 0 else 1.0
+        regressed = time_ratio > 1 + threshold or mem_ratio > 1 + threshold
+        rows.append((*key, o["min_s"], n["min_s"], time_ratio, o["peak_bytes"], n["peak_bytes"], mem_ratio, regressed))
+    return rows
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diff two benchmark JSON files.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown / memory growth")
+    args = parser.parse_args()
+
+    old_report, old = load(args.old)
+    new_report, new = load(args.new)
+    print(f"old: {(old_report.get('commit') or '?')[:12]}  new: {(new_report.get('commit') or '?')[:12]}")
+    rows = compare(old, new, args.threshold)
+    print(f"{'case':<24}{'size':>12}{'old ms':>11}{'new ms':>11}{'time':>8}{'old MiB':>10}{'new MiB':>10}{'mem':>8}")
+    for case, size, old_s, new_s, t_ratio, old_b, new_b, m_ratio, regressed in rows:
+        print(f"{case:<24}{size:>12,}{old_s * 1e3:>11.2f}{new_s * 1e3:>11.2f}{t_ratio:>7.2f}x"
+              f"{old_b / 2**20:>10.1f}{new_b / 2**20:>10.1f}{m_ratio:>7.2f}x{'  REGRESSION' if regressed else ''}")
+    only = (old.keys() ^ new.keys())
+    if only:
+        print(f"{len(only)} case/size pairs are in only one file and were skipped")
+    sys.exit(1 if any(row[-1] for row in rows) else 0)
@@ -0,0 +1,348 @@
+"""
+Benchmark suite for the compute paths of every project.
+
+Each case builds synthetic inputs of a given size (synthetic.py; not timed),
+runs once under tracemalloc for the peak memory, then `repeat` more times with
+the garbage collector off for the timings. Results go to one JSON file per run
+with the commit, package versions and, per case and size, every timing, the
+minimum / median and the peak traced bytes; compare_benchmarks.py diffs two
+such files.
+
+Size tiers: quick (smoke test, seconds), default (minutes), full (the largest
+sizes; writes multi-GB synthetic LAS / CSV files into --workdir, which are
+reused by later runs).
+
+    python run_benchmarks.py --tier default --output results/baseline.json
+    python run_benchmarks.py --only las_ ofm_ --tier full
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+import synthetic
+from petroportfolio.dca.models import arps_eur
+from petroportfolio.gaslift.sensitivity import sensitivity_table
+from petroportfolio.nodal.batch import run_sensitivity
+from petroportfolio.nodal.pvt_tables import build_tables
+from petroportfolio.nodal.solver import solve_operating_point
+from petroportfolio.nodal.vlp_traverse import traverse
+from petroportfolio.ofm.store import PRODUCTION, WELLTEST, clean, ingest
+from petroportfolio.ofm.welltest_join import asof_join
+from petroportfolio.petro.depth_index import DepthLog
+from petroportfolio.petro.engine import evaluate, normalize_nphi, pay_summary
+from petroportfolio.petro.las_reader import read_las
+from petroportfolio.petro.log_export import export_bytes
+from petroportfolio.volumetrics.gas_volumetrics import run_monte_carlo
+
+
+SCHEMA_VERSION = 1
+TIERS = ["quick", "default", "full"]
+DEFAULT_WORKDIR = Path(tempfile.gettempdir()) / "petro_benchmarks"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+class Case(NamedTuple):
+    name: str
+    project: str
+    unit: str               # what `size` counts
+    sizes: dict             # tier -> sizes
+    setup: Callable         # (workdir, size) -> state, not timed
+    run: Callable           # state -> anything, timed
+    reset: Callable = None  # state -> None, called (untimed) before every run
+
+
+def _sizes(quick, default, full):
+    return {"quick": quick, "default": default, "full": full}
+
+
+SAMPLES = _sizes([10**4], [10**4, 10**5, 10**6], [10**4, 10**5, 10**6, 10**7])       # LAS depth steps
+ROWS = _sizes([10**3], [10**3, 10**5, 10**6], [10**3, 10**5, 10**6, 10**7])         # OFM production rows
+ARRAYS = SAMPLES                                                                     # vectorised kernels
+SOLVES = _sizes([10**3], [10**3, 10**4, 10**5], [10**3, 10**4, 10**5, 10**6])       # root solves / traverses
+
+
+#🪔 Petrophysics
+def _setup_las_parse(workdir, size):
+    return synthetic.make_las(workdir, size)
+
+
+def _run_las_parse(path):
+    return read_las(path, cache=False)
+
+
+def _setup_las_cached(workdir, size):
+    path = synthetic.make_las(workdir, size)
+    read_las(path, cache=True)          # builds the sidecar
+    return path
+
+
+def _run_las_cached(path):
+    return read_las(path, cache=True)
+
+
+def _setup_interval(workdir, size):
+    log = DepthLog.from_las(read_las(synthetic.make_las(workdir, size), cache=False))
+    rng = np.random.default_rng(0)
+    tops = rng.uniform(log.min_depth, log.max_depth, 1000)
+    bases = tops + rng.uniform(10, 500, 1000)
+    return log, list(zip(tops, bases))
+
+
+def _run_interval(state):
+    log, windows = state
+    for top, base in windows:
+        log.interval(top, base)
+
+
+def _setup_petro(workdir, size):
+    las = read_las(synthetic.make_las(workdir, size), cache=False)
+    nphi, _ = normalize_nphi(las["NEU"])
+    return las.index, las["GR"], las["DEN"], nphi, las["RDEP"]
+
+
+def _run_petro(state):
+    depth, gr, rhob, nphi, rt = state
+    return pay_summary(depth, evaluate(gr, rhob, nphi, rt))
+
+
+#📉 Decline Curves
+def _run_arps_eur(state):
+    qi, D, b = state
+    return arps_eur(qi, D, b, t_end=360, q_limit=5.0, D_min=0.005)
+
+
+#💧 Nodal / Gas Lift
+def _run_operating_point(cases):
+    return solve_operating_point(**cases)
+
+
+def _run_nodal_batch(wells):
+    return run_sensitivity(wells, [100, 200, 300, 400, 500], workers=1)
+
+
+def _run_gl_sweep(grid):
+    return sensitivity_table(grid)
+
+
+def _setup_vlp(workdir, size):
+    tables = build_tables(ROOT / "Gas_Lift_Optimization" / "sample_pvt_data.csv")
+    rng = np.random.default_rng(0)
+    return tables, rng.uniform(100, 3000, size), rng.uniform(200, 3200, size), rng.uniform(100, 500, size)
+
+
+def _run_vlp(state):
+    tables, q, glr, whp = state
+    return traverse(whp + 14.7, 8000, q, glr, 0.2, tables)
+
+
+#📊 OFM / Power BI
+def _setup_ofm_ingest(workdir, size):
+    return synthetic.make_ofm_production(workdir, size), Path(workdir) / f"store_{size}"
+
+
+def _reset_ofm_ingest(state):
+    shutil.rmtree(state[1], ignore_errors=True)
+
+
+def _run_ofm_ingest(state):
+    source, root = state
+    return ingest(source, root, PRODUCTION)
+
+
+def _setup_ofm_frames(size):
+    prod = synthetic.ofm_production(size)
+    n_days = int((prod["Date"].max() - prod["Date"].min()).days) + 1
+    test = synthetic.ofm_welltest(n_days, prod["Well Name"].nunique())
+    return clean(prod, PRODUCTION), clean(test, WELLTEST)
+
+
+def _run_ofm_merge(state):
+    prod, test = state
+    return asof_join(prod, test, max_age_days=90)
+
+
+def _setup_ofm_export(workdir, size):
+    return asof_join(*_setup_ofm_frames(size), max_age_days=90)
+
+
+def _run_export_csv(df):
+    return df.to_csv(index=False).encode("utf-8")        # what the dashboards hand to st.download_button
+
+
+def _run_export_parquet(df):
+    return export_bytes(df, "Parquet")
+
+
+#🧮 Volumetrics
+def _run_ogip(n):
+    specs = {"area": ("Triangular", (800, 1200, 1800)), "h": ("Triangular", (40, 60, 90)),
+             "phi": ("Normal", (0.18, 0.03)), "sw": ("Uniform", (0.2, 0.45)),
+             "p": ("Normal", (3500, 200)), "t": ("Fixed", (200,))}
+    return run_monte_carlo(specs, n, seed=0)
+
+
+CASES = [
+    Case("las_parse", "Petrophysical_Analysis", "samples", SAMPLES, _setup_las_parse, _run_las_parse),
+    Case("las_parse_cached", "Petrophysical_Analysis", "samples", SAMPLES, _setup_las_cached, _run_las_cached),
+    Case("las_interval_select", "Petrophysical_Analysis", "samples", SAMPLES, _setup_interval, _run_interval),
+    Case("petro_sw_pay", "Petrophysical_Analysis", "samples", SAMPLES, _setup_petro, _run_petro),
+    Case("arps_eur", "Decline_Curve_Analysis", "wells", ARRAYS,
+         lambda workdir, size: synthetic.dca_parameters(size), _run_arps_eur),
+    Case("nodal_operating_point", "Nodal_Analysis", "scenarios", SOLVES,
+         lambda workdir, size: synthetic.nodal_cases(size), _run_operating_point),
+    Case("nodal_batch_sweep", "Nodal_Analysis", "wells", _sizes([10], [10, 100, 1000], [10, 100, 1000, 10**4]),
+         lambda workdir, size: synthetic.nodal_wells(size), _run_nodal_batch),
+    Case("vlp_traverse", "Nodal_Analysis", "points", SOLVES, _setup_vlp, _run_vlp),
+    Case("gas_lift_sweep", "Gas_Lift_Optimization", "grid points", ARRAYS,
+         lambda workdir, size: synthetic.gas_lift_grid(size), _run_gl_sweep),
+    Case("ofm_ingest", "Power_BI_OFM_Integration", "rows", _sizes([10**3], [10**3, 10**5], ROWS["full"]),
+         _setup_ofm_ingest, _run_ofm_ingest, _reset_ofm_ingest),
+    Case("ofm_merge", "Power_BI_OFM_Integration", "rows", ROWS,
+         lambda workdir, size: _setup_ofm_frames(size), _run_ofm_merge),
+    Case("ofm_export_csv", "Power_BI_OFM_Integration", "rows", ROWS, _setup_ofm_export, _run_export_csv),
+    Case("ofm_export_parquet", "Power_BI_OFM_Integration", "rows", ROWS, _setup_ofm_export, _run_export_parquet),
+    Case("ogip_monte_carlo", "Volumetric_Gas_Reservoir", "realizations", ARRAYS, lambda workdir, size: size, _run_ogip),
+]
+
+
+#⏱️ Measurement
+def peak_memory(case, state):
+    """Peak bytes traced while running the case once (NumPy buffers are traced; Arrow's pool is not)."""
+    if case.reset:
+        case.reset(state)
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        case.run(state)
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def time_runs(case, state, repeat):
+    times = []
+    for _ in range(repeat):
+        if case.reset:
+            case.reset(state)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            case.run(state)
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return times
+
+
+def run_case(case, size, workdir, repeat):
+    """One result record; failures are recorded instead of raised."""
+    record = {"case": case.name, "project": case.project, "size": size, "unit": case.unit}
+    try:
+        state = case.setup(workdir, size)
+        record["peak_bytes"] = peak_memory(case, state)        # doubles as the warm-up run
+        times = time_runs(case, state, repeat)
+        record.update({
+            "repeat": repeat,
+            "times_s": times,
+            "min_s": min(times),
+            "median_s": statistics.median(times),
+            "ns_per_item": min(times) / size * 1e9,
+        })
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+#🗒️ Run Metadata
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    versions = {"numpy": np.__version__, "pandas": pd.__version__}
+    try:
+        import pyarrow
+        versions["pyarrow"] = pyarrow.__version__
+    except ImportError:
+        versions["pyarrow"] = None
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def select_cases(only=None):
+    if not only:
+        return CASES
+    return [case for case in CASES if any(case.name.startswith(prefix) for prefix in only)]
+
+
+def run_suite(cases, tier="default", workdir=DEFAULT_WORKDIR, repeat=3, log=print):
+    workdir = Path(workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for case in cases:
+        for size in case.sizes[tier]:
+            record = run_case(case, size, workdir, repeat)
+            results.append(record)
+            if "error" in record:
+                log(f"{case.name:<24}{size:>12,}  ERROR {record['error']}")
+            else:
+                log(f"{case.name:<24}{size:>12,}  {record['min_s'] * 1e3:>10.2f} ms"
+                    f"  {record['peak_bytes'] / 2**20:>9.1f} MiB")
+    return {"schema": SCHEMA_VERSION, "tier": tier, "repeat": repeat, **environment(), "results": results}
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the core compute paths on synthetic data; write JSON.")
+    parser.add_argument("--tier", choices=TIERS, default="default")
+    parser.add_argument("--only", nargs="+", default=None, help="case name prefixes to run")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case and size")
+    parser.add_argument("--workdir", default=str(DEFAULT_WORKDIR), help="where synthetic input files are kept")
+    parser.add_argument("--output", default=None, help="JSON path (default: results/<commit>.json)")
+    parser.add_argument("--list", action="store_true", help="list cases and sizes, then exit")
+    args = parser.parse_args()
+
+    cases = select_cases(args.only)
+    if args.list:
+        for case in cases:
+            print(f"{case.name:<24}{case.project:<28}{case.unit:<14}{case.sizes[args.tier]}")
+        sys.exit(0)
+
+    report = run_suite(cases, args.tier, args.workdir, args.repeat)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{(report['commit'] or 'nocommit')[:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"Wrote {len(report['results'])} results to {output}")
@@ -0,0 +1,188 @@
+"""
+Synthetic inputs for the benchmarks, shaped like the sample data in each project.
+
+    make_las             15-9-19_SR_COMP.las layout (DEPT AC CALI DEN GR NEU RDEP RMED), any length
+    ofm_production       dummy_ofm_production.csv columns, daily rows over many wells (make_ofm_production writes it)
+    ofm_welltest         dummy_ofm_welltest.csv columns, one test per well every ~30 days
+    dca_parameters       qi / D / b arrays
+    nodal_wells          sample_wells.csv rows (Fetkovich well tests)
+    nodal_cases          flat arrays of Fetkovich IPR / VLP scenarios
+    gas_lift_grid        GIR x PI x DomeP x DeltaP axes with about n points
+
+Files are written once per (size, seed) into a work directory and reused.
+Everything is drawn from np.random.default_rng(seed), so a size always
+produces the same data.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+LAS_CURVES = [
+    ("DEPT", "M", "DEPTH"),
+    ("AC", "US/F", "Sonic Transit Time (Slowness)"),
+    ("CALI", "IN", "Caliper"),
+    ("DEN", "G/CC", "Bulk Density"),
+    ("GR", "GAPI", "Gamma Ray"),
+    ("NEU", "%", "Neutron Porosity"),
+    ("RDEP", "OHMM", "Deep Resistivity"),
+    ("RMED", "OHMM", "Medium Resistivity"),
+]
+LAS_TOP = 102.1568
+LAS_STEP = 0.1524
+LAS_NULL = -999.25
+WRITE_CHUNK = 200_000
+
+
+#🪔 LAS Logs
+def las_curves(n_samples, rng):
+    """Curve array (n_samples, len(LAS_CURVES)): alternating sand/shale beds with ~2 % null samples."""
+    depth = LAS_TOP + LAS_STEP * np.arange(n_samples)
+    shale = (np.sin(depth / 7.0) + 0.3 * rng.standard_normal(n_samples)) > 0
+    gr = np.where(shale, 110, 35) + 10 * rng.standard_normal(n_samples)
+    phi = np.clip(np.where(shale, 0.08, 0.22) + 0.03 * rng.standard_normal(n_samples), 0.01, 0.4)
+    den = 2.65 - 1.65 * phi + 0.02 * rng.standard_normal(n_samples)
+    neu = 100 * (phi + np.where(shale, 0.15, 0.0))
+    rdep = np.where(shale, 2.0, 20.0) * np.exp(0.5 * rng.standard_normal(n_samples))
+    rmed = rdep * 0.8
+    ac = 55 + 150 * phi
+    cali = 8.5 + 0.2 * rng.standard_normal(n_samples)
+    data = np.column_stack([depth, ac, cali, den, gr, neu, rdep, rmed])
+    nulls = rng.random(data[:, 1:].shape) < 0.02
+    data[:, 1:][nulls] = LAS_NULL
+    return data
+
+
+def make_las(workdir, n_samples, seed=0):
+    """Write (once) a LAS 2.0 file with n_samples depth steps; returns its path."""
+    path = Path(workdir) / f"synthetic_{n_samples}_{seed}.las"
+    if path.exists():
+        return path
+    rng = np.random.default_rng(seed)
+    stop = LAS_TOP + LAS_STEP * (n_samples - 1)
+    header = [
+        "~VERSION INFORMATION",
+        " VERS.                 2.0:   CWLS Log ASCII Standard-VERSION 2.0",
+        " WRAP.                  NO:   One line per depth step",
+        "~Well Information Block",
+        f" STRT.M          {LAS_TOP:.4f}:   Top Depth",
+        f" STOP.M          {stop:.4f}:   Bottom Depth",
+        f" STEP.M          {LAS_STEP:.4f}:   Depth Increment",
+        f" NULL.          {LAS_NULL:.3f}:   Null Value",
+        " WELL.          SYNTHETIC-1:   NAME",
+        "~Curve Information Block",
+        *(f" {mnem}.{unit}          :   {desc}" for mnem, unit, desc in LAS_CURVES),
+        "~ASCII",
+    ]
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        f.write("\n".join(header) + "\n")
+        for start in range(0, n_samples, WRITE_CHUNK):
+            m = min(WRITE_CHUNK, n_samples - start)
+            block = las_curves(m, rng)
+            block[:, 0] = LAS_TOP + LAS_STEP * np.arange(start, start + m)
+            np.savetxt(f, block, fmt="%10.4f")
+    tmp.replace(path)
+    return path
+
+
+#📊 OFM Exports
+def _well_names(n_wells):
+    return np.array([f"WELL-{i:04d}" for i in range(n_wells)])
+
+
+def ofm_production(n_rows, n_wells=None, seed=0):
+    """dummy_ofm_production.csv-style frame: n_rows daily rows spread evenly over the wells."""
+    rng = np.random.default_rng(seed)
+    n_wells = n_wells or max(1, min(2000, n_rows // 365))
+    n_days = -(-n_rows // n_wells)
+    day = np.arange(n_rows) // n_wells
+    well = np.arange(n_rows) % n_wells
+    oil = np.maximum(1200 * np.exp(-day / max(n_days, 1)) + 100 * rng.standard_normal(n_rows), 0)
+    water = np.maximum(300 + 0.5 * day + 50 * rng.standard_normal(n_rows), 0)
+    return pd.DataFrame({
+        "Date": pd.Timestamp("2020-01-01") + pd.to_timedelta(day, unit="D"),
+        "Well Name": _well_names(n_wells)[well],
+        "Oil Rate (bbl/d)": oil.round(1),
+        "Gas Rate (Mscf/d)": (oil * rng.uniform(1.5, 3.0, n_rows)).round(1),
+        "Water Rate (bbl/d)": water.round(1),
+        "WHP (psi)": (1100 + 50 * rng.standard_normal(n_rows)).round(1),
+        "BSW (%)": (100 * water / np.maximum(oil + water, 1)).round(1),
+        "Status": np.where(oil > 0, "Flowing", "Shut-in"),
+    })
+
+
+def ofm_welltest(n_days, n_wells, seed=0):
+    """dummy_ofm_welltest.csv-style frame: one test per well roughly every 30 days."""
+    rng = np.random.default_rng(seed + 1)
+    n_tests = max(1, n_days // 30)
+    well = np.repeat(np.arange(n_wells), n_tests)
+    day = np.tile(np.arange(n_tests) * 30, n_wells) + rng.integers(0, 30, n_wells * n_tests)
+    n = len(well)
+    return pd.DataFrame({
+        "Test Date": pd.Timestamp("2020-01-01") + pd.to_timedelta(day, unit="D"),
+        "Well Name": _well_names(n_wells)[well],
+        "Q_liq (bbl/d)": rng.uniform(500, 2000, n).round(1),
+        "Water Cut (%)": rng.uniform(10, 60, n).round(1),
+        "GOR (scf/bbl)": rng.uniform(800, 3000, n).round(1),
+        "THP (psi)": rng.uniform(800, 1200, n).round(1),
+        "Lift Method": rng.choice(["Natural", "ESP", "Gas Lift", "Pump"], n),
+    })
+
+
+def make_ofm_production(workdir, n_rows, seed=0):
+    """Write (once) the production CSV; returns its path."""
+    path = Path(workdir) / f"ofm_production_{n_rows}_{seed}.csv"
+    if not path.exists():
+        ofm_production(n_rows, seed=seed).to_csv(path, index=False)
+    return path
+
+
+#📉 DCA / Nodal / Gas Lift
+def dca_parameters(n, seed=0):
+    """qi (bbl/d), D (1/month) and b arrays of length n."""
+    rng = np.random.default_rng(seed)
+    return rng.uniform(200, 5000, n), rng.uniform(0.01, 0.3, n), rng.uniform(0.0, 1.5, n)
+
+
+def nodal_wells(n_wells, seed=0):
+    """sample_wells.csv-style frame (q_list / pwf_list already parsed) of n_wells Fetkovich well tests."""
+    rng = np.random.default_rng(seed)
+    p_res = rng.uniform(1500, 4000, n_wells)
+    aof = rng.uniform(1000, 5000, n_wells)
+    n_exp = rng.uniform(0.6, 1.0, n_wells)
+    frac = np.linspace(0.15, 0.85, 5)
+    q = aof[:, None] * frac
+    # pwf from q = C (p_res² - pwf²)^n with C chosen so q(0) = aof
+    pwf = p_res[:, None] * np.sqrt(1 - frac ** (1 / n_exp[:, None]))
+    return pd.DataFrame({
+        "well": [f"WELL-{i:05d}" for i in range(n_wells)],
+        "q_list": list(q.round(1)),
+        "pwf_list": list(pwf.round(1)),
+        "p_res": p_res.round(0),
+        "depth": rng.uniform(6000, 10000, n_wells).round(0),
+        "gradient": rng.uniform(0.09, 0.13, n_wells).round(3),
+    })
+
+
+def nodal_cases(n, seed=0):
+    """Flattened solve_operating_point inputs (c, n, p_res, whp, gradient, depth) for n scenarios."""
+    rng = np.random.default_rng(seed)
+    p_res = rng.uniform(1500, 4000, n)
+    n_exp = rng.uniform(0.6, 1.0, n)
+    c = rng.uniform(1000, 5000, n) / (p_res**2) ** n_exp          # AOF between 1000 and 5000 STB/d
+    return {"c": c, "n": n_exp, "p_res": p_res, "whp": rng.uniform(100, 400, n),
+            "gradient": rng.uniform(0.09, 0.13, n), "depth": rng.uniform(6000, 10000, n)}
+
+
+def gas_lift_grid(n_points):
+    """gaslift.sensitivity grid over the notebook ranges with about n_points combinations (k points per axis)."""
+    k = max(2, round(n_points ** 0.25))
+    return {
+        "GIR": np.linspace(0.5E06, 3.0E06, k),      # scf/d
+        "PI": np.linspace(0.8, 1.5, k),             # STB/d/psi
+        "DomeP": np.linspace(1800, 2400, k),        # psia
+        "DeltaP": np.linspace(50, 300, k),          # psia
+    }
@@ -0,0 +1,26 @@
+"""
+Importable compute cores of the portfolio projects, shared by the Streamlit
+apps, notebooks, batch CLIs and benchmarks.
+
+    dca           Arps models, batch decline fits, probabilistic EUR, Volve cache
+    nodal         Fetkovich IPR / VLP solver, batch sensitivities, PVT tables, VLP traverse
+    petro         LAS reader, petrophysics engine, batch pay summaries, CBM zonation, log export
+    gaslift       dual-string sensitivity grid, well performance, gas allocation
+    ofm           partitioned OFM Parquet store, well-test joins, Power BI rollups
+    volumetrics   DAK Z-factor and Monte Carlo OGIP
+    instrument    per-stage timing / memory spans and the Streamlit timing panel
+
+Subpackages and their functions are imported on first use, e.g.
+
+    from petroportfolio.dca import arps_eur          # numpy only, no scipy / pandas
+
+Nothing here touches Streamlit, so every engine can run in a worker process.
+"""
+
+from ._lazy import lazy_exports
+
+
+SUBPACKAGES = ["dca", "nodal", "petro", "gaslift", "ofm", "volumetrics", "instrument"]
+
+__all__ = list(SUBPACKAGES)
+__getattr__, __dir__ = lazy_exports(__name__, {name: name for name in SUBPACKAGES})
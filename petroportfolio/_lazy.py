@@ -0,0 +1,31 @@
+"""
+Lazy re-exports for the package __init__ files.
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"arps_eur": "models", ...})
+
+A name is imported from its submodule on first attribute access and then
+cached in the package namespace, so importing a package costs nothing until
+something is used and only the submodules actually touched (and their numpy /
+pandas / pyarrow / scipy imports) are loaded.
+"""
+
+import importlib
+
+
+def lazy_exports(package, exports):
+    """Module-level __getattr__ and __dir__ resolving exports[name] (a submodule) on first use."""
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(f"{package}.{submodule}")
+        value = module if submodule == name else getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
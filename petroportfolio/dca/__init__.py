@@ -0,0 +1,28 @@
+"""Decline curve analysis: Arps models, batch fits, probabilistic EUR and the Volve production cache."""
+
+from .._lazy import lazy_exports
+
+
+_EXPORTS = {
+    "exponential_decline": "models",
+    "harmonic_decline": "models",
+    "hyperbolic_decline": "models",
+    "arps_rate": "models",
+    "arps_cumulative": "models",
+    "arps_eur": "models",
+    "time_to_limit": "models",
+    "calculate_EUR": "models",
+    "fit_decline_models": "fit",
+    "fit_wells": "fit",
+    "load_volve_production": "fit",
+    "prepare_decline_data": "fit",
+    "eur_summary": "probabilistic",
+    "rate_percentiles": "probabilistic",
+    "run_monte_carlo": "probabilistic",
+    "sample_distribution": "probabilistic",
+    "list_wells": "production_cache",
+    "load_production": "production_cache",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,248 @@
+"""
+Batch Arps decline fitting for every well in a production history.
+
+All wells are fitted together: each model is linearised (ln q, 1/q or q^-b
+against time) and solved by closed-form weighted least squares per well using
+grouped sums, so the cost is a handful of passes over the data instead of one
+optimiser call per well. The weights (dq/dy)^2 make the linearised residuals
+approximate residuals in rate space, so low-rate days do not dominate. The
+linearised fits are then polished by a few damped Gauss-Newton iterations on
+the rate-space residuals, again for all wells at once.
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .models import arps_eur, arps_rate
+from .production_cache import DAILY_SHEET, load_production
+
+
+DAYS_PER_MONTH = 30.4375
+B_GRID = np.round(np.arange(0.05, 2.0 + 1e-9, 0.05), 2)   # hyperbolic exponents tried per well
+B_MAX = 2.0
+GN_ITERATIONS = 30
+
+VOLVE_PATH = Path(__file__).resolve().parents[2] / "Decline_Curve_Analysis" / "Volve production data.xlsx"
+FIT_COLUMNS = ["WELL_BORE_CODE", "DATEPRD", "BORE_OIL_VOL", "FLOW_KIND"]
+
+
+#📥 Data Preparation
+def load_volve_production(path=VOLVE_PATH, wells=None, columns=FIT_COLUMNS):
+    """Daily production through the columnar cache (the workbook is parsed only once)."""
+    return load_production(path, wells=wells, columns=columns, sheet=DAILY_SHEET)
+
+
+def prepare_decline_data(prod_df, well_col="WELL_BORE_CODE", date_col="DATEPRD",
+                         rate_col="BORE_OIL_VOL", min_points=6):
+    """
+    Keep the producing days of each well from its peak rate onward.
+    Returns columns WELL, t (months since peak) and q (rate), sorted by well.
+    """
+    df = prod_df[[well_col, date_col, rate_col]].dropna()
+    if "FLOW_KIND" in prod_df.columns:
+        df = df[prod_df.loc[df.index, "FLOW_KIND"] == "production"]
+    df = df[df[rate_col] > 0]
+    df = df.rename(columns={well_col: "WELL", date_col: "DATE", rate_col: "q"})
+    df = df.sort_values(["WELL", "DATE"], kind="stable")
+
+    peak_date = df.loc[df.groupby("WELL")["q"].idxmax(), ["WELL", "DATE"]]
+    df = df.merge(peak_date.rename(columns={"DATE": "PEAK_DATE"}), on="WELL")
+    df = df[df["DATE"] >= df["PEAK_DATE"]]
+    df["t"] = (df["DATE"] - df["PEAK_DATE"]).dt.days / DAYS_PER_MONTH
+
+    counts = df.groupby("WELL")["q"].transform("size")
+    df = df[counts >= min_points]
+    return df[["WELL", "t", "q"]].reset_index(drop=True)
+
+
+#🔧 Grouped Least Squares
+def _group_sums(starts, values):
+    # rows are sorted by well, so each well is one contiguous run
+    return np.add.reduceat(values, starts)
+
+
+def _group_linear_fit(starts, x, y, w):
+    """Weighted slope and intercept of y = a + s*x for every group at once."""
+    wx, wy = w * x, w * y
+    sw = _group_sums(starts, w)
+    sx = _group_sums(starts, wx)
+    sy = _group_sums(starts, wy)
+    sxx = _group_sums(starts, wx * x)
+    sxy = _group_sums(starts, wx * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (sw * sxy - sx * sy) / (sw * sxx - sx ** 2)
+        intercept = (sy - slope * sx) / sw
+    return slope, intercept
+
+
+def _group_sse(starts, q, q_fit):
+    resid = q - q_fit
+    return _group_sums(starts, resid * resid)
+
+
+def _arps_jacobian(t, D, b, q_fit, fit_b):
+    """dq/d(ln qi, ln D[, b]) per row; the b column uses a series near b = 0."""
+    x = b * D * t
+    cols = [q_fit, -q_fit * D * t / (1 + x)]
+    if fit_b:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exact = (np.log1p(x) - x / (1 + x)) / (b * b)
+        series = (D * t) ** 2 * (0.5 - 2 * x / 3)
+        cols.append(q_fit * np.where(x < 1e-4, series, exact))
+    return np.stack(cols, axis=1)
+
+
+def _refine_rate_space(starts, g, t, q, qi, D, b, fit_b, n_iter=GN_ITERATIONS):
+    """
+    Levenberg-damped Gauss-Newton on sum (q - q_arps)^2 per well, from (qi, D, b).
+    qi and D are stepped in log space (kept positive), b is held in [0, B_MAX]
+    when fitted. A well keeps a step only if its SSE drops; wells with no valid
+    start are returned unchanged.
+    """
+    ok = (qi > 0) & (D > 0) & np.isfinite(qi) & np.isfinite(D)
+    theta = np.stack([np.log(np.where(ok, qi, 1.0)), np.log(np.where(ok, D, 1.0)), np.where(ok, b, 0.0)], axis=1)
+    k = 3 if fit_b else 2
+
+    def rates(th):
+        return arps_rate(np.exp(th[g, 0]), np.exp(th[g, 1]), th[g, 2], t)
+
+    q_fit = rates(theta)
+    sse = _group_sse(starts, q, q_fit)
+    lam = np.full(len(starts), 1e-3)
+    for _ in range(n_iter):
+        J = _arps_jacobian(t, np.exp(theta[g, 1]), theta[g, 2], q_fit, fit_b)
+        A = _group_sums(starts, J[:, :, None] * J[:, None, :])
+        r = _group_sums(starts, J * (q - q_fit)[:, None])
+        diag = np.einsum("gii->gi", A)
+        A_damped = A + (lam[:, None] * diag + 1e-12 * diag.max(axis=1, keepdims=True) + 1e-300)[:, :, None] * np.eye(k)
+        step = np.linalg.solve(A_damped, r[:, :, None])[:, :, 0]
+        trial = theta.copy()
+        trial[:, :k] += np.where(ok[:, None], step, 0.0)
+        trial[:, 2] = np.clip(trial[:, 2], 0.0, B_MAX)
+        with np.errstate(over="ignore", invalid="ignore"):
+            trial_fit = rates(trial)
+            trial_sse = _group_sse(starts, q, trial_fit)
+        better = ok & np.isfinite(trial_sse) & (trial_sse < sse)
+        theta[better] = trial[better]
+        sse = np.where(better, trial_sse, sse)
+        q_fit = np.where(better[g], trial_fit, q_fit)
+        lam = np.where(better, lam * 0.3, lam * 10)
+    qi, D, b = np.exp(theta[:, 0]), np.exp(theta[:, 1]), theta[:, 2]
+    return np.where(ok, qi, np.nan), np.where(ok, D, np.nan), np.where(ok, b, np.nan), np.where(ok, sse, np.inf)
+
+
+def fit_status(qi, D):
+    """Why a well has no fit, from its linearised qi and D."""
+    return np.select([D <= 0, qi <= 0], ["rate not declining (D <= 0)", "qi <= 0"], "no finite fit")
+
+
+#📈 Batch Fitting
+def fit_decline_models(decline_df, t_end=120, q_limit=None, D_min=None):
+    """
+    Fit exponential, harmonic and hyperbolic Arps models to every well.
+
+    `decline_df` is the output of `prepare_decline_data`. Returns one row per
+    well and model with qi, D (per month), b, R2, RMSE, point count, EUR over
+    `t_end` months (same convention as `calculate_EUR`, optionally cut at the
+    economic limit `q_limit` and/or with terminal decline `D_min`), a Status
+    saying why a rejected fit is empty, and a BEST flag.
+    """
+    wells, g = np.unique(decline_df["WELL"].to_numpy(), return_inverse=True)
+    order = np.argsort(g, kind="stable")
+    g = g[order]
+    t = decline_df["t"].to_numpy(dtype=float)[order]
+    q = decline_df["q"].to_numpy(dtype=float)[order]
+    n_groups = len(wells)
+    starts = np.flatnonzero(np.r_[True, g[1:] != g[:-1]])
+
+    n = np.diff(np.r_[starts, len(g)])
+    q_max = np.maximum.reduceat(q, starts)
+    log_q, log_q_rel = np.log(q), np.log(q / q_max[g])
+    sst = _group_sums(starts, q * q) - _group_sums(starts, q) ** 2 / n
+
+    params = {}
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Exponential: ln q = ln qi - D t
+        slope, intercept = _group_linear_fit(starts, t, log_q, np.exp(2 * log_q_rel))
+        qi, D = np.exp(intercept), -slope
+        params["Exponential"] = (qi, D, np.zeros(n_groups))
+
+        # Harmonic: 1/q = 1/qi + (D/qi) t
+        slope, intercept = _group_linear_fit(starts, t, 1.0 / q, np.exp(4 * log_q_rel))
+        qi, D = 1.0 / intercept, slope / intercept
+        params["Harmonic"] = (qi, D, np.ones(n_groups))
+
+        # Hyperbolic: q^-b = qi^-b + (b D qi^-b) t, scanned over b
+        best = (np.full(n_groups, np.nan), np.full(n_groups, np.nan),
+                np.full(n_groups, np.nan), np.full(n_groups, np.inf))
+        for b in B_GRID:
+            y, w = np.exp(-b * log_q), np.exp((2 * b + 2) * log_q_rel)
+            slope, intercept = _group_linear_fit(starts, t, y, w)
+            qi, D = intercept ** (-1.0 / b), slope / (b * intercept)
+            sse = _group_sse(starts, q, arps_rate(qi[g], D[g], b, t))
+            sse[~((intercept > 0) & (D > 0) & np.isfinite(sse))] = np.inf
+            better = sse < best[3]
+            for arr, new in zip(best, (qi, D, np.full(n_groups, b), sse)):
+                arr[better] = new[better]
+        raw = {model: (qi, D) for model, (qi, D, _) in params.items()}
+
+        # Rate-space polish: exponential / harmonic in (qi, D), hyperbolic in (qi, D, b)
+        for model, (qi, D, b) in params.items():
+            params[model] = _refine_rate_space(starts, g, t, q, qi, D, b, fit_b=False)
+        params["Hyperbolic"] = _refine_rate_space(starts, g, t, q, *best[:3], fit_b=True)
+        # b = 0 and b = 1 are hyperbolic too, so hyperbolic never scores below them
+        for model in ("Exponential", "Harmonic"):
+            limit, hyp = params[model], params["Hyperbolic"]
+            better = limit[3] < hyp[3]
+            params["Hyperbolic"] = tuple(np.where(better, a, h) for a, h in zip(limit, hyp))
+        # no b on the grid gave a valid fit: the exponential reason applies
+        raw["Hyperbolic"] = tuple(np.where(np.isfinite(best[0]), h, e) for h, e in zip(best[:2], raw["Exponential"]))
+
+    frames = []
+    for model, (qi, D, b, sse) in params.items():
+        valid = (qi > 0) & (D > 0) & np.isfinite(sse)
+        status = np.where(valid, "ok", fit_status(*raw[model]))
+        qi, D, b = (np.where(valid, arr, np.nan) for arr in (qi, D, b))
+        sse = np.where(valid, sse, np.nan)
+        frames.append(pd.DataFrame({
+            "Well": wells,
+            "Model": model,
+            "qi": qi,
+            "D": D,
+            "b": b,
+            "R2": 1 - sse / sst,
+            "RMSE": np.sqrt(sse / n),
+            "Points": n.astype(int),
+            "EUR": arps_eur(qi, D, b, t_end, q_limit, D_min),
+            "Status": status,
+        }))
+
+    table = pd.concat(frames, ignore_index=True).sort_values(["Well", "Model"], ignore_index=True)
+    best_idx = table.dropna(subset=["R2"]).groupby("Well")["R2"].idxmax()
+    table["BEST"] = False
+    table.loc[best_idx, "BEST"] = True
+    return table
+
+
+def fit_wells(prod_df, t_end=120, q_limit=None, D_min=None, **prepare_kwargs):
+    """Prepare raw daily production and fit all wells in one pass."""
+    decline_df = prepare_decline_data(prod_df, **prepare_kwargs)
+    return fit_decline_models(decline_df, t_end=t_end, q_limit=q_limit, D_min=D_min)
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit Arps decline models to every well in a production workbook.")
+    parser.add_argument("--input", default=str(VOLVE_PATH), help="production workbook (default: Volve)")
+    parser.add_argument("--t-end", type=int, default=120, help="EUR horizon in months")
+    parser.add_argument("--q-limit", type=float, default=None, help="economic limit rate")
+    parser.add_argument("--d-min", type=float, default=None, help="terminal decline (modified hyperbolic)")
+    parser.add_argument("--output", default="decline_fit_parameters.csv")
+    args = parser.parse_args()
+
+    table = fit_wells(load_volve_production(args.input), t_end=args.t_end, q_limit=args.q_limit, D_min=args.d_min)
+    table.to_csv(args.output, index=False)
+    print(table[table["BEST"]].to_string(index=False))
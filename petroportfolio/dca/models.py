@@ -0,0 +1,115 @@
+import numpy as np
+
+
+B_EPS = 1e-6     # b below this is treated as exponential, |b-1| below it as harmonic
+
+
+#📘 Define DC Functions (Fundamental)
+def exponential_decline (qi, D, t):
+    return qi * np.exp(-D * t)
+
+def harmonic_decline (qi, D, t):
+    return qi / (1 + D * t)
+
+def hyperbolic_decline (qi, D, b, t):
+    return qi / np.power (1 + b * D * t, 1 /b)
+
+
+#📐 Closed-form Arps Rate & Cumulative (array inputs, b = 0 exponential, b = 1 harmonic)
+def _arps_rate(qi, D, b, t):
+    exp_like = b < B_EPS
+    if exp_like.all():
+        return exponential_decline(qi, D, t)
+    b_safe = np.where(exp_like, 1.0, b)
+    with np.errstate(over="ignore"):
+        q = hyperbolic_decline(qi, D, b_safe, t)
+    if exp_like.any():
+        q = np.where(exp_like, exponential_decline(qi, D, t), q)
+    return q
+
+
+def _arps_cumulative(qi, D, b, t):
+    exp_like = b < B_EPS
+    harm_like = np.abs(b - 1) < B_EPS
+    b_safe = np.where(exp_like | harm_like, 0.5, b)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        cum_exp = qi / D * -np.expm1(-D * t)
+        cum_harm = qi / D * np.log1p(D * t)
+        cum_hyp = qi / ((1 - b_safe) * D) * (1 - np.power(1 + b_safe * D * t, (b_safe - 1) / b_safe))
+    cum = np.where(exp_like, cum_exp, np.where(harm_like, cum_harm, cum_hyp))
+    return np.where(D > 0, cum, qi * t)
+
+
+def switch_time(D, b, D_min):
+    """Time at which the hyperbolic instantaneous decline D/(1+bDt) falls to D_min."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_sw = (D / D_min - 1) / (b * D)
+    return np.where((b > B_EPS) & (D > D_min), t_sw, np.inf)
+
+
+def arps_rate(qi, D, b, t, D_min=None):
+    """Arps rate; with D_min the decline turns exponential once it reaches D_min (modified hyperbolic)."""
+    qi, D, b, t = (np.asarray(x, dtype=float) for x in (qi, D, b, t))
+    if D_min is None:
+        return _arps_rate(qi, D, b, t)
+    t_sw = switch_time(D, b, D_min)
+    q_sw = _arps_rate(qi, D, b, np.minimum(t, t_sw))
+    return q_sw * np.exp(-D_min * np.maximum(t - t_sw, 0))
+
+
+def arps_cumulative(qi, D, b, t, D_min=None):
+    """Cumulative production from 0 to t (rate units x time units of D)."""
+    qi, D, b, t = (np.asarray(x, dtype=float) for x in (qi, D, b, t))
+    if D_min is None:
+        return _arps_cumulative(qi, D, b, t)
+    t_sw = switch_time(D, b, D_min)
+    t_hyp = np.minimum(t, t_sw)
+    q_sw = _arps_rate(qi, D, b, t_hyp)
+    tail = q_sw / D_min * -np.expm1(-D_min * np.maximum(t - t_sw, 0))
+    return _arps_cumulative(qi, D, b, t_hyp) + tail
+
+
+def time_to_limit(qi, D, b, q_limit, D_min=None):
+    """Time at which the rate falls to the economic limit q_limit (0 if qi is already below it)."""
+    qi, D, b = (np.asarray(x, dtype=float) for x in (qi, D, b))
+    ratio = qi / q_limit
+    exp_like = b < B_EPS
+    b_safe = np.where(exp_like, 1.0, b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_lim = np.where(exp_like, np.log(ratio) / D, (ratio ** b_safe - 1) / (b_safe * D))
+        if D_min is not None:
+            t_sw = switch_time(D, b, D_min)
+            q_sw = _arps_rate(qi, D, b, np.where(np.isfinite(t_sw), t_sw, 0))
+            t_lim = np.where(t_lim > t_sw, t_sw + np.log(q_sw / q_limit) / D_min, t_lim)
+    return np.maximum(t_lim, 0)
+
+
+def arps_eur(qi, D, b, t_end=120, q_limit=None, D_min=None):
+    """Closed-form EUR up to t_end, stopping earlier at the economic limit if one is given."""
+    t_stop = np.asarray(t_end, dtype=float)
+    if q_limit is not None:
+        t_stop = np.minimum(t_stop, time_to_limit(qi, D, b, q_limit, D_min))
+    return arps_cumulative(qi, D, b, t_stop, D_min)
+
+
+def model_exponent(model, b=None):
+    return {"exponential": 0.0, "harmonic": 1.0, "hyperbolic": b}[model.lower()]
+
+
+def calculate_EUR (model, qi, D, b = None, t_end = 120, q_limit = None, D_min = None, method = "analytic"):
+    """
+    Rate forecast on a monthly grid plus EUR.
+    method="analytic" uses the closed-form cumulative; method="trapezoid" integrates
+    the monthly rates and is kept as a cross-check.
+    """
+    t = np.arange (0, t_end + 1)
+    b_model = model_exponent(model, b)
+    q = arps_rate (qi, D, b_model, t, D_min)
+    if q_limit is not None:
+        q = np.where (t <= time_to_limit(qi, D, b_model, q_limit, D_min), q, 0.0)
+    if method == "trapezoid":
+        from scipy.integrate import trapezoid     # scipy only for the numerical check
+        EUR = trapezoid (q, t)
+    else:
+        EUR = float (arps_eur(qi, D, b_model, t_end, q_limit, D_min))
+    return t, q, EUR
@@ -0,0 +1,92 @@
+"""
+Monte Carlo EUR for Arps declines.
+
+Parameters are sampled as whole arrays and every decline curve is evaluated
+by broadcasting, in chunks sized so no intermediate array exceeds
+`max_elements` values. Reserves convention: P90 is the low case (90 %
+probability of being exceeded), i.e. the 10th percentile.
+"""
+
+import numpy as np
+
+from .models import arps_eur, arps_rate, time_to_limit
+
+
+DISTRIBUTIONS = ["Fixed", "Uniform", "Triangular", "Normal", "Lognormal"]
+PERCENTILES = {"P90": 10, "P50": 50, "P10": 90}
+MAX_ELEMENTS = 2 ** 22     # ~32 MB of float64 per working block
+
+
+#🎲 Sampling
+def sample_distribution(rng, dist, params, n):
+    """
+    Draw n samples. params: Fixed (value), Uniform (low, high),
+    Triangular (low, mode, high), Normal (mean, std), Lognormal (mean, std).
+    """
+    if dist == "Fixed":
+        return np.full(n, float(params[0]))
+    if dist == "Uniform":
+        return rng.uniform(params[0], params[1], n)
+    if dist == "Triangular":
+        return rng.triangular(params[0], params[1], params[2], n)
+    if dist == "Normal":
+        return rng.normal(params[0], params[1], n)
+    if dist == "Lognormal":
+        mean, std = params
+        sigma2 = np.log1p((std / mean) ** 2)
+        return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), n)
+    raise ValueError(f"Unknown distribution: {dist}")
+
+
+def sample_parameters(qi_spec, D_spec, b_spec, n, seed=None):
+    """Sample (qi, D, b) from (dist, params) specs, clipped to physical ranges."""
+    rng = np.random.default_rng(seed)
+    qi = np.maximum(sample_distribution(rng, *qi_spec, n), 0.0)
+    D = np.maximum(sample_distribution(rng, *D_spec, n), 1e-9)
+    b = np.clip(sample_distribution(rng, *b_spec, n), 0.0, 2.0)
+    return qi, D, b
+
+
+#📊 Chunked Evaluation
+def probabilistic_eur(qi, D, b, t_end=120, q_limit=None, D_min=None, chunk_size=MAX_ELEMENTS):
+    eur = np.empty(len(qi))
+    for start in range(0, len(qi), chunk_size):
+        sl = slice(start, start + chunk_size)
+        eur[sl] = arps_eur(qi[sl], D[sl], b[sl], t_end, q_limit, D_min)
+    return eur
+
+
+def rate_percentiles(qi, D, b, t, q_limit=None, D_min=None, percentiles=(10, 50, 90),
+                     max_elements=MAX_ELEMENTS):
+    """
+    Rate percentiles at every time in t (array of shape (len(percentiles), len(t))).
+    Percentiles need all samples at once, so the broadcast is blocked over time.
+    """
+    t = np.asarray(t, dtype=float)
+    t_lim = None if q_limit is None else time_to_limit(qi, D, b, q_limit, D_min)
+    block = max(1, max_elements // max(len(qi), 1))
+    out = np.empty((len(percentiles), len(t)))
+    for start in range(0, len(t), block):
+        # rows are times, so each percentile partitions one contiguous row of samples
+        t_blk = t[start:start + block, None]
+        q = arps_rate(qi, D, b, t_blk, D_min)
+        if t_lim is not None:
+            q[t_blk > t_lim] = 0.0
+        out[:, start:start + block] = np.percentile(q, percentiles, axis=1)
+    return out
+
+
+def eur_summary(eur):
+    """P90/P50/P10 EUR plus the mean."""
+    summary = {name: float(np.percentile(eur, p)) for name, p in PERCENTILES.items()}
+    summary["Mean"] = float(eur.mean())
+    return summary
+
+
+def run_monte_carlo(qi_spec, D_spec, b_spec, n, t_end=120, q_limit=None, D_min=None, seed=None):
+    """Sample, evaluate EUR and fan-chart percentiles; returns (eur, t, fan) with fan rows P90/P50/P10."""
+    qi, D, b = sample_parameters(qi_spec, D_spec, b_spec, n, seed)
+    eur = probabilistic_eur(qi, D, b, t_end, q_limit, D_min)
+    t = np.arange(0, t_end + 1)
+    fan = rate_percentiles(qi, D, b, t, q_limit, D_min, percentiles=tuple(PERCENTILES.values()))
+    return eur, t, fan
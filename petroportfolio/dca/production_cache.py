@@ -0,0 +1,162 @@
+"""
+Columnar on-disk cache for production workbooks.
+
+The first load parses the Excel sheet once and writes every column as a typed
+.npy file (string columns as category codes) with rows grouped by well. Later
+loads memory-map only the requested columns and slice only the requested
+wells, so they skip openpyxl entirely. The cache is keyed on the source file's
+size/mtime, falling back to a SHA-256 of its contents when the mtime changed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_DIR_NAME = ".production_cache"
+DAILY_SHEET = "Daily Production Data"
+WELL_COLUMN = "WELL_BORE_CODE"
+MANIFEST = "manifest.json"
+
+
+#🔑 Cache Keys
+def _file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_dir_for(path, sheet=DAILY_SHEET):
+    path = Path(path)
+    sheet_slug = "".join(ch if ch.isalnum() else "_" for ch in sheet)
+    return path.parent / CACHE_DIR_NAME / path.stem / sheet_slug
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(cache_dir / MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_fresh(manifest, path, cache_dir):
+    """True if the cache matches the source; records the new mtime if only that moved."""
+    if manifest is None:
+        return False
+    stat = os.stat(path)
+    if stat.st_size != manifest["size"]:
+        return False
+    if stat.st_mtime_ns == manifest["mtime_ns"]:
+        return True
+    if _file_sha256(path) != manifest["sha256"]:
+        return False
+    manifest["mtime_ns"] = stat.st_mtime_ns
+    with open(cache_dir / MANIFEST, "w") as f:
+        json.dump(manifest, f)
+    return True
+
+
+#🏗️ Build
+def _column_kind(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "datetime"
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return "numeric"
+    return "category"
+
+
+def build_cache(path, sheet=DAILY_SHEET, well_column=WELL_COLUMN):
+    """Parse the sheet once and write the columnar cache; returns the manifest."""
+    path = Path(path)
+    cache_dir = cache_dir_for(path, sheet)
+    df = pd.read_excel(path, sheet_name=sheet)
+    df = df[df[well_column].notna()]
+    df = df.sort_values(well_column, kind="stable").reset_index(drop=True)
+
+    tmp_dir = cache_dir.with_name(cache_dir.name + f".tmp{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    columns = {}
+    for i, col in enumerate(df.columns):
+        kind = _column_kind(df[col])
+        file_name = f"col_{i}.npy"
+        entry = {"file": file_name, "kind": kind}
+        if kind == "datetime":
+            values = df[col].to_numpy(dtype="datetime64[ns]")
+        elif kind == "numeric":
+            values = df[col].to_numpy()
+        else:
+            cat = pd.Categorical(df[col].where(df[col].isna(), df[col].astype(str)))
+            values = cat.codes.astype(np.int32)
+            entry["categories"] = cat.categories.tolist()
+        np.save(tmp_dir / file_name, np.ascontiguousarray(values))
+        columns[str(col)] = entry
+
+    wells = df[well_column].astype(str).to_numpy()
+    starts = np.flatnonzero(np.r_[True, wells[1:] != wells[:-1]]) if len(wells) else np.array([], dtype=int)
+    stops = np.r_[starts[1:], len(wells)]
+    stat = os.stat(path)
+    manifest = {
+        "source": path.name,
+        "sheet": sheet,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _file_sha256(path),
+        "rows": len(df),
+        "well_column": well_column,
+        "columns": columns,
+        "wells": {wells[s]: [int(s), int(e)] for s, e in zip(starts, stops)},
+    }
+    with open(tmp_dir / MANIFEST, "w") as f:
+        json.dump(manifest, f)
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+    return manifest
+
+
+def open_cache(path, sheet=DAILY_SHEET, well_column=WELL_COLUMN):
+    """Return (cache_dir, manifest), rebuilding the cache if the source changed."""
+    cache_dir = cache_dir_for(path, sheet)
+    manifest = _read_manifest(cache_dir)
+    if _is_fresh(manifest, path, cache_dir) and manifest["well_column"] == well_column:
+        return cache_dir, manifest
+    return cache_dir, build_cache(path, sheet, well_column)
+
+
+#📥 Load
+def list_wells(path, sheet=DAILY_SHEET, well_column=WELL_COLUMN):
+    _, manifest = open_cache(path, sheet, well_column)
+    return list(manifest["wells"])
+
+
+def load_production(path, wells=None, columns=None, sheet=DAILY_SHEET, well_column=WELL_COLUMN):
+    """
+    Load production rows for the given wells and columns (default: all) from the cache.
+    Only the requested column files are mapped and only the requested well ranges copied.
+    """
+    cache_dir, manifest = open_cache(path, sheet, well_column)
+    columns = list(manifest["columns"]) if columns is None else list(columns)
+    if wells is None:
+        ranges = [(0, manifest["rows"])]
+    else:
+        ranges = [tuple(manifest["wells"][w]) for w in wells if w in manifest["wells"]]
+
+    data = {}
+    for col in columns:
+        entry = manifest["columns"][col]
+        arr = np.load(cache_dir / entry["file"], mmap_mode="r")
+        values = np.concatenate([arr[s:e] for s, e in ranges]) if ranges else arr[:0].copy()
+        if entry["kind"] == "category":
+            values = pd.Categorical.from_codes(values, entry["categories"])
+        data[col] = values
+    return pd.DataFrame(data)
@@ -0,0 +1,24 @@
+"""Gas lift: dual-string sensitivity grid, multiphase well performance and marginal-gain gas allocation."""
+
+from .._lazy import lazy_exports
+
+
+_EXPORTS = {
+    "GasLiftInputs": "sensitivity",
+    "default_grid": "sensitivity",
+    "evaluate_points": "sensitivity",
+    "iter_sensitivity": "sensitivity",
+    "sensitivity_table": "sensitivity",
+    "write_sensitivity": "sensitivity",
+    "WellModel": "performance",
+    "well_model": "performance",
+    "operating_rate": "performance",
+    "sweep": "performance",
+    "allocate": "allocation",
+    "allocation_table": "allocation",
+    "hull_segments": "allocation",
+    "string_curves": "allocation",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,166 @@
+"""
+Field-wide gas-lift gas allocation across many strings.
+
+Each string has a performance curve (oil rate vs gas injection rate, e.g. from
+gl_performance). Gas goes where it buys the most: every curve is replaced by
+its upper concave hull, the hull segments of all strings are sorted by slope
+(marginal oil, or marginal profit, per Mscf/d) and taken in that order until
+the compressor gas is used up; the last segment is taken partially. This is
+the equal-slope solution: at the optimum every string that gets more than its
+minimum sits at the same marginal rate, the shadow price of gas.
+
+The sorting is done once per set of curves (hull_segments); allocate() is then
+a cumulative-sum search, so a new compressor availability is re-allocated in
+microseconds.
+
+    python -m petroportfolio.gaslift.allocation string_curves.csv --budget 60000 --objective profit
+"""
+
+import argparse
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+CURVE_COLUMNS = ["String", "GIR", "Oil Rate"]     # GIR in Mscf/d, oil in STB/d
+ALLOCATION_COLUMNS = ["String", "GIR", "Oil Rate", "Profit", "Marginal"]
+OIL_PRICE = 65.0        # USD/bbl, as in DSGL_SensitivityAnalysis.ipynb
+GAS_PRICE = 3.7         # USD/Mscf
+
+
+class Segments(NamedTuple):
+    names: list             # string names, in curve order
+    gir: np.ndarray         # (n_strings, n_points) sampled curves
+    oil: np.ndarray
+    base: np.ndarray        # minimum GIR per string (first curve point)
+    string: np.ndarray      # owner of each hull segment, best slope first
+    width: np.ndarray       # Mscf/d covered by each segment
+    slope: np.ndarray       # marginal objective per Mscf/d
+    cum_width: np.ndarray   # cumulative width in slope order
+
+
+class Allocation(NamedTuple):
+    gir: np.ndarray         # Mscf/d per string
+    oil: np.ndarray         # STB/d per string (on the sampled curve)
+    marginal: float         # slope of the last segment taken (shadow price of gas)
+    gas_used: float         # Mscf/d, including the strings' minimum GIR
+
+
+#📈 Curves
+def objective(gir, oil, kind="oil", oil_price=OIL_PRICE, gas_price=GAS_PRICE):
+    """Value to maximise: oil rate, or daily profit (oil revenue - injection gas cost)."""
+    if kind == "oil":
+        return np.asarray(oil, dtype=float)
+    if kind == "profit":
+        return np.asarray(oil) * oil_price - np.asarray(gir) * gas_price
+    raise ValueError(f"Unknown objective: {kind}")
+
+
+def upper_hull(x, y):
+    """Indices of the upper concave hull of points sorted by x (monotone chain)."""
+    hull = []
+    for i in range(len(x)):
+        while len(hull) >= 2:
+            a, b = hull[-2], hull[-1]
+            # drop b if it lies on or below the chord a -> i
+            if (y[b] - y[a]) * (x[i] - x[a]) <= (y[i] - y[a]) * (x[b] - x[a]):
+                hull.pop()
+            else:
+                break
+        hull.append(i)
+    return np.array(hull)
+
+
+def curves_from_table(df):
+    """(names, gir, oil) arrays from a long String / GIR / Oil Rate table; every string needs the same number of points."""
+    missing = [col for col in CURVE_COLUMNS if col not in df.columns]
+    if missing:
+        raise KeyError(f"Curve table is missing columns: {missing}")
+    df = df.sort_values(["String", "GIR"], kind="stable")
+    names = list(df["String"].drop_duplicates())
+    sizes = df.groupby("String", sort=False).size()
+    if sizes.nunique() != 1:
+        raise ValueError("every string must have the same number of curve points")
+    shape = (len(names), int(sizes.iloc[0]))
+    return names, df["GIR"].to_numpy(dtype=float).reshape(shape), df["Oil Rate"].to_numpy(dtype=float).reshape(shape)
+
+
+def string_curves(models, pvt, gir_values, dome_p, delta_p):
+    """Long String / GIR / Oil Rate table from gaslift.performance well models (name -> WellModel)."""
+    from .performance import operating_rate
+
+    gir_values = np.asarray(gir_values, dtype=float)
+    frames = []
+    for name, model in models.items():
+        q, _, _ = operating_rate(gir_values, model.pi, dome_p, delta_p, model, pvt)
+        frames.append(pd.DataFrame({"String": name, "GIR": gir_values, "Oil Rate": q}))
+    return pd.concat(frames, ignore_index=True)
+
+
+#⚖️ Equal-Slope Allocation
+def hull_segments(names, gir, oil, kind="oil", oil_price=OIL_PRICE, gas_price=GAS_PRICE):
+    """Hull segments with a positive slope for every string, sorted best slope first."""
+    gir = np.asarray(gir, dtype=float)
+    oil = np.asarray(oil, dtype=float)
+    value = objective(gir, oil, kind, oil_price, gas_price)
+    owner, width, slope = [], [], []
+    for s in range(len(gir)):
+        idx = upper_hull(gir[s], value[s])
+        dx = np.diff(gir[s][idx])
+        dy = np.diff(value[s][idx])
+        keep = (dx > 0) & (dy > 0)
+        owner.append(np.full(np.count_nonzero(keep), s))
+        width.append(dx[keep])
+        slope.append(dy[keep] / dx[keep])
+    owner, width, slope = (np.concatenate(x) for x in (owner, width, slope))
+    order = np.argsort(-slope, kind="stable")
+    return Segments(list(names), gir, oil, gir[:, 0].copy(), owner[order], width[order], slope[order],
+                    np.cumsum(width[order]))
+
+
+def allocate(segments, budget):
+    """Split `budget` Mscf/d of injection gas across the strings (minimum GIR first, then by slope)."""
+    seg = segments
+    spare = budget - seg.base.sum()
+    if spare < 0:
+        raise ValueError(f"budget {budget:g} Mscf/d is below the strings' minimum GIR {seg.base.sum():g}")
+    n_full = int(np.searchsorted(seg.cum_width, spare, side="right"))
+    taken = seg.width.copy()
+    taken[n_full + 1:] = 0
+    if n_full < len(taken):
+        taken[n_full] = spare - (seg.cum_width[n_full - 1] if n_full else 0.0)
+    gir = seg.base + np.bincount(seg.string, weights=taken, minlength=len(seg.base))
+    oil = np.array([np.interp(g, x, q) for g, x, q in zip(gir, seg.gir, seg.oil)])
+    last = n_full if n_full < len(taken) and taken[n_full] > 0 else n_full - 1
+    marginal = float(seg.slope[last]) if last >= 0 else 0.0
+    return Allocation(gir, oil, marginal, float(gir.sum()))
+
+
+def allocation_table(segments, allocation, oil_price=OIL_PRICE, gas_price=GAS_PRICE):
+    return pd.DataFrame({
+        "String": segments.names,
+        "GIR": allocation.gir,
+        "Oil Rate": allocation.oil,
+        "Profit": objective(allocation.gir, allocation.oil, "profit", oil_price, gas_price),
+        "Marginal": allocation.marginal,
+    }, columns=ALLOCATION_COLUMNS)
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Allocate compressor gas across gas-lifted strings.")
+    parser.add_argument("curves", help="CSV with String, GIR (Mscf/d) and Oil Rate (STB/d) columns")
+    parser.add_argument("--budget", type=float, required=True, help="available injection gas (Mscf/d)")
+    parser.add_argument("--objective", choices=["oil", "profit"], default="oil")
+    parser.add_argument("--oil-price", type=float, default=OIL_PRICE)
+    parser.add_argument("--gas-price", type=float, default=GAS_PRICE)
+    parser.add_argument("--output", default="gas_allocation.csv")
+    args = parser.parse_args()
+
+    names, gir, oil = curves_from_table(pd.read_csv(args.curves))
+    segments = hull_segments(names, gir, oil, args.objective, args.oil_price, args.gas_price)
+    allocation = allocate(segments, args.budget)
+    allocation_table(segments, allocation, args.oil_price, args.gas_price).to_csv(args.output, index=False)
+    print(f"Allocated {allocation.gas_used:.0f} of {args.budget:.0f} Mscf/d, "
+          f"{allocation.oil.sum():.0f} STB/d oil, marginal {allocation.marginal:.4g}/Mscf -> {args.output}")
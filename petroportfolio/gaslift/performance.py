@@ -0,0 +1,149 @@
+"""
+Gas-lift well performance from PVT and well-test data.
+
+Oil rate for any combination of gas injection rate, productivity index, dome
+pressure and pressure drop between valves, computed live instead of read from
+the precomputed sensitivity_*.csv files:
+
+- IPR: straight line q = PI * (P_res - Pwf), PI from the latest well test and a given P_res;
+- valves: unloading valves are spaced down the well, each one closing ∆P lower than
+  the one above, until casing gas pressure can no longer reach the next depth; the
+  deepest valve is the injection point;
+- VLP: the segmented multiphase traverse of Nodal_Analysis/vlp_traverse.py, with
+  Bo / Bg / Rs / μo from PVT lookup tables built once per PVT data set; formation +
+  injected gas above the injection point, formation gas below;
+- operating point: IPR/VLP intersection from nodal.solver, solved for every
+  sensitivity point at once.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ..nodal.pvt_tables import build_tables
+from ..nodal.solver import find_operating_points
+from ..nodal.vlp_traverse import Tubing, traverse
+
+
+WELL_COLUMNS = ["THP (psig)", "FBHP (psia)", "Q_oil (STB/d)", "WCT (%)", "GOR (scf/STB)"]
+
+# sensitivity name (as in the sensitivity_*.csv files) -> keyword, units
+SWEEP_PARAMS = {
+    "Gas Injection Rate": ("gir", "Mscf/d"),
+    "Productivity Index": ("pi", "STB/d/psi"),
+    "Dome Pressure": ("dome_p", "psia"),
+    "Pressure Drop between Valves": ("delta_p", "psi"),
+}
+
+PSIA = 14.7
+DEFAULT_P_RES = 3500.0      # psia, the well tests are single-rate so P_res is an input
+N_SEGMENTS = 20             # traverse segments above / below the injection point
+
+
+class WellModel(NamedTuple):
+    p_res: float            # psia
+    pi: float               # STB/d/psi
+    thp: float              # psia
+    wct: float = 0.0        # fraction
+    gor: float = 0.0        # scf/STB, formation gas
+    depth: float = 8000.0   # ft, deepest valve / perforations
+    tubing_id: float = 2.441
+    oil_sg: float = 0.85
+    gas_sg: float = 0.7
+    water_sg: float = 1.05
+    t_avg: float = 610.0            # °R, casing gas column
+    z_avg: float = 0.9
+    design_gradient: float = 0.1    # psi/ft, tubing during unloading
+    kill_gradient: float = 0.45     # psi/ft, kill fluid in the annulus
+    max_valves: int = 10
+
+
+#📥 Inputs
+def pvt_table(pvt_df):
+    """PVT lookup tables (pvt_tables.PvtTables) from a sample_pvt_data.csv-style frame."""
+    return build_tables(pvt_df)
+
+
+def productivity_index(well_df, p_res):
+    """PI (STB/d/psi) of the latest well test against reservoir pressure p_res."""
+    latest = well_df.iloc[-1]
+    drawdown = p_res - float(latest["FBHP (psia)"])
+    if drawdown <= 0:
+        raise ValueError(f"reservoir pressure {p_res:g} psia is not above the test FBHP")
+    return float(latest["Q_oil (STB/d)"]) / drawdown
+
+
+def well_model(well_df, p_res=DEFAULT_P_RES, **overrides):
+    """WellModel from a sample_well_data.csv-style frame: PI, THP, WCT and GOR of the latest test."""
+    missing = [col for col in WELL_COLUMNS if col not in well_df.columns]
+    if missing:
+        raise KeyError(f"Well test data is missing columns: {missing}")
+    if "Test Date" in well_df.columns:
+        well_df = well_df.sort_values("Test Date")
+    latest = well_df.iloc[-1]
+    values = dict(p_res=p_res, pi=productivity_index(well_df, p_res), thp=float(latest["THP (psig)"]) + PSIA,
+                  wct=float(latest["WCT (%)"]) / 100, gor=float(latest["GOR (scf/STB)"]))
+    values.update(overrides)
+    return WellModel(**values)
+
+
+#🛢️ Tubing
+def tubing(model):
+    return Tubing(tubing_id=model.tubing_id, oil_sg=model.oil_sg, gas_sg=model.gas_sg, water_sg=model.water_sg)
+
+
+#🎛️ Valves
+def injection_depth(dome_p, delta_p, model):
+    """Depth (ft) of the deepest unloading valve the casing gas can reach."""
+    c = model.gas_sg / (53.34 * model.z_avg * model.t_avg)         # casing gas column: dp/dz = c * p
+    dome_p, delta_p = np.broadcast_arrays(np.asarray(dome_p, dtype=float), np.asarray(delta_p, dtype=float))
+    depth = np.zeros(dome_p.shape)
+    for k in range(model.max_valves):
+        p_casing = (dome_p - k * delta_p) * np.exp(c * depth)
+        p_tubing = model.thp + model.design_gradient * depth
+        gain = (p_casing - p_tubing) / model.kill_gradient
+        depth = np.where(gain > 0, np.minimum(depth + gain, model.depth), depth)
+    return depth
+
+
+def bottomhole_pressure(q_oil, gir, inj_depth, model, pvt):
+    """Flowing BHP (psia) for oil rate q_oil with gir Mscf/d injected at inj_depth."""
+    q_liq = q_oil / (1 - model.wct)
+    glr = model.gor * (1 - model.wct)                               # formation gas per STB liquid
+    glr_lifted = glr + gir * 1000 / np.maximum(q_liq, 1e-6)
+    pipe = tubing(model)
+    p_inj = traverse(model.thp, inj_depth, q_liq, glr_lifted, model.wct, pvt, pipe, N_SEGMENTS)
+    return traverse(p_inj, model.depth - inj_depth, q_liq, glr, model.wct, pvt, pipe, N_SEGMENTS)
+
+
+#🎯 Operating Point
+def operating_rate(gir, pi, dome_p, delta_p, model, pvt, xtol=0.01):
+    """Oil rate, Pwf and injection depth for every broadcast combination of the four sensitivities."""
+    gir, pi, dome_p, delta_p = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (gir, pi, dome_p, delta_p)))
+    shape = gir.shape
+    gir, pi = gir.reshape(-1), pi.reshape(-1)
+    inj_depth = injection_depth(dome_p, delta_p, model).reshape(-1)
+    cols = [x[:, None] for x in (gir, pi, inj_depth)]
+
+    def residual(q):
+        gir_, pi_, depth_ = cols
+        return (model.p_res - q / pi_) - bottomhole_pressure(q, gir_, depth_, model, pvt)
+
+    q, _ = find_operating_points(residual, pi * model.p_res, xtol=xtol)
+    q = np.nan_to_num(q)                                  # no intersection: the well does not flow
+    pwf = model.p_res - q / pi
+    return q.reshape(shape), pwf.reshape(shape), inj_depth.reshape(shape)
+
+
+def sweep(param, values, model, pvt, base):
+    """
+    One-parameter sensitivity: `param` is a SWEEP_PARAMS name, `base` maps the
+    keywords gir / pi / dome_p / delta_p to the values held fixed.
+    """
+    key = SWEEP_PARAMS[param][0]
+    inputs = {**base, key: np.asarray(values, dtype=float)}
+    q, pwf, inj_depth = operating_rate(inputs["gir"], inputs["pi"], inputs["dome_p"], inputs["delta_p"],
+                                       model, pvt)
+    return pd.DataFrame({param: inputs[key], "Oil Rate": q, "Pwf": pwf, "Injection Depth": inj_depth})
@@ -0,0 +1,218 @@
+"""
+Vectorised dual-string gas-lift sensitivity grid.
+
+Same equations as sections 4-6 of DSGL_SensitivityAnalysis.ipynb
+(calc_energy_eff, est_CO2_emiss and the GIR / PI / DomeP / DeltaP loop),
+evaluated on NumPy arrays instead of one dict per grid point:
+
+    Q_liq      = PI * (P_res - P_surface)                       short and long string
+    comp_work  = n/(n-1) * P_surface * GIR * ((DomeP/P_surface)^(n-1) - 1)
+    fluid_work = (Q_short + Q_long) + bbl_to_ft3 * rho_liquid * g * H
+    CO2        = 0.10 * GIR * 1030 / 1e6 * 53.06 / 1000        t/d
+    Profit     = (Q_short + Q_long) * oil_price - GIR/1000 * gas_price
+
+Rows come out in the notebook's loop order (GIR outermost, DeltaP innermost),
+with the notebook's column names. The grid is walked in chunks of flat
+indices, so memory is bounded by the chunk however many points there are;
+stream big grids to CSV / Parquet with write_sensitivity.
+
+    python -m petroportfolio.gaslift.sensitivity --output Gas_Lift_Sensitivity_Results.csv
+    python -m petroportfolio.gaslift.sensitivity --check Gas_Lift_Sensitivity_Results.csv
+"""
+
+import argparse
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+CHUNK_SIZE = 1 << 20
+
+# calc_energy_eff constants
+POLYTROPIC_N = 1.03         # polytropic exponent
+G = 32.174                  # ft/s²
+RHO_LIQUID = 50             # lb/ft³
+LIFT_HEIGHT = 4000          # ft
+BBL_TO_FT3 = 5.615
+
+# est_CO2_emiss constants
+HEATING_VALUE = 1030        # Btu/scf
+EMISSION_FACTOR = 53.06     # kg CO₂/MMBtu
+
+GRID_PARAMS = ["GIR", "PI", "DomeP", "DeltaP"]
+RESULT_COLUMNS = GRID_PARAMS + ["Q_liq_short", "Q_liq_long", "Energy Efficiency", "CO2_emission",
+                                "Revenue", "Gas_Cost", "Profit"]
+
+
+class GasLiftInputs(NamedTuple):
+    p_res_short: float = 1196.0     # psia
+    p_res_long: float = 1362.0      # psia
+    p_surface: float = 100.0        # psia
+    oil_price: float = 65.0         # USD/bbl
+    gas_price: float = 3.7          # USD/Mscf
+    fuel_fraction: float = 0.10     # share of injected gas burnt as compressor fuel
+
+
+def default_grid():
+    """Section 3 sensitivity ranges of the notebook."""
+    return {
+        "GIR": np.linspace(0.5E06, 3.0E06, 6),      # scf/d
+        "PI": np.linspace(0.8, 1.5, 5),             # STB/d/psi
+        "DomeP": np.linspace(1800, 2400, 4),        # psia
+        "DeltaP": np.linspace(50, 300, 6),          # psia
+    }
+
+
+#⚙️ Equations
+def energy_efficiency(gir, q_short, q_long, dome_p, p_surface):
+    """calc_energy_eff on arrays: fluid lifting work / compression work, 0 where no compression work."""
+    n = POLYTROPIC_N
+    comp_work = (n / (n - 1)) * p_surface * gir * (((dome_p / p_surface) ** (n - 1) - 1))
+    fluid_work = (q_short + q_long) + BBL_TO_FT3 * RHO_LIQUID * G * LIFT_HEIGHT
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(comp_work != 0, fluid_work / comp_work, 0.0)
+
+
+def co2_emission(fuel_scf_per_day, heating_value=HEATING_VALUE, emission_factor=EMISSION_FACTOR):
+    """est_CO2_emiss on arrays, metric tons CO₂/day."""
+    return fuel_scf_per_day * heating_value / 1E06 * emission_factor / 1000
+
+
+def evaluate_points(gir, pi, dome_p, delta_p, inputs=None):
+    """All result columns for matching 1-D arrays of grid points."""
+    p = inputs or GasLiftInputs()
+    q_short = pi * (p.p_res_short - p.p_surface)
+    q_long = pi * (p.p_res_long - p.p_surface)
+    revenue = (q_short + q_long) * p.oil_price
+    gas_cost = (gir / 1000) * p.gas_price
+    return {
+        "GIR": gir,
+        "PI": pi,
+        "DomeP": dome_p,
+        "DeltaP": delta_p,
+        "Q_liq_short": q_short,
+        "Q_liq_long": q_long,
+        "Energy Efficiency": energy_efficiency(gir, q_short, q_long, dome_p, p.p_surface),
+        "CO2_emission": co2_emission(gir * p.fuel_fraction),
+        "Revenue": revenue,
+        "Gas_Cost": gas_cost,
+        "Profit": revenue - gas_cost,
+    }
+
+
+#🧮 Grid
+def grid_shape(grid):
+    return tuple(len(grid[name]) for name in GRID_PARAMS)
+
+
+def iter_sensitivity(grid=None, inputs=None, chunk_size=CHUNK_SIZE):
+    """Yield dicts of result columns for consecutive blocks of the grid, in loop order."""
+    grid = grid or default_grid()
+    axes = [np.asarray(grid[name], dtype=np.float64) for name in GRID_PARAMS]
+    shape = grid_shape(grid)
+    n_points = int(np.prod(shape))
+    for start in range(0, n_points, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, n_points))
+        idx = np.unravel_index(flat, shape)          # C order = GIR outermost, DeltaP innermost
+        yield evaluate_points(*(axis[i] for axis, i in zip(axes, idx)), inputs)
+
+
+def sensitivity_table(grid=None, inputs=None, chunk_size=CHUNK_SIZE):
+    """Whole grid as one DataFrame (columns filled chunk by chunk into preallocated arrays)."""
+    grid = grid or default_grid()
+    n_points = int(np.prod(grid_shape(grid)))
+    columns = {name: np.empty(n_points) for name in RESULT_COLUMNS}
+    start = 0
+    for chunk in iter_sensitivity(grid, inputs, chunk_size):
+        stop = start + len(chunk["GIR"])
+        for name in RESULT_COLUMNS:
+            columns[name][start:stop] = chunk[name]
+        start = stop
+    return pd.DataFrame(columns, columns=RESULT_COLUMNS, copy=False)
+
+
+def write_sensitivity(output, grid=None, inputs=None, chunk_size=CHUNK_SIZE):
+    """Stream the grid to CSV, or to Parquet (one row group per chunk) if output ends in .parquet."""
+    chunks = iter_sensitivity(grid, inputs, chunk_size)
+    n_rows = 0
+    if str(output).endswith(".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([(name, pa.float64()) for name in RESULT_COLUMNS])
+        with pq.ParquetWriter(output, schema) as writer:
+            for chunk in chunks:
+                writer.write_table(pa.table(chunk, schema=schema))
+                n_rows += len(chunk["GIR"])
+        return n_rows
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        for i, chunk in enumerate(chunks):
+            pd.DataFrame(chunk, columns=RESULT_COLUMNS, copy=False).to_csv(f, index=False, header=(i == 0))
+            n_rows += len(chunk["GIR"])
+    return n_rows
+
+
+#✅ Check
+def check_results(reference, grid=None, inputs=None, rtol=1e-9, atol=1e-12):
+    """
+    Compare the engine with a results table written by the notebook loop (DataFrame or
+    CSV / Parquet path). Returns {column: max abs difference}; raises ValueError on mismatch.
+    """
+    if not isinstance(reference, pd.DataFrame):
+        path = str(reference)
+        reference = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    if grid is None:
+        grid = {name: np.unique(reference[name].to_numpy(dtype=float)) for name in GRID_PARAMS}
+    result = sensitivity_table(grid, inputs)
+    if len(result) != len(reference):
+        raise ValueError(f"row count differs: engine {len(result)}, reference {len(reference)}")
+    diffs, bad = {}, []
+    for name in RESULT_COLUMNS:
+        ref = reference[name].to_numpy(dtype=float)
+        new = result[name].to_numpy()
+        diffs[name] = float(np.max(np.abs(new - ref), initial=0.0))
+        if not np.allclose(new, ref, rtol=rtol, atol=atol):
+            bad.append(name)
+    if bad:
+        raise ValueError(f"columns differ from reference: {', '.join(bad)}")
+    return diffs
+
+
+#🧪 Command Line Entry
+def _axis(values):
+    start, stop, num = values
+    return np.linspace(float(start), float(stop), int(num))
+
+
+if __name__ == "__main__":
+    defaults = GasLiftInputs()
+    parser = argparse.ArgumentParser(description="Dual-string gas-lift sensitivity grid.")
+    parser.add_argument("--output", default=None, help="CSV or .parquet file to stream the grid to")
+    parser.add_argument("--check", default=None, help="notebook results CSV / Parquet to compare against")
+    parser.add_argument("--gir", nargs=3, metavar=("START", "STOP", "NUM"), default=None)
+    parser.add_argument("--pi", nargs=3, metavar=("START", "STOP", "NUM"), default=None)
+    parser.add_argument("--domep", nargs=3, metavar=("START", "STOP", "NUM"), default=None)
+    parser.add_argument("--deltap", nargs=3, metavar=("START", "STOP", "NUM"), default=None)
+    parser.add_argument("--p-res-short", type=float, default=defaults.p_res_short)
+    parser.add_argument("--p-res-long", type=float, default=defaults.p_res_long)
+    parser.add_argument("--p-surface", type=float, default=defaults.p_surface)
+    parser.add_argument("--oil-price", type=float, default=defaults.oil_price)
+    parser.add_argument("--gas-price", type=float, default=defaults.gas_price)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    inputs = GasLiftInputs(args.p_res_short, args.p_res_long, args.p_surface, args.oil_price, args.gas_price)
+    grid = default_grid()
+    for name, values in zip(GRID_PARAMS, (args.gir, args.pi, args.domep, args.deltap)):
+        if values is not None:
+            grid[name] = _axis(values)
+
+    if args.check:
+        diffs = check_results(args.check, inputs=inputs)
+        print(f"Matches {args.check}: max abs difference {max(diffs.values()):.3g}")
+    if args.output:
+        n_rows = write_sensitivity(args.output, grid, inputs, args.chunk_size)
+        print(f"Wrote {n_rows} grid points -> {args.output}")
+    if not args.check and not args.output:
+        print(sensitivity_table(grid, inputs).head())
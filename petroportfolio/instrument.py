@@ -0,0 +1,280 @@
+"""
+Per-stage timing (and optional memory) spans for the Streamlit apps and batch jobs.
+
+    from petroportfolio import instrument
+
+    rec = instrument.start("LAS explorer")          # off unless requested (see below)
+    with instrument.span("LAS decode"):
+        las = read_las(data)
+
+    @instrument.timed("render")
+    def draw(...): ...
+
+    instrument.streamlit_panel(rec)                 # collapsible breakdown; nothing when off
+
+A recorder lives for one rerun and is bound to the running thread / context,
+so concurrent Streamlit sessions do not mix spans or timings. Spans nest: each
+records its parent, depth, wall time and, with memory tracking, the tracemalloc
+peak above the memory in use when it started. tracemalloc is process-wide:
+tracing runs while any memory recorder is open, but peaks are only
+attributable when one session profiles memory at a time (concurrent sessions
+count each other's allocations and reset each other's peaks).
+
+Recording is requested with the PETRO_INSTRUMENT environment variable or the
+`?profile=` query parameter of an app URL: "1" for timings, "memory" for
+timings plus tracemalloc peaks. PETRO_INSTRUMENT_LOG=<path> appends every
+finished recorder's spans to a JSON-lines file. When nothing is requested,
+span() returns a shared no-op context manager and timed() wrappers make one
+context-variable lookup per call.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import NamedTuple
+
+
+ENV_VAR = "PETRO_INSTRUMENT"
+LOG_ENV_VAR = "PETRO_INSTRUMENT_LOG"
+QUERY_PARAM = "profile"
+MEMORY_MODES = {"memory", "mem"}
+OFF_MODES = {"", "0", "off", "false", "no"}
+
+_current = contextvars.ContextVar("petroportfolio_recorder", default=None)
+_tracing_lock = threading.Lock()
+_tracing_users = 0          # open memory recorders
+_owns_tracing = False       # tracemalloc was started here, not by the host process
+
+
+class Span(NamedTuple):
+    name: str
+    parent: str             # enclosing span name, "" at top level
+    depth: int
+    start_s: float          # seconds since the recorder started
+    duration_s: float
+    peak_bytes: int         # tracemalloc peak above the start of the span, -1 when not tracked
+
+
+class _NullSpan:
+    """Shared do-nothing context manager returned while recording is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("recorder", "name", "t0", "mem0", "mem_peak")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        rec = self.recorder
+        if rec.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if rec._stack:
+                # fold the peak so far into the parent before resetting it for this span
+                parent = rec._stack[-1]
+                parent.mem_peak = max(parent.mem_peak, peak)
+            tracemalloc.reset_peak()
+            self.mem0 = self.mem_peak = current
+        rec._stack.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        t1 = time.perf_counter()
+        rec = self.recorder
+        rec._stack.pop()
+        peak_bytes = -1
+        if rec.trace_memory:
+            self.mem_peak = max(self.mem_peak, tracemalloc.get_traced_memory()[1])
+            peak_bytes = self.mem_peak - self.mem0
+            if rec._stack:
+                rec._stack[-1].mem_peak = max(rec._stack[-1].mem_peak, self.mem_peak)
+        parent = rec._stack[-1].name if rec._stack else ""
+        rec.spans.append(Span(self.name, parent, len(rec._stack), self.t0 - rec.t0, t1 - self.t0, peak_bytes))
+        return False
+
+
+class Recorder:
+    """Spans of one rerun / job, in completion order."""
+
+    def __init__(self, label="", enabled=True, trace_memory=False):
+        self.label = label
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.spans = []
+        self._stack = []
+        self._tracing = False
+        self.t0 = time.perf_counter()
+        self.wall_start = time.time()
+        self.total_s = None
+        if self.trace_memory:
+            _acquire_tracing()
+            self._tracing = True
+
+    def span(self, name):
+        return _ActiveSpan(self, name) if self.enabled else NULL_SPAN
+
+    def finish(self):
+        """Stop the clock (and tracemalloc once no memory recorder is left); idempotent."""
+        if self.total_s is None:
+            self.total_s = time.perf_counter() - self.t0
+            if self._tracing:
+                _release_tracing()
+                self._tracing = False
+        return self
+
+    def records(self):
+        """Spans as dicts in start order, with the recorder label and wall-clock start."""
+        return [{"label": self.label, "run_start": self.wall_start, **s._asdict()}
+                for s in sorted(self.spans, key=lambda s: s.start_s)]
+
+    def breakdown(self):
+        """Rows (indented name, ms, % of the run, peak MiB or None) in start order."""
+        total = self.total_s if self.total_s is not None else time.perf_counter() - self.t0
+        rows = []
+        for s in sorted(self.spans, key=lambda s: s.start_s):
+            rows.append({
+                "Stage": "  " * s.depth + s.name,
+                "ms": s.duration_s * 1e3,
+                "% of run": 100 * s.duration_s / total if total > 0 else 0.0,
+                "Peak MiB": s.peak_bytes / 2**20 if s.peak_bytes >= 0 else None,
+            })
+        return rows
+
+    def dump(self, path):
+        """Append this recorder's spans to a JSON-lines file."""
+        with open(path, "a") as f:
+            for record in self.records():
+                f.write(json.dumps(record) + "\n")
+
+
+def _acquire_tracing():
+    global _tracing_users, _owns_tracing
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    global _tracing_users, _owns_tracing
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+#🎛️ Current Recorder
+def mode_from(value):
+    """None (off), "time" or "memory" from an env / query-parameter value."""
+    value = "" if value is None else str(value).strip().lower()
+    if value in OFF_MODES:
+        return None
+    return "memory" if value in MEMORY_MODES else "time"
+
+
+def requested_mode():
+    """Recording mode asked for by PETRO_INSTRUMENT or, inside a Streamlit app, ?profile=."""
+    mode = mode_from(os.environ.get(ENV_VAR))
+    st = sys.modules.get("streamlit")       # only look at the URL if an app already imported Streamlit
+    if mode is None and st is not None:
+        try:
+            mode = mode_from(st.query_params.get(QUERY_PARAM))
+        except Exception:                   # no script run context (bare mode, tests)
+            mode = None
+    return mode
+
+
+def start(label="", mode="auto"):
+    """Bind a new recorder to the current context; mode "auto" uses requested_mode()."""
+    mode = requested_mode() if mode == "auto" else mode
+    previous = _current.get()
+    if previous is not None:
+        finish(previous)
+    rec = Recorder(label, enabled=mode is not None, trace_memory=mode == "memory")
+    _current.set(rec)
+    return rec
+
+
+def current():
+    return _current.get()
+
+
+def finish(rec=None):
+    """Finish the recorder, append it to PETRO_INSTRUMENT_LOG if set, and unbind it."""
+    rec = rec or _current.get()
+    if rec is None:
+        return None
+    if rec.enabled and rec.total_s is None:
+        rec.finish()
+        log_path = os.environ.get(LOG_ENV_VAR)
+        if log_path:
+            rec.dump(log_path)
+    rec.finish()
+    if _current.get() is rec:
+        _current.set(None)
+    return rec
+
+
+def span(name):
+    """Context manager timing `name` under the current recorder (a no-op when off)."""
+    rec = _current.get()
+    if rec is None or not rec.enabled:
+        return NULL_SPAN
+    return _ActiveSpan(rec, name)
+
+
+def timed(name=None):
+    """Decorator form of span(); the span is named after the function unless given."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            rec = _current.get()
+            if rec is None or not rec.enabled:
+                return func(*args, **kwargs)
+            with _ActiveSpan(rec, label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+#📊 Streamlit Panel
+def streamlit_panel(rec=None, expanded=False):
+    """Finish the recorder and show its per-stage breakdown in a collapsed expander, with a JSON download."""
+    rec = finish(rec)
+    if rec is None or not rec.enabled:
+        return
+    import pandas as pd
+    import streamlit as st
+
+    table = pd.DataFrame(rec.breakdown(), columns=["Stage", "ms", "% of run", "Peak MiB"])
+    with st.expander(f"⏱️ Rerun timing: {rec.total_s * 1e3:.0f} ms, {len(rec.spans)} stages", expanded=expanded):
+        st.dataframe(table, hide_index=True, column_config={
+            "ms": st.column_config.NumberColumn(format="%.1f"),
+            "% of run": st.column_config.NumberColumn(format="%.1f"),
+            "Peak MiB": st.column_config.NumberColumn(format="%.2f"),
+        })
+        st.caption("Stages not wrapped in a span (widgets, layout, cached calls) make up the rest of the run.")
+        st.download_button("Download spans (JSON lines)",
+                           data="".join(json.dumps(r) + "\n" for r in rec.records()),
+                           file_name="spans.jsonl", mime="application/x-ndjson", on_click="ignore")
@@ -0,0 +1,28 @@
+"""Nodal analysis: Fetkovich IPR / VLP operating points, batch sensitivities, PVT tables and the VLP traverse."""
+
+from .._lazy import lazy_exports
+
+
+_EXPORTS = {
+    "OperatingPoint": "solver",
+    "fit_fetkovich": "solver",
+    "fetkovich_rate": "solver",
+    "fetkovich_pwf": "solver",
+    "vlp_model": "solver",
+    "find_operating_points": "solver",
+    "solve_operating_point": "solver",
+    "load_wells": "batch",
+    "iter_sensitivity": "batch",
+    "run_sensitivity": "batch",
+    "fetkovich_fit": "ipr_cache",
+    "ipr_curve": "ipr_cache",
+    "build_tables": "pvt_tables",
+    "lookup": "pvt_tables",
+    "Tubing": "vlp_traverse",
+    "traverse": "vlp_traverse",
+    "traverse_vlp": "vlp_traverse",
+    "lift_table": "vlp_traverse",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
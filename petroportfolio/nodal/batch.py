@@ -0,0 +1,122 @@
+"""
+Multi-well, multi-scenario nodal sensitivity.
+
+Every well in a wells table gets its own Fetkovich fit (one per reservoir
+pressure case) and an operating-point solve over the Cartesian grid
+WHP x gradient x p_res. Wells are split into chunks that run in a process
+pool; within a chunk each well's whole grid is solved in one vectorised call.
+Results are streamed to a tidy CSV, one row per well and scenario.
+
+Wells table columns: well, q_list, pwf_list, p_res, depth, gradient, where
+q_list / pwf_list are lists or ';'-separated strings of test points.
+
+    python -m petroportfolio.nodal.batch Nodal_Analysis/sample_wells.csv --whp 400 500 600 --gradient 0.10 0.12 --output nodal_results.csv
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .solver import fit_fetkovich, solve_operating_point
+
+
+RESULT_COLUMNS = ["well", "whp", "gradient", "p_res", "depth", "n", "c", "q_op", "pwf_op", "n_roots"]
+
+
+#📥 Inputs
+def _parse_points(value):
+    if isinstance(value, str):
+        return [float(v) for v in value.replace(",", ";").split(";") if v.strip()]
+    return [float(v) for v in value]
+
+
+def load_wells(path):
+    wells = pd.read_csv(path)
+    wells["q_list"] = wells["q_list"].map(_parse_points)
+    wells["pwf_list"] = wells["pwf_list"].map(_parse_points)
+    return wells
+
+
+#🔧 Per-well Grid
+def solve_well(well, whp_values, gradient_values=None, p_res_factors=(1.0,)):
+    """All scenarios for one well (a row of the wells table) as a tidy DataFrame."""
+    whp = np.asarray(whp_values, dtype=float)
+    gradient = np.asarray(gradient_values if gradient_values is not None else [well["gradient"]], dtype=float)
+    p_res = well["p_res"] * np.asarray(p_res_factors, dtype=float)
+
+    n, c = fit_fetkovich(well["q_list"], well["pwf_list"], p_res)
+    # axes: whp x gradient x p_res
+    op = solve_operating_point(c[None, None, :], n[None, None, :], p_res[None, None, :],
+                               whp[:, None, None], gradient[None, :, None], well["depth"])
+
+    grid = np.meshgrid(whp, gradient, p_res, indexing="ij")
+    shape = op.q.shape
+    return pd.DataFrame({
+        "well": well["well"],
+        "whp": grid[0].ravel(),
+        "gradient": grid[1].ravel(),
+        "p_res": grid[2].ravel(),
+        "depth": float(well["depth"]),
+        "n": np.broadcast_to(n, shape).ravel(),
+        "c": np.broadcast_to(c, shape).ravel(),
+        "q_op": op.q.ravel(),
+        "pwf_op": op.pwf.ravel(),
+        "n_roots": op.n_roots.ravel(),
+    }, columns=RESULT_COLUMNS)
+
+
+def _solve_chunk(args):
+    records, whp_values, gradient_values, p_res_factors = args
+    return pd.concat([solve_well(w, whp_values, gradient_values, p_res_factors) for w in records],
+                     ignore_index=True)
+
+
+#🚀 Batch Entry Point
+def iter_sensitivity(wells, whp_values, gradient_values=None, p_res_factors=(1.0,),
+                     workers=None, wells_per_task=50):
+    """
+    Yield result DataFrames chunk by chunk (in input order).
+    gradient_values=None keeps each well's own gradient; p_res_factors scale each well's p_res.
+    """
+    records = wells.to_dict("records")
+    tasks = [(records[i:i + wells_per_task], whp_values, gradient_values, p_res_factors)
+             for i in range(0, len(records), wells_per_task)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            yield _solve_chunk(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_solve_chunk, tasks)
+
+
+def run_sensitivity(wells, whp_values, gradient_values=None, p_res_factors=(1.0,), workers=None,
+                    output=None):
+    """Run the full grid; write to `output` (CSV) as chunks finish, or return one DataFrame."""
+    chunks = iter_sensitivity(wells, whp_values, gradient_values, p_res_factors, workers)
+    if output is None:
+        return pd.concat(chunks, ignore_index=True)
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(output, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+        rows += len(chunk)
+    return rows
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nodal operating points for many wells and scenarios.")
+    parser.add_argument("wells", help="wells CSV (well, q_list, pwf_list, p_res, depth, gradient)")
+    parser.add_argument("--whp", type=float, nargs="+", required=True, help="wellhead pressures (psig)")
+    parser.add_argument("--gradient", type=float, nargs="+", default=None, help="gradients (psi/ft); default: per-well")
+    parser.add_argument("--p-res-factor", type=float, nargs="+", default=[1.0], help="multipliers on each well's p_res")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="nodal_results.csv")
+    args = parser.parse_args()
+
+    n_rows = run_sensitivity(load_wells(args.wells), args.whp, args.gradient, args.p_res_factor,
+                             workers=args.workers, output=args.output)
+    print(f"Wrote {n_rows} scenarios to {args.output}")
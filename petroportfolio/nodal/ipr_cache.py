@@ -0,0 +1,66 @@
+"""
+Memoized Fetkovich IPR layer.
+
+The (n, C) fit and the IPR curve depend only on the well-test points and the
+reservoir pressure, so both are cached on those inputs with a bounded LRU.
+Streamlit reruns that only move VLP inputs (WHP, gradient, depth) then reuse
+the cached IPR instead of refitting. Cached arrays are returned read-only
+because every caller shares the same object.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .solver import fetkovich_rate, fit_fetkovich
+
+
+IPR_CACHE_SIZE = 128
+
+
+#🔑 Cache Key
+def ipr_key(q_list, pwf_list, p_res):
+    """Hashable key for a well test: (q tuple, pwf tuple, p_res) as floats."""
+    q = tuple(float(v) for v in q_list)
+    pwf = tuple(float(v) for v in pwf_list)
+    if len(q) != len(pwf):
+        raise ValueError("q_list and pwf_list must have the same length")
+    return q, pwf, float(p_res)
+
+
+#📘 Cached Fit & Curve
+@lru_cache(maxsize=IPR_CACHE_SIZE)
+def _fit(key):
+    q, pwf, p_res = key
+    n, c = fit_fetkovich(q, pwf, p_res)
+    return float(n), float(c)
+
+
+@lru_cache(maxsize=IPR_CACHE_SIZE)
+def _curve(key, pwf_min, pwf_step):
+    n, c = _fit(key)
+    p_res = key[2]
+    pwf_range = np.arange(pwf_min, p_res, pwf_step)
+    q_ipr = fetkovich_rate(pwf_range, p_res, c, n)
+    pwf_range.flags.writeable = False
+    q_ipr.flags.writeable = False
+    return pwf_range, q_ipr
+
+
+def fetkovich_fit(q_list, pwf_list, p_res):
+    """(n, C) for the test points at p_res, fitted once per distinct input."""
+    return _fit(ipr_key(q_list, pwf_list, p_res))
+
+
+def ipr_curve(q_list, pwf_list, p_res, pwf_min=100, pwf_step=10):
+    """(pwf_range, q_ipr) on pwf = pwf_min, pwf_min + pwf_step, ... < p_res (read-only arrays)."""
+    return _curve(ipr_key(q_list, pwf_list, p_res), float(pwf_min), float(pwf_step))
+
+
+def cache_info():
+    return {"fit": _fit.cache_info(), "curve": _curve.cache_info()}
+
+
+def clear_cache():
+    _fit.cache_clear()
+    _curve.cache_clear()
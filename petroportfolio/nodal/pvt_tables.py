@@ -0,0 +1,65 @@
+"""
+PVT lookup tables for the tubing traverse.
+
+A PVT table (sample_pvt_data.csv style: pressure, Bo, Bg, Rs, μo) is resampled
+once onto a uniform pressure grid. A lookup is then an index computation
+((p - p0) / dp) and one linear blend of the two neighbouring nodes for all
+properties at once, instead of a binary search per property per depth step.
+Pressures outside the table take the end values, as np.interp does.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+PVT_COLUMNS = {
+    "Pressure (psia)": "p",
+    "Oil FVF (bbl/STB)": "bo",
+    "Gas FVF (RB/scf)": "bg",
+    "Solution GOR (scf/STB)": "rs",
+    "Oil Viscosity (cp)": "mu_o",
+}
+PROPERTIES = ["bo", "bg", "rs", "mu_o"]
+N_NODES = 512
+
+
+class PvtTables(NamedTuple):
+    p0: float               # psia, first node
+    dp: float               # psi between nodes
+    values: np.ndarray      # (len(PROPERTIES), n_nodes), rows in PROPERTIES order
+
+
+class PvtState(NamedTuple):
+    bo: np.ndarray          # bbl/STB
+    bg: np.ndarray          # RB/scf
+    rs: np.ndarray          # scf/STB
+    mu_o: np.ndarray        # cp
+
+
+def build_tables(pvt_df, n_nodes=N_NODES):
+    """Uniform-grid PvtTables from a sample_pvt_data.csv-style frame (or path)."""
+    if not isinstance(pvt_df, pd.DataFrame):
+        pvt_df = pd.read_csv(pvt_df)
+    missing = [col for col in PVT_COLUMNS if col not in pvt_df.columns]
+    if missing:
+        raise KeyError(f"PVT data is missing columns: {missing}")
+    df = pvt_df[list(PVT_COLUMNS)].dropna().sort_values("Pressure (psia)")
+    if len(df) < 2:
+        raise ValueError("PVT data needs at least two pressures")
+    p = df["Pressure (psia)"].to_numpy(dtype=float)
+    grid = np.linspace(p[0], p[-1], n_nodes)
+    values = np.vstack([np.interp(grid, p, df[col].to_numpy(dtype=float))
+                        for col, name in PVT_COLUMNS.items() if name in PROPERTIES])
+    return PvtTables(float(grid[0]), float(grid[1] - grid[0]), values)
+
+
+def lookup(tables, p):
+    """Bo, Bg, Rs and μo at pressure(s) p (psia), linear between grid nodes."""
+    n_nodes = tables.values.shape[1]
+    x = np.clip((np.asarray(p, dtype=float) - tables.p0) / tables.dp, 0, n_nodes - 1)
+    i = np.minimum(x.astype(np.intp), n_nodes - 2)
+    w = x - i
+    lo, hi = tables.values[:, i], tables.values[:, i + 1]
+    return PvtState(*(lo + (hi - lo) * w))
@@ -0,0 +1,109 @@
+"""
+IPR/VLP operating-point solver.
+
+The operating point is the root of pwf_IPR(q) - pwf_VLP(q) on [0, AOF]. Each
+case is scanned on a coarse rate grid to bracket every sign change (so both
+"no solution" and "several intersections" are reported), then the highest-rate
+bracket, the stable operating point, is refined by bisection to `xtol`. All
+cases are solved together: inputs broadcast against each other, so one call
+handles a whole array of WHPs, reservoir pressures or depths.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class OperatingPoint(NamedTuple):
+    q: np.ndarray         # flowrate (STB/d), NaN where there is no intersection
+    pwf: np.ndarray       # flowing bottomhole pressure (psig)
+    n_roots: np.ndarray   # number of IPR/VLP intersections found on [0, AOF]
+
+
+#📘 Fetkovich IPR & Simple VLP
+def fit_fetkovich(q_list, pwf_list, p_res):
+    """
+    Log-log fit of q vs (p_res² - pwf²), as in the app. p_res may be an array,
+    in which case all pressures are fitted in one polyfit call.
+    Returns (n, c) with NaN where a test pwf is not below p_res.
+    """
+    q = np.asarray(q_list, dtype=float)
+    pwf = np.asarray(pwf_list, dtype=float)
+    p_res = np.asarray(p_res, dtype=float)
+    delta2 = p_res.reshape(1, -1)**2 - pwf[:, None]**2
+    valid = (delta2 > 0).all(axis=0)
+    log_delta2 = np.log10(np.where(valid, delta2, 1.0))
+    fit = np.polyfit(np.log10(q), log_delta2, 1)
+    with np.errstate(divide="ignore"):
+        n = np.where(valid, 1 / fit[0], np.nan)
+    c = np.where(valid, q[0] / np.where(valid, delta2[0], 1.0)**n, np.nan)
+    return n.reshape(p_res.shape), c.reshape(p_res.shape)
+
+
+def fetkovich_rate(pwf, p_res, c, n):
+    return c * np.maximum(p_res**2 - pwf**2, 0) ** n
+
+
+def fetkovich_pwf(q, p_res, c, n):
+    """Inverse Fetkovich IPR: pwf for a given rate."""
+    return np.sqrt(np.maximum(p_res**2 - (q / c) ** (1 / n), 0))
+
+
+def vlp_model(q, whp, gradient, depth):
+    return whp + gradient * depth + 0.002 * q**1.5
+
+
+#🎯 Root Finding
+def find_operating_points(residual, q_max, n_scan=64, xtol=1e-6, max_iter=100):
+    """
+    Solve residual(q) = 0 for m independent cases.
+
+    `residual` takes q of shape (m, k) and returns pwf_IPR - pwf_VLP of the same
+    shape; `q_max` has shape (m,). Returns (q, n_roots) with q = NaN where no
+    sign change was found.
+    """
+    q_max = np.asarray(q_max, dtype=float)
+    q_grid = q_max[:, None] * np.linspace(0.0, 1.0, n_scan)
+    above = residual(q_grid) > 0
+    changes = above[:, 1:] != above[:, :-1]
+    n_roots = changes.sum(axis=1)
+
+    # last (highest-rate) bracket per case
+    has_root = n_roots > 0
+    last = n_scan - 2 - np.argmax(changes[:, ::-1], axis=1)
+    rows = np.arange(len(q_max))
+    lo, hi = q_grid[rows, last], q_grid[rows, last + 1]
+    lo_above = above[rows, last]
+
+    for _ in range(max_iter):
+        if not np.any(hi - lo > xtol):
+            break
+        mid = 0.5 * (lo + hi)
+        mid_above = residual(mid[:, None])[:, 0] > 0
+        move_lo = mid_above == lo_above
+        lo = np.where(move_lo, mid, lo)
+        hi = np.where(move_lo, hi, mid)
+
+    q = np.where(has_root, 0.5 * (lo + hi), np.nan)
+    return q, n_roots
+
+
+def solve_operating_point(c, n, p_res, whp, gradient, depth, vlp=vlp_model, n_scan=64, xtol=1e-6):
+    """
+    Fetkovich IPR vs VLP intersection for every broadcast combination of the inputs.
+    `vlp(q, whp, gradient, depth)` must accept arrays.
+    """
+    c, n, p_res, whp, gradient, depth = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (c, n, p_res, whp, gradient, depth)))
+    shape = c.shape
+    c, n, p_res, whp, gradient, depth = (x.reshape(-1) for x in (c, n, p_res, whp, gradient, depth))
+    cols = [x[:, None] for x in (c, n, p_res, whp, gradient, depth)]
+
+    def residual(q):
+        c_, n_, p_res_, whp_, gradient_, depth_ = cols
+        return fetkovich_pwf(q, p_res_, c_, n_) - vlp(q, whp_, gradient_, depth_)
+
+    q_aof = fetkovich_rate(0.0, p_res, c, n)
+    q, n_roots = find_operating_points(residual, q_aof, n_scan=n_scan, xtol=xtol)
+    pwf = np.where(np.isnan(q), np.nan, fetkovich_pwf(np.nan_to_num(q), p_res, c, n))
+    return OperatingPoint(q.reshape(shape), pwf.reshape(shape), n_roots.reshape(shape))
@@ -0,0 +1,135 @@
+"""
+Segmented multiphase pressure traverse (VLP).
+
+The tubing is split into depth segments and pressure is integrated from the
+wellhead down with a midpoint (RK2) step per segment. Each step samples Bo,
+Bg, Rs and μo from precomputed PvtTables and evaluates a homogeneous
+(no-slip) mixture:
+
+    ρm   = λ ρL + (1 - λ) ρg            λ = in-situ liquid fraction
+    dp/dz = (ρm + f ρm vm² / (2 gc d)) / 144        psi/ft, vertical well
+    f    = 64/Re (laminar) or Swamee-Jain (turbulent), Re = 1488 ρm vm d / μm
+
+Rates, GLRs, water cuts and wellhead pressures broadcast against each other,
+so a whole rate x GLR x WHP sweep is one traverse call. Pressures are psia.
+
+    python -m petroportfolio.nodal.vlp_traverse Gas_Lift_Optimization/sample_pvt_data.csv --depth 8000 --output vlp_table.csv
+"""
+
+import argparse
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .pvt_tables import build_tables, lookup
+
+
+BBL_TO_FT3 = 5.615
+WATER_DENSITY = 62.4        # lb/ft³
+AIR_DENSITY = 0.0764        # lb/scf
+GC = 32.174                 # lbm·ft/(lbf·s²)
+PSIA = 14.7
+N_SEGMENTS = 50
+
+
+class Tubing(NamedTuple):
+    tubing_id: float = 2.441        # in
+    roughness: float = 0.0006       # in
+    oil_sg: float = 0.85
+    gas_sg: float = 0.7
+    water_sg: float = 1.05
+    mu_water: float = 0.5           # cp
+    mu_gas: float = 0.015           # cp
+
+
+#🛢️ Mixture Gradient
+def friction_factor(re, relative_roughness):
+    """Darcy friction factor: laminar below Re 2000, Swamee-Jain above."""
+    re = np.maximum(re, 1e-9)
+    turbulent = 0.25 / np.log10(relative_roughness / 3.7 + 5.74 / re**0.9) ** 2
+    return np.where(re < 2000, 64 / re, turbulent)
+
+
+def pressure_gradient(p, q_liq, glr, wct, tables, tubing=Tubing()):
+    """dp/dz (psi/ft) at pressure p (psia) for liquid rate q_liq (STB/d), GLR (scf/STB) and water cut (fraction)."""
+    pvt = lookup(tables, p)
+    q_oil = q_liq * (1 - wct)
+    q_water = q_liq * wct
+    free_gas = np.maximum(glr * q_liq - pvt.rs * q_oil, 0)
+
+    # in-situ rates, ft³/s
+    v_oil = q_oil * pvt.bo * BBL_TO_FT3 / 86400
+    v_water = q_water * BBL_TO_FT3 / 86400
+    v_gas = free_gas * pvt.bg * BBL_TO_FT3 / 86400
+    v_liq = v_oil + v_water
+    v_total = v_liq + v_gas
+
+    rho_oil = (WATER_DENSITY * tubing.oil_sg + 0.0136 * pvt.rs * tubing.gas_sg) / pvt.bo
+    rho_water = WATER_DENSITY * tubing.water_sg
+    rho_gas = AIR_DENSITY * tubing.gas_sg / (pvt.bg * BBL_TO_FT3)
+    # a static column (no flow) is taken as liquid at the flowing water cut
+    with np.errstate(divide="ignore", invalid="ignore"):
+        oil_frac = np.where(v_liq > 0, v_oil / v_liq, 1 - wct)
+        holdup = np.where(v_total > 0, v_liq / v_total, 1.0)
+    rho_liq = oil_frac * rho_oil + (1 - oil_frac) * rho_water
+    mu_liq = oil_frac * pvt.mu_o + (1 - oil_frac) * tubing.mu_water
+    rho_m = holdup * rho_liq + (1 - holdup) * rho_gas
+    mu_m = holdup * mu_liq + (1 - holdup) * tubing.mu_gas
+
+    d = tubing.tubing_id / 12
+    vm = v_total / (np.pi * d**2 / 4)
+    re = 1488 * rho_m * vm * d / mu_m
+    f = friction_factor(re, tubing.roughness / tubing.tubing_id)
+    return (rho_m + f * rho_m * vm**2 / (2 * GC * d)) / 144
+
+
+#⬇️ Traverse
+def traverse(p_top, length, q_liq, glr, wct, tables, tubing=Tubing(), n_segments=N_SEGMENTS):
+    """Pressure (psia) at the bottom of `length` ft of tubing; every input broadcasts."""
+    p = np.asarray(p_top, dtype=float)
+    dz = np.asarray(length, dtype=float) / n_segments
+    for _ in range(n_segments):
+        p_mid = p + 0.5 * dz * pressure_gradient(p, q_liq, glr, wct, tables, tubing)
+        p = p + dz * pressure_gradient(p_mid, q_liq, glr, wct, tables, tubing)
+    return p
+
+
+def traverse_vlp(tables, glr, wct, tubing=Tubing(), n_segments=N_SEGMENTS):
+    """
+    vlp(q, whp, gradient, depth) for nodal.solver.solve_operating_point, pressures
+    in psig like the Fetkovich app; `gradient` is unused (the traverse supplies it).
+    """
+    def vlp(q, whp, gradient, depth):
+        return traverse(np.asarray(whp) + PSIA, depth, q, glr, wct, tables, tubing, n_segments) - PSIA
+    return vlp
+
+
+#📋 Lift Tables
+def lift_table(tables, rates, glrs, whps, depth, wct=0.0, tubing=Tubing(), n_segments=N_SEGMENTS):
+    """Flowing BHP for every rate x GLR x WHP (psig in and out) as a tidy DataFrame."""
+    q, glr, whp = np.meshgrid(np.asarray(rates, dtype=float), np.asarray(glrs, dtype=float),
+                              np.asarray(whps, dtype=float), indexing="ij")
+    pwf = traverse(whp + PSIA, depth, q, glr, wct, tables, tubing, n_segments) - PSIA
+    return pd.DataFrame({"q_liq": q.ravel(), "glr": glr.ravel(), "whp": whp.ravel(), "pwf": pwf.ravel()})
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    defaults = Tubing()
+    parser = argparse.ArgumentParser(description="Multiphase lift table (pwf vs rate x GLR x WHP).")
+    parser.add_argument("pvt", help="PVT CSV (sample_pvt_data.csv format)")
+    parser.add_argument("--depth", type=float, required=True, help="tubing length (ft)")
+    parser.add_argument("--rates", type=float, nargs="+", default=list(np.linspace(100, 3000, 30)), help="STB/d")
+    parser.add_argument("--glr", type=float, nargs="+", default=[200, 400, 800, 1600, 3200], help="scf/STB")
+    parser.add_argument("--whp", type=float, nargs="+", default=[100, 300, 500], help="psig")
+    parser.add_argument("--wct", type=float, default=0.0, help="water cut (fraction)")
+    parser.add_argument("--tubing-id", type=float, default=defaults.tubing_id, help="in")
+    parser.add_argument("--segments", type=int, default=N_SEGMENTS)
+    parser.add_argument("--output", default="vlp_table.csv")
+    args = parser.parse_args()
+
+    table = lift_table(build_tables(args.pvt), args.rates, args.glr, args.whp, args.depth, args.wct,
+                       Tubing(tubing_id=args.tubing_id), args.segments)
+    table.to_csv(args.output, index=False)
+    print(f"Wrote {len(table)} lift-table points to {args.output}")
@@ -0,0 +1,23 @@
+"""OFM exports: partitioned Parquet store, production / well-test joins and incremental Power BI rollups."""
+
+from .._lazy import lazy_exports
+
+
+_EXPORTS = {
+    "PRODUCTION": "store",
+    "WELLTEST": "store",
+    "STORE_DIR_NAME": "store",
+    "ingest": "store",
+    "read_store": "store",
+    "store_wells": "store",
+    "date_range": "store",
+    "asof_join": "welltest_join",
+    "join_tests": "welltest_join",
+    "filter_tests": "welltest_join",
+    "test_choices": "welltest_join",
+    "update_rollups": "rollup",
+    "read_rollup": "rollup",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
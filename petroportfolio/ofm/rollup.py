@@ -0,0 +1,212 @@
+"""
+Pre-aggregated production rollups for the Power BI exports.
+
+Four grains are kept next to the OFM store, built from the cleaned daily
+OIL_BOPD / GAS_MSCFD / WATER_BWPD / WHP_PSIG rows:
+
+    well_day     WELL,  DATE     (append-only part files)
+    well_month   WELL,  MONTH
+    field_day    FIELD, DATE
+    field_month  FIELD, MONTH
+
+Every grain stores additive columns (volumes, WHP sum, day counts) plus the
+derived water cut, GOR, average WHP and cumulative volumes. update_rollups()
+reads only the store rows dated after what each well has already been rolled
+up to, appends their well_day rows (cumulatives continue from the last stored
+value) and merges their sums into the month / field tables, which are small
+and rewritten. Daily rates are daily volumes, so day-grain volumes equal the
+reported rates.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .store import PRODUCTION, dataset_dir, read_manifest, read_store
+
+
+ROLLUP_DIR_NAME = "rollups"
+MANIFEST = "manifest.json"
+DEFAULT_FIELD = "FIELD"
+GRAINS = {
+    "well_day": ("WELL", "DATE"),
+    "well_month": ("WELL", "MONTH"),
+    "field_day": ("FIELD", "DATE"),
+    "field_month": ("FIELD", "MONTH"),
+}
+ADDITIVE = ["OIL_BBL", "GAS_MSCF", "WATER_BBL", "WHP_SUM", "N_DAYS", "PROD_DAYS"]
+VOLUMES = {"OIL_BBL": "CUM_OIL_BBL", "GAS_MSCF": "CUM_GAS_MSCF", "WATER_BBL": "CUM_WATER_BBL"}
+DERIVED = ["WHP_PSIG", "WCUT", "GOR"] + list(VOLUMES.values())
+EXPORT_LEVELS = {
+    "Well × Day": "well_day",
+    "Well × Month": "well_month",
+    "Field × Day": "field_day",
+    "Field × Month": "field_month",
+}
+
+
+#🧮 Aggregation
+def daily_additive(prod, fields=None):
+    """Cleaned production rows -> additive well_day rows (duplicate well/days summed), with FIELD."""
+    df = pd.DataFrame({
+        "WELL": prod["WELL"].astype(str),
+        "DATE": pd.to_datetime(prod["DATE"]).dt.normalize(),
+        "OIL_BBL": prod["OIL_BOPD"].astype(float),
+        "GAS_MSCF": prod["GAS_MSCFD"].astype(float),
+        "WATER_BBL": prod["WATER_BWPD"].astype(float),
+        "WHP_SUM": prod["WHP_PSIG"].astype(float),
+        "N_DAYS": 1,
+        "PROD_DAYS": (prod["OIL_BOPD"] > 0).astype(int),
+    })
+    df = df.groupby(["WELL", "DATE"], as_index=False, sort=True)[ADDITIVE].sum()
+    df.insert(0, "FIELD", df["WELL"].map(fields).fillna(DEFAULT_FIELD) if fields else DEFAULT_FIELD)
+    return df
+
+
+def aggregate(df, keys):
+    """Sum the additive columns of df by keys (a MONTH key is derived from DATE)."""
+    if "MONTH" in keys and "MONTH" not in df.columns:
+        df = df.assign(MONTH=df["DATE"].dt.to_period("M").dt.to_timestamp())
+    return df.groupby(list(keys), as_index=False, sort=True)[ADDITIVE].sum()
+
+
+def derive(df, keys, offsets=None):
+    """Average WHP, water cut (%), GOR (scf/bbl) and cumulatives per entity, in time order."""
+    entity, time = keys
+    df = df.sort_values([entity, time], kind="stable").reset_index(drop=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        whp = df["WHP_SUM"] / df["N_DAYS"]
+        liquid = df["OIL_BBL"] + df["WATER_BBL"]
+        wcut = np.where(liquid > 0, df["WATER_BBL"] / liquid * 100, np.nan)
+        gor = np.where(df["OIL_BBL"] > 0, df["GAS_MSCF"] * 1000 / df["OIL_BBL"], np.nan)
+    out = df.assign(WHP_PSIG=whp, WCUT=wcut, GOR=gor)
+    for volume, cum in VOLUMES.items():
+        start = 0.0 if offsets is None else df[entity].map({k: v[cum] for k, v in offsets.items()}).fillna(0.0)
+        out[cum] = out.groupby(entity)[volume].cumsum() + start
+    return out[list(keys) + ADDITIVE + DERIVED]
+
+
+def merge_additive(old, new, keys):
+    """Add new sums into an existing rollup (rows for the same keys are summed)."""
+    if old is None or old.empty:
+        return new
+    both = pd.concat([old[list(keys) + ADDITIVE], new], ignore_index=True)
+    return both.groupby(list(keys), as_index=False, sort=True)[ADDITIVE].sum()
+
+
+#🗂️ Storage
+def rollup_dir(root):
+    return dataset_dir(root, PRODUCTION).parent / ROLLUP_DIR_NAME
+
+
+def _read_manifest(root):
+    try:
+        with open(rollup_dir(root) / MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"wells": {}, "next_part": 0}
+
+
+def _write_atomic(path, write):
+    tmp = path.with_name(path.name + f".tmp{os.getpid()}")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_manifest(root, manifest):
+    def write(tmp):
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=1)
+    _write_atomic(rollup_dir(root) / MANIFEST, write)
+
+
+def _table_path(root, grain):
+    return rollup_dir(root) / f"{grain}.parquet"
+
+
+def _read_table(root, grain):
+    path = _table_path(root, grain)
+    return pd.read_parquet(path) if path.exists() else None
+
+
+#🔄 Incremental Update
+def pending_rows(root, manifest=None):
+    """Store rows newer than each well's last rolled-up date."""
+    manifest = manifest or _read_manifest(root)
+    store = read_manifest(root, PRODUCTION)["wells"]
+    rolled = {w: pd.Timestamp(v["last"]) for w, v in manifest["wells"].items()}
+    stale = [w for w, v in store.items() if w not in rolled or pd.Timestamp(v["last"]) > rolled[w]]
+    if not stale:
+        return None
+    start = min(rolled[w] + pd.Timedelta(days=1) if w in rolled else pd.Timestamp(store[w]["first"])
+                for w in stale)
+    prod = read_store(root, PRODUCTION, stale, start=start)
+    last = pd.to_datetime(prod["WELL"].map(rolled))
+    return prod[last.isna() | (prod["DATE"] > last)]
+
+
+def update_rollups(root, fields=None):
+    """Roll up the store rows that arrived since the last update; returns the number of raw rows added."""
+    manifest = _read_manifest(root)
+    prod = pending_rows(root, manifest)
+    if prod is None or prod.empty:
+        return 0
+    rollup_dir(root).joinpath("well_day").mkdir(parents=True, exist_ok=True)
+
+    daily = daily_additive(prod, fields)
+    well_day = derive(daily, GRAINS["well_day"], manifest["wells"])
+    part = rollup_dir(root) / "well_day" / f"part-{manifest['next_part']:06d}.parquet"
+    _write_atomic(part, lambda tmp: well_day.to_parquet(tmp, index=False))
+    manifest["next_part"] += 1
+
+    for grain in ("well_month", "field_day", "field_month"):
+        keys = GRAINS[grain]
+        table = merge_additive(_read_table(root, grain), aggregate(daily, keys), keys)
+        table = derive(table, keys)
+        _write_atomic(_table_path(root, grain), lambda tmp: table.to_parquet(tmp, index=False))
+
+    ends = well_day.groupby("WELL").last()
+    for well, row in ends.iterrows():
+        manifest["wells"][well] = {"last": row["DATE"].strftime("%Y-%m-%d"),
+                                   **{cum: float(row[cum]) for cum in VOLUMES.values()}}
+    _write_manifest(root, manifest)
+    return len(prod)
+
+
+#📤 Read
+def read_rollup(root, grain, wells=None, start=None, end=None):
+    """One rollup grain, filtered to wells (well grains only) and a date range."""
+    entity, time = GRAINS[grain]
+    if grain == "well_day":
+        files = sorted((rollup_dir(root) / "well_day").glob("part-*.parquet"))
+        if not files:
+            return pd.DataFrame(columns=[entity, time] + ADDITIVE + DERIVED)
+        import pyarrow.dataset as ds
+
+        conditions = []
+        if wells is not None:
+            conditions.append(ds.field("WELL").isin(list(wells)))
+        if start is not None:
+            conditions.append(ds.field("DATE") >= pd.Timestamp(start))
+        if end is not None:
+            conditions.append(ds.field("DATE") <= pd.Timestamp(end))
+        filt = None
+        for condition in conditions:
+            filt = condition if filt is None else filt & condition
+        df = ds.dataset([str(f) for f in files], format="parquet").to_table(filter=filt).to_pandas()
+    else:
+        df = _read_table(root, grain)
+        if df is None:
+            return pd.DataFrame(columns=[entity, time] + ADDITIVE + DERIVED)
+        keep = np.ones(len(df), dtype=bool)
+        if wells is not None and entity == "WELL":
+            keep &= df["WELL"].isin(list(wells)).to_numpy()
+        if start is not None:
+            first = pd.Timestamp(start)
+            keep &= (df[time] >= (first.to_period("M").to_timestamp() if time == "MONTH" else first)).to_numpy()
+        if end is not None:
+            keep &= (df[time] <= pd.Timestamp(end)).to_numpy()
+        df = df[keep]
+    return df.sort_values([time, entity], kind="stable").reset_index(drop=True)
@@ -0,0 +1,217 @@
+"""
+Append-only, partitioned Parquet store for OFM daily exports.
+
+Raw OFM CSVs are renamed to the dashboard schema once, at ingest, and written
+as Parquet files partitioned by well and month:
+
+    .ofm_store/production/WELL=Cendor-5/MONTH=2024-01/part-000000.parquet
+
+Each dataset keeps a manifest.json with the first/last ingested date of every
+well and the size/mtime of every source file already seen. Re-ingesting a
+grown export only appends rows dated after a well's last ingested date, as new
+part files; existing files are never rewritten. Readers list the partition
+directories, keep only the wells and months they were asked for and read just
+those files.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+
+STORE_DIR_NAME = ".ofm_store"
+DEFAULT_STORE = Path(__file__).resolve().parents[2] / "Power_BI_OFM_Integration" / STORE_DIR_NAME
+MANIFEST = "manifest.json"
+CHUNK_ROWS = 500_000
+
+
+class Dataset(NamedTuple):
+    name: str           # sub-directory of the store
+    date_col: str       # partition / append key
+    rename: dict        # raw OFM column -> dashboard column
+    columns: list       # dashboard columns kept, in order
+
+
+PRODUCTION = Dataset("production", "DATE", {
+    "Well Name": "WELL",
+    "Date": "DATE",
+    "Oil Rate (bbl/d)": "OIL_BOPD",
+    "Gas Rate (Mscf/d)": "GAS_MSCFD",
+    "Water Rate (bbl/d)": "WATER_BWPD",
+    "WHP (psi)": "WHP_PSIG",
+    "Status": "STATUS"
+}, ["WELL", "DATE", "OIL_BOPD", "GAS_MSCFD", "WATER_BWPD", "WHP_PSIG", "STATUS"])
+
+WELLTEST = Dataset("welltest", "TEST_DATE", {
+    "Well Name": "WELL",
+    "Test Date": "TEST_DATE",
+    "Q_liq (bbl/d)": "Q_LIQ",
+    "Water Cut (%)": "WCUT",
+    "GOR (scf/bbl)": "GOR",
+    "THP (psi)": "THP_PSIG",
+    "Lift Method": "LIFT_METHOD"
+}, ["WELL", "TEST_DATE", "Q_LIQ", "WCUT", "GOR", "THP_PSIG", "LIFT_METHOD"])
+
+
+#🧹 Schema
+def clean(df, dataset):
+    """Raw OFM frame -> dashboard columns with a parsed date column."""
+    df = df.rename(columns=dataset.rename)
+    missing = [col for col in dataset.columns if col not in df.columns]
+    if missing:
+        raise KeyError(f"{dataset.name} export is missing columns: {missing}")
+    df = df[dataset.columns]
+    return df.assign(**{"WELL": df["WELL"].astype(str),
+                        dataset.date_col: pd.to_datetime(df[dataset.date_col])})
+
+
+#🗂️ Manifest & Partitions
+def dataset_dir(root, dataset):
+    return Path(root) / dataset.name
+
+
+def read_manifest(root, dataset):
+    try:
+        with open(dataset_dir(root, dataset) / MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"sources": {}, "wells": {}, "next_part": 0}
+
+
+def _write_manifest(root, dataset, manifest):
+    path = dataset_dir(root, dataset) / MANIFEST
+    tmp = path.with_name(path.name + f".tmp{os.getpid()}")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, path)
+
+
+def partition_dir(root, dataset, well, month):
+    return dataset_dir(root, dataset) / f"WELL={quote(well, safe='')}" / f"MONTH={month}"
+
+
+def partition_files(root, dataset, wells=None, start=None, end=None):
+    """Part files of the partitions that hold the given wells and overlap [start, end]."""
+    base = dataset_dir(root, dataset)
+    if not base.exists():
+        return []
+    wells = None if wells is None else set(wells)
+    first = None if start is None else pd.Timestamp(start).strftime("%Y-%m")
+    last = None if end is None else pd.Timestamp(end).strftime("%Y-%m")
+    files = []
+    for well_dir in sorted(base.glob("WELL=*")):
+        if wells is not None and unquote(well_dir.name[5:]) not in wells:
+            continue
+        for month_dir in sorted(well_dir.glob("MONTH=*")):
+            month = month_dir.name[6:]
+            if (first is not None and month < first) or (last is not None and month > last):
+                continue
+            files.extend(sorted(month_dir.glob("part-*.parquet")))
+    return files
+
+
+def store_wells(root, dataset):
+    return sorted(read_manifest(root, dataset)["wells"])
+
+
+def date_range(root, dataset, wells=None):
+    """(first, last) ingested date over the given wells, from the manifest only."""
+    info = read_manifest(root, dataset)["wells"]
+    spans = [info[w] for w in (info if wells is None else wells) if w in info]
+    if not spans:
+        return None, None
+    return pd.Timestamp(min(s["first"] for s in spans)), pd.Timestamp(max(s["last"] for s in spans))
+
+
+#📥 Ingest
+def _source_key(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def ingest(source, root, dataset, chunk_rows=CHUNK_ROWS):
+    """
+    Append the rows of an OFM CSV export that are newer than what the store holds
+    for each well. Unchanged sources (same size and mtime) are skipped without
+    reading. Returns the number of rows appended.
+    """
+    source = Path(source)
+    manifest = read_manifest(root, dataset)
+    key = str(source.resolve())
+    if manifest["sources"].get(key) == _source_key(source):
+        return 0
+
+    known = {w: pd.Timestamp(v["last"]) for w, v in manifest["wells"].items()}
+    spans = {}
+    n_rows = 0
+    for chunk in pd.read_csv(source, chunksize=chunk_rows):
+        chunk = clean(chunk, dataset)
+        dates = chunk[dataset.date_col]
+        last = pd.to_datetime(chunk["WELL"].map(known))
+        chunk = chunk[dates.notna() & (last.isna() | (dates > last))]
+        if chunk.empty:
+            continue
+        month = chunk[dataset.date_col].dt.strftime("%Y-%m")
+        for (well, m), part in chunk.groupby([chunk["WELL"], month], sort=False):
+            out_dir = partition_dir(root, dataset, well, m)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            part.to_parquet(out_dir / f"part-{manifest['next_part']:06d}.parquet", index=False)
+            manifest["next_part"] += 1
+        for well, dates in chunk.groupby("WELL")[dataset.date_col]:
+            lo, hi = spans.get(well, (dates.min(), dates.max()))
+            spans[well] = (min(lo, dates.min()), max(hi, dates.max()))
+        n_rows += len(chunk)
+
+    for well, (lo, hi) in spans.items():
+        old = manifest["wells"].get(well)
+        first = lo if old is None else min(lo, pd.Timestamp(old["first"]))
+        manifest["wells"][well] = {"first": first.strftime("%Y-%m-%d"), "last": hi.strftime("%Y-%m-%d")}
+    manifest["sources"][key] = _source_key(source)
+    dataset_dir(root, dataset).mkdir(parents=True, exist_ok=True)
+    _write_manifest(root, dataset, manifest)
+    return n_rows
+
+
+#📤 Read
+def read_store(root, dataset, wells=None, start=None, end=None, columns=None):
+    """Rows for the given wells and date range, reading only the partitions they touch."""
+    files = partition_files(root, dataset, wells, start, end)
+    columns = dataset.columns if columns is None else list(columns)
+    if not files:
+        return pd.DataFrame({col: pd.Series(dtype="datetime64[ns]" if col == dataset.date_col else object)
+                             for col in columns})
+    import pyarrow.dataset as ds
+
+    table = ds.dataset([str(f) for f in files], format="parquet").to_table(columns=columns)
+    df = table.to_pandas()
+    dates = df[dataset.date_col]
+    keep = np.ones(len(df), dtype=bool)
+    if start is not None:
+        keep &= (dates >= pd.Timestamp(start)).to_numpy()
+    if end is not None:
+        keep &= (dates <= pd.Timestamp(end)).to_numpy()
+    if wells is not None:
+        keep &= df["WELL"].isin(list(wells)).to_numpy()
+    df = df[keep]
+    return df.sort_values([dataset.date_col, "WELL"], kind="stable").reset_index(drop=True)
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Append OFM CSV exports to the partitioned Parquet store.")
+    parser.add_argument("--production", nargs="*", default=[], help="OFM daily production CSV exports")
+    parser.add_argument("--welltest", nargs="*", default=[], help="OFM well test CSV exports")
+    parser.add_argument("--store", default=str(DEFAULT_STORE))
+    args = parser.parse_args()
+
+    for dataset, sources in ((PRODUCTION, args.production), (WELLTEST, args.welltest)):
+        for source in sources:
+            n_rows = ingest(source, args.store, dataset)
+            print(f"{source}: appended {n_rows} {dataset.name} rows")
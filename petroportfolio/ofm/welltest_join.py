@@ -0,0 +1,61 @@
+"""
+Production / well-test joins for the Power BI exports.
+
+`pd.merge(prod, test, on="WELL")` pairs every production day with every test
+of its well, so the export grows as rows x tests. The as-of join instead gives
+each production row the most recent test of the same well dated on or before
+it (optionally no older than max_age_days), with one sorted merge
+(pd.merge_asof). The output has exactly one row per production row, in the
+original order; rows with no valid test get empty test columns.
+"""
+
+import pandas as pd
+
+
+JOIN_MODES = ["Latest test (as-of)", "All tests (many-to-many)"]
+NO_TEST = "(no test)"       # filter choice for production rows the join left without a test
+
+
+def asof_join(prod, test, date_col="DATE", test_date_col="TEST_DATE", by="WELL", max_age_days=None):
+    """Attach the latest test on or before each production date, per well."""
+    left = prod.assign(**{date_col: pd.to_datetime(prod[date_col])})
+    right = test.assign(**{test_date_col: pd.to_datetime(test[test_date_col])})
+    right = right[right[test_date_col].notna()].sort_values(test_date_col, kind="stable")
+
+    order = left[date_col].notna().to_numpy()
+    dated = left[order].reset_index().sort_values(date_col, kind="stable")
+    tolerance = None if max_age_days is None else pd.Timedelta(days=max_age_days)
+    joined = pd.merge_asof(dated, right, left_on=date_col, right_on=test_date_col, by=by,
+                           direction="backward", tolerance=tolerance, allow_exact_matches=True)
+
+    # production rows without a date cannot be matched; keep them with empty test columns
+    undated = left[~order].reset_index()
+    if len(undated):
+        joined = pd.concat([joined, undated], ignore_index=True)
+    index_name = prod.index.name or "index"
+    joined = joined.sort_values(index_name, kind="stable").set_index(index_name)
+    joined.index.name = prod.index.name
+    return joined
+
+
+def join_tests(prod, test, mode=JOIN_MODES[0], **asof_kwargs):
+    """Join in the selected mode; the many-to-many merge on WELL is kept for comparison."""
+    if mode == JOIN_MODES[0]:
+        return asof_join(prod, test, **asof_kwargs).reset_index(drop=True)
+    if mode == JOIN_MODES[1]:
+        return pd.merge(prod, test, how="left", on=asof_kwargs.get("by", "WELL"))
+    raise ValueError(f"Unknown join mode: {mode}")
+
+
+def test_choices(joined, column):
+    """Values of a test column to offer as filter choices, plus NO_TEST when some rows have no test."""
+    choices = joined[column].dropna().unique().tolist()
+    return choices + [NO_TEST] if joined[column].isna().any() else choices
+
+
+def filter_tests(joined, column, selected):
+    """Rows whose test column is in `selected`; rows without a test are kept while NO_TEST is selected."""
+    keep = joined[column].isin(selected)
+    if NO_TEST in selected:
+        keep |= joined[column].isna()
+    return joined[keep]
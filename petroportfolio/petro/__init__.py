@@ -0,0 +1,30 @@
+"""Petrophysics: LAS reader, depth index, Vsh / PHIE / SW engine, batch pay summaries, CBM zonation and log export."""
+
+from .._lazy import lazy_exports
+
+
+_EXPORTS = {
+    "read_las": "las_reader",
+    "LasFile": "las_reader",
+    "DepthLog": "depth_index",
+    "PetroParams": "engine",
+    "normalize_nphi": "engine",
+    "evaluate": "engine",
+    "evaluate_zones": "engine",
+    "pay_summary": "engine",
+    "evaluate_well": "batch",
+    "iter_summaries": "batch",
+    "run_batch": "batch",
+    "standardize_curves": "cbm_zonation",
+    "zone_well": "cbm_zonation",
+    "zone_wells": "cbm_zonation",
+    "decimate_frame": "log_decimation",
+    "lod_indices": "log_decimation",
+    "available_formats": "log_export",
+    "export_bytes": "log_export",
+    "export_name": "log_export",
+    "lazy_export": "log_export",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
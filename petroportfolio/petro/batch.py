@@ -0,0 +1,143 @@
+"""
+Headless multi-well petrophysical evaluation.
+
+Every LAS file in a directory is read with las_reader, evaluated with the same
+Vsh / PHIE / SW / PAY cutoff logic as 3Multi_Track_Param.py (petro.engine) and
+reduced to one pay-summary row. Wells run in a process pool and rows are
+appended to the output CSV as wells finish, so memory is bounded by one well
+per worker however many files there are.
+
+    python -m petroportfolio.petro.batch las_dir/ --output pay_summary.csv --rw 0.05 --workers 8
+"""
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .las_reader import read_las
+from .engine import PetroParams, evaluate, pay_summary
+
+
+# first mnemonic found wins (upper-cased), app defaults first
+CURVE_ALIASES = {
+    "GR": ["GR", "GRC", "GRGC", "SGR", "CGR"],
+    "RHOB": ["RHOB", "DEN", "RHOZ", "ZDEN"],
+    "NPHI": ["NPHI", "NEU", "TNPH", "NPOR", "CNC"],
+    "RT": ["RDEP", "RT", "ILD", "LLD", "DDLL", "AT90", "RES"],
+}
+NULL_VALUES = [-999.25, -9999, -999.0]
+SUMMARY_COLUMNS = ["Well", "File", "Top (m)", "Base (m)", "Gross Thickness (m)", "Net Thickness (m)",
+                   "Net/Gross", "Avg φ", "Avg Sw", "Avg Vsh", "Curves", "Status"]
+
+
+#🔎 Curve Matching
+def pick_curves(mnemonics, aliases=CURVE_ALIASES):
+    """Map GR/RHOB/NPHI/RT to the first matching mnemonic; raises KeyError if one is missing."""
+    upper = {m.upper(): m for m in mnemonics}
+    picked = {}
+    for role, names in aliases.items():
+        match = next((upper[name] for name in names if name in upper), None)
+        if match is None:
+            raise KeyError(f"no {role} curve (looked for {', '.join(names)})")
+        picked[role] = match
+    return picked
+
+
+#🧪 Per-well Evaluation
+def evaluate_well(path, params=None, top=None, base=None, cache=True):
+    """Pay-summary row for one LAS file; errors are reported in the Status column."""
+    row = {"Well": Path(path).stem, "File": Path(path).name, "Status": "ok"}
+    try:
+        las = read_las(path, cache=cache)
+        well_name = str(las.well.WELL).strip()
+        row["Well"] = well_name or row["Well"]
+        curves = pick_curves(las.keys())
+
+        depth = las.index
+        if len(depth) > 1 and depth[0] > depth[-1]:
+            order = slice(None, None, -1)
+        else:
+            order = slice(None)
+        depth = depth[order]
+        start = 0 if top is None else int(np.searchsorted(depth, top, side="left"))
+        stop = len(depth) if base is None else int(np.searchsorted(depth, base, side="right"))
+        if stop <= start:
+            row["Status"] = "no samples in interval"
+            return row
+        sl = slice(start, stop)
+
+        arrays = {}
+        for role, mnemonic in curves.items():
+            values = np.array(las[mnemonic][order][sl], dtype=np.float32)
+            values[np.isin(values, NULL_VALUES)] = np.nan
+            arrays[role] = values
+        if np.nanmax(arrays["NPHI"], initial=-np.inf) > 1.0:     # % -> fraction, as the app does
+            arrays["NPHI"] /= 100
+
+        result = evaluate(arrays["GR"], arrays["RHOB"], arrays["NPHI"], arrays["RT"], params)
+        row.update(pay_summary(depth[sl], result, top, base))
+        row["Curves"] = " ".join(f"{role}={m}" for role, m in curves.items())
+    except (OSError, ValueError, KeyError) as exc:
+        row["Status"] = f"error: {exc}"
+    return row
+
+
+def _evaluate_task(args):
+    return evaluate_well(*args)
+
+
+#🚀 Batch Entry Point
+def iter_summaries(paths, params=None, top=None, base=None, workers=None, cache=True):
+    """Yield one summary row per LAS file, in input order."""
+    tasks = [(p, params, top, base, cache) for p in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        yield from map(_evaluate_task, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_evaluate_task, tasks, chunksize=4)
+
+
+def run_batch(las_dir, output, params=None, top=None, base=None, workers=None, cache=True,
+              pattern="*.las"):
+    """Evaluate every LAS file in las_dir and stream the summary table to `output` (CSV)."""
+    paths = sorted(p for p in Path(las_dir).iterdir() if p.match(pattern) or p.match(pattern.upper()))
+    n_ok = 0
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for row in iter_summaries(paths, params, top, base, workers, cache):
+            writer.writerow(row)
+            f.flush()
+            n_ok += row["Status"] == "ok"
+    return len(paths), n_ok
+
+
+#🧪 Command Line Entry
+if __name__ == "__main__":
+    defaults = PetroParams()
+    parser = argparse.ArgumentParser(description="Batch pay summary for a directory of LAS files.")
+    parser.add_argument("las_dir", help="directory containing .las files")
+    parser.add_argument("--output", default="pay_summary.csv")
+    parser.add_argument("--top", type=float, default=None, help="top depth of the evaluated interval")
+    parser.add_argument("--base", type=float, default=None, help="base depth of the evaluated interval")
+    parser.add_argument("--a", type=float, default=defaults.a)
+    parser.add_argument("--m", type=float, default=defaults.m)
+    parser.add_argument("--n", type=float, default=defaults.n)
+    parser.add_argument("--rw", type=float, default=defaults.rw)
+    parser.add_argument("--phie-cut", type=float, default=defaults.phie_cut)
+    parser.add_argument("--sw-cut", type=float, default=defaults.sw_cut)
+    parser.add_argument("--vsh-cut", type=float, default=defaults.vsh_cut)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true", help="do not write .las_cache sidecars")
+    args = parser.parse_args()
+
+    params = PetroParams(a=args.a, m=args.m, n=args.n, rw=args.rw, phie_cut=args.phie_cut,
+                         sw_cut=args.sw_cut, vsh_cut=args.vsh_cut)
+    n_files, n_ok = run_batch(args.las_dir, args.output, params, args.top, args.base,
+                              workers=args.workers, cache=not args.no_cache)
+    print(f"Evaluated {n_ok}/{n_files} wells -> {args.output}")
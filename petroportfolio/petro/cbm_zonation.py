@@ -0,0 +1,125 @@
+"""
+CBM coal zonation: curve aliasing, coal mask, coal intervals and facies.
+
+Same rules as the notebooks, vectorised over whole logs:
+- coal mask from log cutoffs, evaluated with the notebooks' operator precedence
+  (GR & RHOB & PEF & DPOR) | NPOR;
+- coal intervals by run-length encoding the mask over consecutive samples
+  (np.diff / np.flatnonzero) instead of itertools.groupby over a depth list;
+- facies with np.select, conditions in the same order as classify_lithology.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .las_reader import read_las
+
+
+# standard name -> LAS mnemonic (ALTHORPE 1 naming)
+CURVE_ALIASES = {
+    'GR': 'GRGC',           # Gamma Ray
+    'RHOB': 'DEN',          # Density
+    'PEF': 'PDPE',          # Photoelectric
+    'Caliper': 'CLDC',      # Borehole Diameter
+    'DPOR': 'DPOR',         # Density Porosity
+    'NPOR': 'NPOR',         # Neutron Porosity
+    'RES': 'DDLL',          # Deep Resistivity
+}
+COAL_REQUIRED = ['GR', 'RHOB', 'PEF', 'DPOR', 'NPOR']
+FACIES_COLORS = {
+    'coal': 'black',
+    'shale': 'lightgreen',
+    'limestone': 'skyblue',
+    'siltstone': 'grey',
+    'sandstone': 'orange'
+}
+INTERVAL_COLUMNS = ['Top(ft)', 'Base(ft)', 'Thickness(ft)']
+
+
+#🔤 Curve Aliases
+def standardize_curves(df, aliases=CURVE_ALIASES):
+    """Keep the aliased curves that exist, renamed to standard names; returns (df, missing mnemonics)."""
+    available = [alias for alias in aliases.values() if alias in df.columns]
+    missing = [alias for alias in aliases.values() if alias not in df.columns]
+    df = df[available].rename(columns={v: k for k, v in aliases.items()})
+    return df.dropna(how='all'), missing
+
+
+#🪨 Coal Mask & Intervals
+def coal_mask(df, gr_max=50, rhob_max=1.8, pef_max=1.5, por_min=0.04):
+    """Boolean coal flag per sample; NaN readings never pass a cutoff."""
+    missing = [col for col in COAL_REQUIRED if col not in df.columns]
+    if missing:
+        raise KeyError(f"Missing curves for coal zonation: {missing}")
+    v = {col: df[col].to_numpy(dtype=float) for col in COAL_REQUIRED}
+    return (
+        (v['GR'] < gr_max) &
+        (v['RHOB'] < rhob_max) &
+        (v['PEF'] < pef_max) &
+        (v['DPOR'] > por_min) | (v['NPOR'] > por_min)
+    )
+
+
+def run_bounds(mask):
+    """(starts, stops) sample positions of each run of True in mask, stop exclusive."""
+    padded = np.concatenate(([False], np.asarray(mask, dtype=bool), [False]))
+    edges = np.flatnonzero(np.diff(padded.view(np.int8)))
+    return edges[::2], edges[1::2]
+
+
+def coal_intervals(depth, mask, min_thickness=0.5):
+    """Top/base/thickness of every run of consecutive coal samples thicker than min_thickness."""
+    depth = np.asarray(depth, dtype=float)
+    starts, stops = run_bounds(mask)
+    first, last = depth[starts], depth[stops - 1]
+    top, base = np.minimum(first, last), np.maximum(first, last)     # logs may be recorded bottom-up
+    thickness = base - top
+    keep = thickness > min_thickness
+    return pd.DataFrame({'Top(ft)': top[keep], 'Base(ft)': base[keep], 'Thickness(ft)': thickness[keep]},
+                        columns=INTERVAL_COLUMNS)
+
+
+#🎨 Facies
+def classify_facies(df):
+    """Facies label per sample, first matching rule wins (coal, shale, limestone, siltstone, else sandstone)."""
+    gr = df['GR'].to_numpy(dtype=float)
+    rhob = df['RHOB'].to_numpy(dtype=float)
+    pef = df['PEF'].to_numpy(dtype=float)
+    npor = df['NPOR'].to_numpy(dtype=float)
+    conditions = [
+        (gr < 80) & (rhob < 1.9) & (pef < 2.0),
+        (gr > 90) & (rhob > 2.5),
+        (rhob < 2.4) & (pef > 3.2),
+        (60 < gr) & (gr < 90) & (2.4 <= rhob) & (rhob <= 2.6) & (npor < 0.2),
+    ]
+    return np.select(conditions, ['coal', 'shale', 'limestone', 'siltstone'], default='sandstone')
+
+
+#🗺️ Many Wells
+def zone_well(df, aliases=CURVE_ALIASES, min_thickness=0.5, **cutoffs):
+    """Standardised df with is_coal and Facies columns, plus its coal intervals."""
+    df, _ = standardize_curves(df, aliases)
+    mask = coal_mask(df, **cutoffs)
+    df = df.assign(is_coal=mask.astype(int), Facies=classify_facies(df))
+    return df, coal_intervals(df.index, mask, min_thickness)
+
+
+def zone_wells(wells, aliases=CURVE_ALIASES, min_thickness=0.5, **cutoffs):
+    """
+    Coal intervals for many wells in one table (Well, Top, Base, Thickness).
+    `wells` maps well name -> DataFrame indexed by depth, or -> LAS file path.
+    Wells missing a required curve are skipped and listed in the second return value.
+    """
+    frames, skipped = [], {}
+    for name, source in wells.items():
+        df = read_las(source).df() if isinstance(source, (str, Path)) else source
+        try:
+            _, intervals = zone_well(df, aliases, min_thickness, **cutoffs)
+        except KeyError as exc:
+            skipped[name] = exc.args[0]
+            continue
+        frames.append(intervals.assign(Well=name))
+    table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=INTERVAL_COLUMNS + ['Well'])
+    return table[['Well'] + INTERVAL_COLUMNS], skipped
@@ -0,0 +1,70 @@
+"""
+Depth-indexed log container shared by the petrophysics apps.
+
+Depth is made monotonic once when the container is built (a reversed view for
+logs recorded bottom-up, a sort only if the depths are unordered), after which
+an interval is located with two binary searches and returned as a positional
+slice of the frame: no boolean mask over the whole log and no copy.
+"""
+
+import numpy as np
+
+
+class DepthLog:
+    def __init__(self, df, depth_col=None):
+        depth_col = depth_col or df.columns[0]
+        depth = df[depth_col]
+        if not depth.is_monotonic_increasing:
+            if depth.is_monotonic_decreasing:
+                df = df.iloc[::-1]
+            else:
+                df = df.sort_values(depth_col, kind="stable", na_position="last")
+        self.frame = df.reset_index(drop=True)
+        self.depth_col = depth_col
+        self.depth = self.frame[depth_col].to_numpy()
+        # NaN depths are sorted last, so the valid depths are a prefix
+        self.n_valid = len(self.depth) - int(np.count_nonzero(np.isnan(self.depth)))
+
+    @classmethod
+    def from_las(cls, las, depth_col=None):
+        return cls(las.df().reset_index(), depth_col)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __getitem__(self, column):
+        return self.frame[column]
+
+    @property
+    def columns(self):
+        return self.frame.columns
+
+    @property
+    def min_depth(self):
+        return float(self.depth[0]) if self.n_valid else np.nan
+
+    @property
+    def max_depth(self):
+        return float(self.depth[self.n_valid - 1]) if self.n_valid else np.nan
+
+    def bounds(self, top, base):
+        """Row positions [start, stop) of samples with top <= depth <= base."""
+        valid = self.depth[:self.n_valid]
+        start = int(np.searchsorted(valid, top, side="left"))
+        stop = int(np.searchsorted(valid, base, side="right"))
+        return start, max(start, stop)
+
+    def interval(self, top, base):
+        """Rows with top <= depth <= base as a positional slice (a view, not a copy)."""
+        start, stop = self.bounds(top, base)
+        return self.frame.iloc[start:stop]
+
+    def curve(self, column, top=None, base=None):
+        """One curve as a NumPy view, optionally limited to [top, base]."""
+        values = self.frame[column].to_numpy()
+        if top is None and base is None:
+            return values
+        start, stop = self.bounds(self.min_depth if top is None else top,
+                                  self.max_depth if base is None else base)
+        return values[start:stop]
+
@@ -0,0 +1,164 @@
+"""
+Vectorised petrophysics engine: Vsh, porosity, Archie Sw and pay.
+
+The equations are the ones 3Multi_Track_Param.py used inline:
+
+    VSH  = (GR - GRmin) / (GRmax - GRmin)   GRmin/GRmax from GR clipped to gr_clip
+    PHID = (rho_ma - RHOB) / (rho_ma - rho_fl)
+    PHIE = (PHID + PHIN) / 2
+    SW   = ((a * Rw) / (RT * PHIE^m))^(1/n), clipped to [0, 1]
+    PAY  = PHIE >= phie_cut & SW <= sw_cut & VSH <= vsh_cut
+
+Outputs are preallocated once (float32 by default) and filled chunk by chunk
+with in-place ufuncs, so no full-length temporaries or DataFrames are created
+and memory stays bounded for whole-field runs. Parameters can differ per zone.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+OUTPUT_CURVES = ["VSH", "PHID", "PHIN", "PHIE", "SW"]
+CHUNK_SIZE = 1 << 16
+
+
+class PetroParams(NamedTuple):
+    a: float = 1.0
+    m: float = 2.0
+    n: float = 2.0
+    rw: float = 0.05
+    rho_ma: float = 2.65
+    rho_fl: float = 1.0
+    gr_clip: tuple = (20.0, 150.0)
+    phie_cut: float = 0.1
+    sw_cut: float = 0.6
+    vsh_cut: float = 0.35
+
+
+#🧰 Helpers
+def normalize_nphi(nphi):
+    """NPHI in fraction; returns (nphi, converted) where converted means it was in % (max > 1)."""
+    nphi = np.asarray(nphi)
+    if np.nanmax(nphi, initial=-np.inf) > 1.0:
+        return nphi / 100, True
+    return nphi, False
+
+
+def gr_limits(gr, gr_clip=(20.0, 150.0)):
+    """GRmin / GRmax of the clipped GR (NaN ignored), as the app computed them per interval."""
+    gr = np.asarray(gr)
+    valid = gr[~np.isnan(gr)]
+    if valid.size == 0:
+        return np.nan, np.nan
+    return (float(np.clip(valid.min(), *gr_clip)), float(np.clip(valid.max(), *gr_clip)))
+
+
+def allocate_outputs(n_samples, dtype=np.float32):
+    out = {name: np.empty(n_samples, dtype=dtype) for name in OUTPUT_CURVES}
+    out["PAY"] = np.empty(n_samples, dtype=bool)
+    return out
+
+
+#⚙️ Kernel
+def _kernel(gr, rhob, nphi, rt, p, gr_min, gr_max, vsh, phid, phin, phie, sw, pay):
+    """Fill one chunk of every output in place."""
+    np.subtract(gr, gr_min, out=vsh)
+    np.divide(vsh, gr_max - gr_min, out=vsh)
+    np.subtract(p.rho_ma, rhob, out=phid)
+    np.divide(phid, p.rho_ma - p.rho_fl, out=phid)
+    phin[...] = nphi
+    np.add(phid, phin, out=phie)
+    np.multiply(phie, 0.5, out=phie)
+
+    np.power(phie, p.m, out=sw)
+    np.multiply(sw, rt, out=sw)
+    np.divide(p.a * p.rw, sw, out=sw)
+    np.power(sw, 1 / p.n, out=sw)
+    np.clip(sw, 0, 1, out=sw)
+
+    np.greater_equal(phie, p.phie_cut, out=pay)
+    pay &= sw <= p.sw_cut
+    pay &= vsh <= p.vsh_cut
+
+
+def evaluate(gr, rhob, nphi, rt, params=None, out=None, dtype=np.float32, chunk_size=CHUNK_SIZE,
+             gr_min=None, gr_max=None):
+    """
+    Evaluate one zone. Inputs are 1-D arrays of equal length (NPHI already a fraction).
+    GRmin/GRmax default to the zone's clipped GR limits. `out` (from allocate_outputs)
+    is filled in place if given; returns the dict of output arrays.
+    """
+    p = params or PetroParams()
+    gr, rhob, nphi, rt = (np.asarray(x) for x in (gr, rhob, nphi, rt))
+    n_samples = len(gr)
+    out = out if out is not None else allocate_outputs(n_samples, dtype)
+    if gr_min is None or gr_max is None:
+        gr_min, gr_max = gr_limits(gr, p.gr_clip)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for start in range(0, n_samples, chunk_size):
+            sl = slice(start, start + chunk_size)
+            _kernel(np.asarray(gr[sl], dtype=dtype), np.asarray(rhob[sl], dtype=dtype),
+                    np.asarray(nphi[sl], dtype=dtype), np.asarray(rt[sl], dtype=dtype),
+                    p, gr_min, gr_max, *(out[name][sl] for name in OUTPUT_CURVES), out["PAY"][sl])
+    return out
+
+
+def evaluate_zones(depth, gr, rhob, nphi, rt, zones, default=None, dtype=np.float32,
+                   chunk_size=CHUNK_SIZE):
+    """
+    Evaluate a whole well with per-zone parameters.
+
+    `depth` must be increasing; `zones` is a list of (top, base, PetroParams).
+    Each zone gets its own GR limits, as if it had been selected on its own.
+    Samples outside every zone use `default` (or are left NaN / non-pay if None).
+    """
+    depth = np.asarray(depth)
+    gr, rhob, nphi, rt = (np.asarray(x) for x in (gr, rhob, nphi, rt))
+    out = allocate_outputs(len(depth), dtype)
+    for name in OUTPUT_CURVES:
+        out[name].fill(np.nan)
+    out["PAY"].fill(False)
+
+    covered = []
+    for top, base, params in zones:
+        start = int(np.searchsorted(depth, top, side="left"))
+        stop = int(np.searchsorted(depth, base, side="right"))
+        if stop > start:
+            sl = slice(start, stop)
+            evaluate(gr[sl], rhob[sl], nphi[sl], rt[sl], params, {k: v[sl] for k, v in out.items()},
+                     dtype, chunk_size)
+            covered.append((start, stop))
+
+    if default is not None:
+        edges = [0] + [e for s, e in sorted(covered) for e in (s, e)] + [len(depth)]
+        for start, stop in zip(edges[::2], edges[1::2]):
+            if stop > start:
+                sl = slice(start, stop)
+                evaluate(gr[sl], rhob[sl], nphi[sl], rt[sl], default, {k: v[sl] for k, v in out.items()},
+                         dtype, chunk_size)
+    return out
+
+
+#🧾 Pay Summary
+def pay_summary(depth, result, top=None, base=None):
+    """Gross/net thickness, N/G and average PHIE, SW, VSH for the evaluated samples (same rules as the app)."""
+    depth = np.asarray(depth, dtype=np.float64)
+    valid_depth = depth[~np.isnan(depth)]
+    step = float(np.mean(np.diff(valid_depth))) if len(valid_depth) > 1 else np.nan
+    gross = len(valid_depth) * step
+    net = int(np.count_nonzero(result["PAY"] & ~np.isnan(depth))) * step
+    with np.errstate(invalid="ignore"):
+        averages = {name: float(np.nanmean(result[name], dtype=np.float64)) if np.any(~np.isnan(result[name]))
+                    else np.nan for name in ("PHIE", "SW", "VSH")}
+    return {
+        "Top (m)": float(depth[0]) if top is None and len(depth) else top,
+        "Base (m)": float(depth[-1]) if base is None and len(depth) else base,
+        "Gross Thickness (m)": gross,
+        "Net Thickness (m)": net,
+        "Net/Gross": net / gross if gross > 0 else 0,
+        "Avg φ": averages["PHIE"],
+        "Avg Sw": averages["SW"],
+        "Avg Vsh": averages["VSH"],
+    }
@@ -0,0 +1,371 @@
+"""
+Fast LAS 2.0 reader with a memory-mapped binary sidecar.
+
+The header sections are parsed line by line; the ~ASCII block is handed to the
+pandas C parser in row chunks, with the NULL value mapped to NaN as each chunk
+is parsed. Parsed data is written once to a Fortran-ordered .npy sidecar (one
+contiguous run per curve) plus a JSON header, so later opens of the same file
+memory-map the sidecar instead of parsing text. Sidecars are opened
+copy-on-write: callers may edit the arrays without touching the cache.
+Sidecars of uploaded bytes live in a shared temp directory that is kept to the
+most recently used entries (UPLOAD_CACHE_ENTRIES / UPLOAD_CACHE_BYTES).
+
+The returned LasFile mirrors the parts of lasio the apps use:
+`las.well.WELL.value`, `las.well.get('FLD', 'N/A')`, `las.curves.keys()`,
+`las['GR']` and `las.df()` (indexed by the first curve).
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_DIR_NAME = ".las_cache"
+UPLOAD_CACHE_DIR = Path(tempfile.gettempdir()) / "las_cache"
+UPLOAD_CACHE_ENTRIES = 8            # upload sidecars kept, most recently used first
+UPLOAD_CACHE_BYTES = 4 * 2**30      # and at most this much disk for them
+DEFAULT_NULL = -999.25
+CHUNK_ROWS = 200_000
+SECTION_NAMES = {"V": "version", "W": "well", "C": "curves", "P": "params"}
+# well items lasio always provides (empty when absent), so las.well.WELL never raises
+DEFAULT_WELL_ITEMS = ["STRT", "STOP", "STEP", "NULL", "COMP", "WELL", "FLD", "LOC", "PROV",
+                      "CNTY", "STAT", "CTRY", "SRVC", "DATE", "UWI", "API"]
+
+
+#📋 Header Containers
+class HeaderItem(NamedTuple):
+    mnemonic: str
+    unit: str
+    value: object
+    descr: str
+
+    def __str__(self):
+        return str(self.value)
+
+
+class HeaderSection(dict):
+    """Mnemonic -> HeaderItem, in file order, also reachable as attributes (las.well.WELL)."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class LasFile:
+    def __init__(self, sections, other, data, source=None):
+        for key, name in SECTION_NAMES.items():
+            setattr(self, name, sections.get(key, HeaderSection()))
+        self.other = other
+        self.data = data
+        self.source = source
+
+    def keys(self):
+        return list(self.curves)
+
+    def __getitem__(self, mnemonic):
+        return self.data[:, self.keys().index(mnemonic)]
+
+    @property
+    def index(self):
+        return self.data[:, 0]
+
+    @property
+    def null(self):
+        return _null_value(self.well)
+
+    def df(self):
+        """Curves as a DataFrame indexed by the first curve, sharing memory with `data`."""
+        keys = self.keys()
+        index = pd.Index(self.data[:, 0], name=keys[0])
+        return pd.DataFrame(self.data[:, 1:], index=index, columns=keys[1:], copy=False)
+
+
+#🔍 Header Parsing
+def _convert(value):
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _parse_item(line):
+    """'MNEM.UNIT  VALUE : DESCRIPTION' -> HeaderItem (unit ends at the first space after the dot)."""
+    mnemonic, _, rest = line.partition(".")
+    unit = ""
+    if rest and not rest[0].isspace():
+        unit, _, tail = rest.partition(" ")
+        if ":" in unit:
+            unit, _, head = unit.partition(":")
+            tail = ":" + head + " " + tail
+        rest = tail
+    value, sep, descr = rest.rpartition(":")
+    if not sep:
+        value, descr = rest, ""
+    return HeaderItem(mnemonic.strip(), unit.strip(), _convert(value.strip()), descr.strip())
+
+
+def _read_header(f):
+    """Read sections up to ~A from a binary handle; returns (sections, other, data_offset)."""
+    sections, other, current = {}, [], None
+    for raw in iter(f.readline, b""):
+        line = raw.decode("utf-8", errors="ignore").strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("~"):
+            key = line[1:2].upper()
+            if key == "A":
+                well = sections.setdefault("W", HeaderSection())
+                for mnemonic in DEFAULT_WELL_ITEMS:
+                    well.setdefault(mnemonic, HeaderItem(mnemonic, "", "", ""))
+                return sections, other, f.tell()
+            current = key
+            continue
+        if current == "O":
+            other.append(line)
+        elif current is not None:
+            section = sections.setdefault(current, HeaderSection())
+            item = _parse_item(line)
+            mnemonic, k = item.mnemonic, 1
+            while mnemonic in section:       # duplicate mnemonics become GR:1, GR:2 like lasio
+                mnemonic, k = f"{item.mnemonic}:{k}", k + 1
+            section[mnemonic] = item._replace(mnemonic=mnemonic)
+    raise ValueError("No ~ASCII section found in LAS file")
+
+
+def _null_value(well):
+    item = well.get("NULL")
+    return DEFAULT_NULL if item is None or item.value == "" else float(item.value)
+
+
+def _is_wrapped(sections):
+    item = sections.get("V", {}).get("WRAP")
+    return item is not None and str(item.value).upper().startswith("Y")
+
+
+#⚡ Data Parsing
+def _iter_data_chunks(f, n_curves, null, chunk_rows=CHUNK_ROWS):
+    """Yield float64 (rows, n_curves) blocks of the ~A section with NULL -> NaN."""
+    reader = pd.read_csv(f, sep=r"\s+", header=None, names=range(n_curves), comment="#",
+                         na_values=[null], keep_default_na=False, dtype=np.float64,
+                         engine="c", chunksize=chunk_rows)
+    for chunk in reader:
+        block = chunk.to_numpy(dtype=np.float64)
+        block[block == null] = np.nan      # NULL written with a different number of decimals
+        yield block
+
+
+def _parse_wrapped(f, n_curves, null):
+    values = np.array(f.read().split(), dtype=np.float64)
+    if len(values) % n_curves:
+        raise ValueError("Wrapped ~ASCII data does not divide evenly into the curves")
+    values[values == null] = np.nan
+    return np.asfortranarray(values.reshape(-1, n_curves))
+
+
+def _parse_data(f, sections, sidecar=None):
+    """Parse the ~A block into a Fortran-ordered array, streaming it to `sidecar` (.npy) if given."""
+    n_curves = len(sections.get("C", ()))
+    if n_curves == 0:
+        raise ValueError("LAS file has no curves in the ~Curve section")
+    null = _null_value(sections.get("W", {}))
+
+    if _is_wrapped(sections):
+        data = _parse_wrapped(f, n_curves, null)
+        if sidecar is not None:
+            np.save(sidecar, data)
+        return data
+
+    if sidecar is None:
+        blocks = list(_iter_data_chunks(f, n_curves, null))
+        return np.asfortranarray(np.concatenate(blocks) if blocks else np.empty((0, n_curves)))
+
+    # rows are unknown up front: stream row-major chunks to a scratch file, then transpose blockwise
+    scratch = sidecar.with_suffix(".rows")
+    rows = 0
+    with open(scratch, "wb") as out:
+        for block in _iter_data_chunks(f, n_curves, null):
+            out.write(block.tobytes())
+            rows += len(block)
+    try:
+        data = np.lib.format.open_memmap(sidecar, mode="w+", dtype=np.float64,
+                                         shape=(rows, n_curves), fortran_order=True)
+        if rows:
+            row_major = np.memmap(scratch, dtype=np.float64, mode="r", shape=(rows, n_curves))
+            for start in range(0, rows, CHUNK_ROWS):
+                data[start:start + CHUNK_ROWS] = row_major[start:start + CHUNK_ROWS]
+            del row_major
+        data.flush()
+        del data
+    finally:
+        os.remove(scratch)
+    return np.load(sidecar, mmap_mode="c")
+
+
+#💾 Sidecar Cache
+def _file_sha256(f, block_size=1 << 20):
+    digest = hashlib.sha256()
+    for block in iter(lambda: f.read(block_size), b""):
+        digest.update(block)
+    f.seek(0)
+    return digest.hexdigest()
+
+
+def _sidecar(base, suffix):
+    return base.with_name(base.name + suffix)
+
+
+def _sections_to_json(sections):
+    return {key: [list(item) for item in section.values()] for key, section in sections.items()}
+
+
+def _sections_from_json(raw):
+    return {key: HeaderSection((item[0], HeaderItem(*item)) for item in items)
+            for key, items in raw.items()}
+
+
+def _load_sidecar(base, stamp):
+    try:
+        with open(_sidecar(base, ".json")) as fh:
+            meta = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if meta.get("stamp", {}).get("sha256") != stamp["sha256"]:
+        return None
+    try:
+        data = np.load(_sidecar(base, ".npy"), mmap_mode="c")
+    except (OSError, ValueError):
+        return None
+    if meta["stamp"] != stamp:
+        # same content, new mtime: record it so the next open skips hashing
+        meta["stamp"] = stamp
+        try:
+            with open(_sidecar(base, ".json"), "w") as fh:
+                json.dump(meta, fh)
+        except OSError:
+            pass
+    return LasFile(_sections_from_json(meta["sections"]), meta["other"], data)
+
+
+def _write_sidecar(f, base, stamp):
+    base.parent.mkdir(parents=True, exist_ok=True)
+    tmp = base.with_name(base.name + f".tmp{os.getpid()}")
+    sections, other, offset = _read_header(f)
+    f.seek(offset)
+    try:
+        data = _parse_data(f, sections, sidecar=_sidecar(tmp, ".npy"))
+        del data
+        with open(_sidecar(tmp, ".json"), "w") as fh:
+            json.dump({"stamp": stamp, "sections": _sections_to_json(sections), "other": other}, fh)
+        os.replace(_sidecar(tmp, ".npy"), _sidecar(base, ".npy"))
+        os.replace(_sidecar(tmp, ".json"), _sidecar(base, ".json"))
+    finally:
+        for suffix in (".npy", ".json", ".rows"):
+            if _sidecar(tmp, suffix).exists():
+                os.remove(_sidecar(tmp, suffix))
+    return _load_sidecar(base, stamp)
+
+
+def _evict_uploads(cache_dir, keep, max_entries=UPLOAD_CACHE_ENTRIES, max_bytes=UPLOAD_CACHE_BYTES):
+    """Delete upload sidecars beyond the newest max_entries / max_bytes (by last use); `keep` always stays."""
+    entries = []
+    for meta in Path(cache_dir).glob("*.json"):
+        base = meta.with_suffix("")
+        if ".tmp" in base.name:     # another session still writing its sidecar
+            continue
+        try:
+            size = meta.stat().st_size + _sidecar(base, ".npy").stat().st_size
+            entries.append((meta.stat().st_mtime_ns, base, size))
+        except OSError:             # half-written or already evicted by another session
+            continue
+    entries.sort(key=lambda e: (e[1] != keep, -e[0]))
+    n_kept = total = 0
+    for _, base, size in entries:
+        if base == keep or (n_kept < max_entries and total + size <= max_bytes):
+            n_kept += 1
+            total += size
+            continue
+        for suffix in (".json", ".npy"):
+            try:
+                os.remove(_sidecar(base, suffix))
+            except OSError:         # open elsewhere (Windows) or gone: retried on the next upload
+                pass
+
+
+def _stamp_for_path(path, base):
+    """Reuse the cached stamp while size/mtime match; otherwise identify the file by content."""
+    stat = os.stat(path)
+    quick = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    try:
+        with open(_sidecar(base, ".json")) as fh:
+            cached = json.load(fh)["stamp"]
+        if {k: cached[k] for k in quick} == quick:
+            return cached
+    except (OSError, ValueError, KeyError):
+        pass
+    with open(path, "rb") as f:
+        return {**quick, "sha256": _file_sha256(f)}
+
+
+#📥 Public Entry Point
+def read_las(source, cache=True, cache_dir=None):
+    """
+    Read a LAS 1.2/2.0 file from a path, bytes or binary file-like (e.g. a Streamlit upload).
+
+    With cache=True the parsed curves are kept in a sidecar: next to the file in
+    `.las_cache/` for paths, or keyed by content hash in the temp dir for bytes
+    (only the most recently used upload sidecars are kept).
+    Falls back to an in-memory parse if the cache location is not writable.
+    """
+    if hasattr(source, "getvalue"):
+        source = source.getvalue()
+    elif hasattr(source, "read"):
+        source = source.read()
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        f = io.BytesIO(source)
+        if not cache:
+            return _read_uncached(f)
+        digest = hashlib.sha256(source).hexdigest()
+        base = Path(cache_dir or UPLOAD_CACHE_DIR) / digest
+        stamp = {"sha256": digest}
+        las = _read_cached(f, base, stamp)
+        try:
+            os.utime(_sidecar(base, ".json"))       # mark as recently used for eviction
+        except OSError:
+            return las                              # not cached (unwritable directory)
+        _evict_uploads(base.parent, base)
+        return las
+
+    path = Path(source)
+    with open(path, "rb") as f:
+        if not cache:
+            return _read_uncached(f, path)
+        base = Path(cache_dir or path.parent / CACHE_DIR_NAME) / path.name
+        return _read_cached(f, base, _stamp_for_path(path, base), path)
+
+
+def _read_uncached(f, path=None):
+    sections, other, offset = _read_header(f)
+    f.seek(offset)
+    return LasFile(sections, other, _parse_data(f, sections), path)
+
+
+def _read_cached(f, base, stamp, path=None):
+    las = _load_sidecar(base, stamp)
+    if las is None:
+        try:
+            las = _write_sidecar(f, base, stamp)
+        except OSError:
+            f.seek(0)
+            return _read_uncached(f, path)
+    las.source = path
+    return las
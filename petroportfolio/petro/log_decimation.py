@@ -0,0 +1,65 @@
+"""
+Level-of-detail decimation for log tracks.
+
+A track can only show about one sample per pixel row, so samples are grouped
+into one bin per pixel and only the first, last, min and max sample of every
+curve in each bin are kept. Curve shapes (spikes included) survive, and all
+curves and shading masks share the same kept samples so they stay aligned.
+For masks, both samples either side of every True/False change are kept, so
+fill_betweenx shading starts and stops at the same depths as at full
+resolution; NaN gaps in the curves are kept the same way.
+
+Only the plot is decimated: exports keep using the full-resolution interval.
+"""
+
+import numpy as np
+
+
+def pixel_height(fig):
+    """Height of the figure in screen pixels (one decimation bin per pixel row)."""
+    return int(round(fig.get_figheight() * fig.dpi))
+
+
+def _bin_extrema(values, bin_size):
+    """Positions of the min and max of each bin of `bin_size` samples (NaN ignored)."""
+    n = len(values)
+    n_bins = -(-n // bin_size)
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[:n] = values
+    blocks = padded.reshape(n_bins, bin_size)
+    offsets = np.arange(n_bins) * bin_size
+    lo = np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1) + offsets
+    hi = np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1) + offsets
+    return np.minimum(lo, n - 1), np.minimum(hi, n - 1)
+
+
+def _edges(mask):
+    """Positions on both sides of every change in a boolean mask."""
+    change = np.flatnonzero(mask[1:] != mask[:-1])
+    return np.concatenate([change, change + 1])
+
+
+def lod_indices(n_samples, curves=(), masks=(), pixels=1000):
+    """
+    Sorted sample positions to plot: per-pixel first/last/min/max of every
+    curve plus the edges of every mask and NaN gap. All positions if the
+    interval already fits the pixel budget.
+    """
+    if n_samples <= 4 * pixels:
+        return np.arange(n_samples)
+    bin_size = -(-n_samples // pixels)
+    starts = np.arange(0, n_samples, bin_size)
+    keep = [starts, np.minimum(starts + bin_size - 1, n_samples - 1)]
+    for values in curves:
+        values = np.asarray(values, dtype=float)
+        keep.extend(_bin_extrema(values, bin_size))
+        keep.append(_edges(np.isnan(values)))
+    for mask in masks:
+        keep.append(_edges(np.asarray(mask, dtype=bool)))
+    return np.unique(np.concatenate(keep))
+
+
+def decimate_frame(df, curves, masks=(), pixels=1000):
+    """Rows of df to plot for the given curve columns and boolean masks (full-length arrays)."""
+    idx = lod_indices(len(df), [df[c].to_numpy(dtype=float, na_value=np.nan) for c in curves], masks, pixels)
+    return df.iloc[idx]
@@ -0,0 +1,83 @@
+"""
+Chunked, on-demand export of log intervals.
+
+`to_csv()` on a whole composite log builds one giant string and then a bytes
+copy of it. Here the interval is written a block of rows at a time into a
+spooled temp file (kept in memory while small, moved to disk past
+SPOOL_BYTES), as CSV or as Parquet row groups, and read back once as bytes.
+`lazy_export` wraps this in a zero-argument callable so
+`st.download_button(data=...)` only runs it when the button is clicked, not on
+every rerun.
+"""
+
+import importlib.util
+import tempfile
+
+
+CHUNK_ROWS = 100_000
+SPOOL_BYTES = 32 * 1024 * 1024
+
+EXPORT_FORMATS = {
+    "CSV": ("text/csv", ".csv"),
+    "Parquet": ("application/vnd.apache.parquet", ".parquet"),
+}
+
+
+def available_formats():
+    """Export formats usable here (Parquet needs pyarrow)."""
+    if importlib.util.find_spec("pyarrow") is None:
+        return ["CSV"]
+    return list(EXPORT_FORMATS)
+
+
+#📝 Writers
+def iter_csv_chunks(df, chunk_rows=CHUNK_ROWS):
+    """CSV bytes for df, header first, one block of rows at a time."""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=(start == 0)).encode("utf-8")
+
+
+def write_csv(df, f, chunk_rows=CHUNK_ROWS):
+    for block in iter_csv_chunks(df, chunk_rows):
+        f.write(block)
+
+
+def write_parquet(df, f, chunk_rows=CHUNK_ROWS):
+    """One Parquet row group per block of rows."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(f, schema) as writer:
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+#📤 Export
+def export_file(df, fmt="CSV", chunk_rows=CHUNK_ROWS):
+    """Write df in `fmt` to a rewound spooled temp file."""
+    f = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    if fmt == "Parquet":
+        write_parquet(df, f, chunk_rows)
+    elif fmt == "CSV":
+        write_csv(df, f, chunk_rows)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    f.seek(0)
+    return f
+
+
+def export_bytes(df, fmt="CSV", chunk_rows=CHUNK_ROWS):
+    with export_file(df, fmt, chunk_rows) as f:
+        return f.read()
+
+
+def lazy_export(df, fmt="CSV", chunk_rows=CHUNK_ROWS):
+    """Zero-argument callable for st.download_button: the file is only built when clicked."""
+    return lambda: export_bytes(df, fmt, chunk_rows)
+
+
+def export_name(stem, fmt="CSV"):
+    return stem + EXPORT_FORMATS[fmt][1]
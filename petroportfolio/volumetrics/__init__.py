@@ -0,0 +1,18 @@
+"""Volumetric gas reservoirs: DAK Z-factor, gas FVF and Monte Carlo OGIP."""
+
+from .._lazy import lazy_exports
+
+
+_EXPORTS = {
+    "z_dak": "z_factor",
+    "gas_fvf": "z_factor",
+    "pseudo_critical": "z_factor",
+    "dak_limits": "z_factor",
+    "ogip": "gas_volumetrics",
+    "run_monte_carlo": "gas_volumetrics",
+    "ogip_summary": "gas_volumetrics",
+    "clip_to_dak": "gas_volumetrics",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,138 @@
+"""
+Volumetric OGIP, deterministic and Monte Carlo.
+
+    OGIP (scf) = 43560 A h φ (1 - Sw) / Bg        A acres, h ft, Bg ft³/scf
+    Bg         = 0.02827 Z T / P                  Z from z_factor.z_dak
+
+Every input may be an array, so sensitivity grids are one call. The Monte
+Carlo mode samples area, net pay, porosity, Sw, pressure and temperature with
+the same distribution specs as the DCA Monte Carlo, a chunk of realizations at
+a time: sampling, the Z solve and OGIP only ever hold `chunk_size` draws, and
+just the OGIP of each realization is kept for the percentiles. Pressure and
+temperature draws are clipped to the range DAK covers for the gas, and the
+clipped / unconverged draws are counted. Reserves convention: P90 is the low
+case (90 % probability of being exceeded).
+
+    python -m petroportfolio.volumetrics.gas_volumetrics --area 800 1200 1800 --h 40 60 90 --phi 0.12 0.18 0.24 --sw 0.2 0.3 0.45 --n 1000000
+"""
+
+import argparse
+from typing import NamedTuple
+
+import numpy as np
+
+from ..dca.probabilistic import PERCENTILES, sample_distribution
+from .z_factor import dak_limits, gas_fvf, z_dak
+
+
+CHUNK_SIZE = 1 << 18
+ACRE_FT3 = 43560
+INPUTS = ["area", "h", "phi", "sw", "p", "t"]
+UNITS = {"area": "acres", "h": "ft", "phi": "fraction", "sw": "fraction", "p": "psia", "t": "°F"}
+
+
+class DakChecks(NamedTuple):
+    clipped_p: int          # pressure draws moved into the DAK Ppr range
+    clipped_t: int          # temperature draws moved into the DAK Tpr range
+    not_converged: int      # realizations whose Z solve did not converge
+
+
+#🧮 Deterministic
+def _ogip(area, h, phi, sw, p, t, z):
+    bg = gas_fvf(p, t, z)
+    return ACRE_FT3 * np.asarray(area) * np.asarray(h) * np.asarray(phi) * (1 - np.asarray(sw)) / bg, bg
+
+
+def ogip(area, h, phi, sw, p, t, gas_sg=0.65, co2=0.0, h2s=0.0):
+    """OGIP in scf; all inputs broadcast. Returns (ogip, z, bg); z_dak warns outside the DAK range."""
+    z = z_dak(p, t, gas_sg, co2, h2s)
+    g, bg = _ogip(area, h, phi, sw, p, t, z)
+    return g, z, bg
+
+
+#🎲 Monte Carlo
+def sample_inputs(rng, specs, n):
+    """Draw n values of every input from its (dist, params) spec, clipped to physical ranges."""
+    draws = {name: sample_distribution(rng, *specs[name], n) for name in INPUTS}
+    draws["area"] = np.maximum(draws["area"], 0.0)
+    draws["h"] = np.maximum(draws["h"], 0.0)
+    draws["phi"] = np.clip(draws["phi"], 0.0, 1.0)
+    draws["sw"] = np.clip(draws["sw"], 0.0, 1.0)
+    draws["p"] = np.maximum(draws["p"], 14.7)
+    return draws
+
+
+def clip_to_dak(draws, gas_sg=0.65, co2=0.0, h2s=0.0):
+    """Clip draws["p"] / draws["t"] in place to the DAK range of the gas; returns (n_p, n_t) clipped."""
+    limits = dak_limits(gas_sg, co2, h2s)
+    counts = []
+    for name in ("p", "t"):
+        lo, hi = limits[name]
+        values = draws[name]
+        counts.append(int(np.count_nonzero((values < lo) | (values > hi))))
+        draws[name] = np.clip(values, lo, hi)
+    return tuple(counts)
+
+
+def run_monte_carlo(specs, n=1_000_000, gas_sg=0.65, co2=0.0, h2s=0.0, seed=None, chunk_size=CHUNK_SIZE,
+                    full_output=False):
+    """
+    OGIP (scf) of n realizations. `specs` maps every name in INPUTS to a
+    (dist, params) spec as in dca.probabilistic.sample_distribution.
+    With full_output=True returns (ogip, DakChecks).
+    """
+    missing = [name for name in INPUTS if name not in specs]
+    if missing:
+        raise KeyError(f"Missing distribution specs: {missing}")
+    rng = np.random.default_rng(seed)
+    out = np.empty(n)
+    clipped_p = clipped_t = not_converged = 0
+    for start in range(0, n, chunk_size):
+        m = min(chunk_size, n - start)
+        draws = sample_inputs(rng, specs, m)
+        n_p, n_t = clip_to_dak(draws, gas_sg, co2, h2s)
+        z, converged, _ = z_dak(draws["p"], draws["t"], gas_sg, co2, h2s, full_output=True)
+        out[start:start + m], _ = _ogip(z=z, **draws)
+        clipped_p += n_p
+        clipped_t += n_t
+        not_converged += int(m - np.count_nonzero(converged))
+    checks = DakChecks(clipped_p, clipped_t, not_converged)
+    return (out, checks) if full_output else out
+
+
+def ogip_summary(values):
+    """P90/P50/P10 OGIP plus the mean, in the units of `values`."""
+    summary = {name: float(np.percentile(values, p)) for name, p in PERCENTILES.items()}
+    summary["Mean"] = float(values.mean())
+    return summary
+
+
+#🧪 Command Line Entry
+def _spec(values):
+    """1 value -> Fixed, 2 -> Uniform (low, high), 3 -> Triangular (low, mode, high)."""
+    return {1: "Fixed", 2: "Uniform", 3: "Triangular"}[len(values)], tuple(values)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Volumetric OGIP with DAK Z-factor, optionally Monte Carlo.")
+    for name, default in zip(INPUTS, ([1200], [60], [0.18], [0.3], [3500], [200])):
+        parser.add_argument(f"--{name}", type=float, nargs="+", default=default,
+                            help=f"{UNITS[name]}: 1 value = fixed, 2 = uniform, 3 = triangular")
+    parser.add_argument("--gas-sg", type=float, default=0.65)
+    parser.add_argument("--co2", type=float, default=0.0, help="mole fraction")
+    parser.add_argument("--h2s", type=float, default=0.0, help="mole fraction")
+    parser.add_argument("--n", type=int, default=1_000_000, help="Monte Carlo realizations")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    specs = {name: _spec(getattr(args, name)) for name in INPUTS}
+    if all(dist == "Fixed" for dist, _ in specs.values()):
+        g, z, bg = ogip(*(params[0] for _, params in specs.values()), args.gas_sg, args.co2, args.h2s)
+        print(f"Z = {float(z):.4f}, Bg = {float(bg):.6f} ft3/scf, OGIP = {float(g) / 1e9:.2f} Bcf")
+    else:
+        values, checks = run_monte_carlo(specs, args.n, args.gas_sg, args.co2, args.h2s, args.seed, full_output=True)
+        for name, value in ogip_summary(values / 1e9).items():
+            print(f"{name}: {value:.2f} Bcf")
+        if any(checks):
+            print(f"DAK range: {checks.clipped_p} pressure / {checks.clipped_t} temperature draws clipped, "
+                  f"{checks.not_converged} Z solves not converged")
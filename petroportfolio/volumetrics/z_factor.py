@@ -0,0 +1,112 @@
+"""
+Gas deviation factor (Z) from correlations instead of the Standing-Katz chart.
+
+Pseudo-critical properties come from gas gravity (Sutton), corrected for CO₂
+and H₂S with Wichert-Aziz. Z is the Dranchuk-Abou-Kassem (DAK) fit of the
+Standing-Katz chart: the reduced density ρr solving
+
+    z(ρr) = 0.27 Ppr / (ρr Tpr)
+
+is found by Newton iteration on whole arrays at once, so every pressure /
+temperature pair (a sensitivity grid or a million Monte Carlo draws) converges
+together; converged entries are frozen while the rest keep iterating.
+DAK is valid for 0.2 <= Ppr <= 30 and 1.0 < Tpr <= 3.0. z_dak warns when
+inputs fall outside that range or Newton does not converge; with
+full_output=True it returns per-entry flags instead.
+"""
+
+import warnings
+from typing import NamedTuple
+
+import numpy as np
+
+
+# DAK coefficients A1..A11
+A = (0.3265, -1.0700, -0.5339, 0.01569, -0.05165, 0.5475, -0.7361, 0.1844, 0.1056, 0.6134, 0.7210)
+PPR_RANGE = (0.2, 30.0)
+TPR_RANGE = (1.0, 3.0)
+
+
+class ZResult(NamedTuple):
+    z: np.ndarray
+    converged: np.ndarray   # Newton met `tol` within max_iter
+    in_range: np.ndarray    # Ppr / Tpr inside the DAK range
+
+
+def pseudo_critical(gas_sg, co2=0.0, h2s=0.0):
+    """(Ppc psia, Tpc °R) from gas gravity (Sutton), Wichert-Aziz corrected for CO₂ / H₂S mole fractions."""
+    gas_sg = np.asarray(gas_sg, dtype=float)
+    ppc = 756.8 - 131.0 * gas_sg - 3.6 * gas_sg**2
+    tpc = 169.2 + 349.5 * gas_sg - 74.0 * gas_sg**2
+    a = np.asarray(co2, dtype=float) + np.asarray(h2s, dtype=float)
+    b = np.asarray(h2s, dtype=float)
+    eps = 120 * (a**0.9 - a**1.6) + 15 * (b**0.5 - b**4)
+    tpc_corr = tpc - eps
+    ppc_corr = ppc * tpc_corr / (tpc + b * (1 - b) * eps)
+    return ppc_corr, tpc_corr
+
+
+def dak_limits(gas_sg=0.65, co2=0.0, h2s=0.0):
+    """{"p": (low, high) psia, "t": (low, high) °F} covered by DAK for this gas."""
+    ppc, tpc = pseudo_critical(gas_sg, co2, h2s)
+    return {"p": (PPR_RANGE[0] * ppc, PPR_RANGE[1] * ppc),
+            "t": (TPR_RANGE[0] * tpc - 459.67, TPR_RANGE[1] * tpc - 459.67)}
+
+
+def _dak(rho, tpr):
+    """z and dz/dρr of the DAK equation at reduced density rho."""
+    a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11 = A
+    c1 = a1 + a2 / tpr + a3 / tpr**3 + a4 / tpr**4 + a5 / tpr**5
+    c2 = a6 + a7 / tpr + a8 / tpr**2
+    c3 = a9 * (a7 / tpr + a8 / tpr**2)
+    rho2 = rho * rho
+    e = np.exp(-a11 * rho2)
+    z = 1 + c1 * rho + c2 * rho2 - c3 * rho2**2 * rho + a10 * (1 + a11 * rho2) * rho2 / tpr**3 * e
+    dz = c1 + 2 * c2 * rho - 5 * c3 * rho2**2 + 2 * a10 * rho / tpr**3 * (1 + a11 * rho2 - a11**2 * rho2**2) * e
+    return z, dz
+
+
+def z_dak(p, t, gas_sg=0.65, co2=0.0, h2s=0.0, tol=1e-10, max_iter=50, full_output=False):
+    """
+    Z at pressure p (psia) and temperature t (°F); inputs broadcast against each other.
+    Returns a ZResult (z, converged, in_range) with full_output=True, else z alone
+    and a RuntimeWarning counting out-of-range or unconverged entries.
+    """
+    ppc, tpc = pseudo_critical(gas_sg, co2, h2s)
+    p, t, ppc, tpc = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (p, t, ppc, tpc)))
+    shape = p.shape
+    ppr = (p / ppc).ravel()
+    tpr = ((t + 459.67) / tpc).ravel()
+
+    rho = 0.27 * ppr / tpr              # ideal-gas start (z = 1)
+    active = np.ones(rho.shape, dtype=bool)
+    for _ in range(max_iter):
+        r, pr, tr = rho[active], ppr[active], tpr[active]
+        z, dz = _dak(r, tr)
+        f = z - 0.27 * pr / (r * tr)
+        df = dz + 0.27 * pr / (r * r * tr)
+        step = f / df
+        r_new = r - step
+        r_new = np.where(r_new > 0, r_new, 0.5 * r)     # keep the density positive
+        rho[active] = r_new
+        done = np.abs(step) <= tol * np.maximum(r_new, 1.0)
+        idx = np.flatnonzero(active)
+        active[idx[done]] = False
+        if not active.any():
+            break
+    z = (0.27 * ppr / (rho * tpr)).reshape(shape)
+    converged = ~active.reshape(shape)
+    in_range = ((ppr >= PPR_RANGE[0]) & (ppr <= PPR_RANGE[1])
+                & (tpr >= TPR_RANGE[0]) & (tpr <= TPR_RANGE[1])).reshape(shape)
+    if full_output:
+        return ZResult(z, converged, in_range)
+    n_out, n_bad = int((~in_range).sum()), int((~converged).sum())
+    if n_out or n_bad:
+        warnings.warn(f"z_dak: {n_out} of {z.size} points outside the DAK range "
+                      f"(Ppr {PPR_RANGE}, Tpr {TPR_RANGE}), {n_bad} not converged", RuntimeWarning, stacklevel=2)
+    return z
+
+
+def gas_fvf(p, t, z):
+    """Bg in reservoir ft³/scf at p (psia), t (°F): 0.02827 z T / p."""
+    return 0.02827 * np.asarray(z) * (np.asarray(t) + 459.67) / np.asarray(p)